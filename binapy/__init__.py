@@ -1,23 +1,72 @@
 """Top-level package for BinaPy."""
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from .binapy import (
     BinaPy,
+    BinaPyView,
+    BlockCodec,
     InvalidExtensionMethodError,
+    Pipeline,
+    StreamCodec,
     binapy_checker,
     binapy_decoder,
     binapy_encoder,
     binapy_parser,
     binapy_serializer,
+    binapy_stream_decoder,
+    binapy_stream_encoder,
 )
+from .cache import Cache, CacheStats
+from .charclass import CharClass
+from .detection import Candidate
+from .instrumentation import ExtensionCall, ExtensionMetrics, Metrics
+from .tracing import Tracer
 
 __all__ = [
     "BinaPy",
+    "BinaPyView",
     "binapy_checker",
     "binapy_decoder",
     "binapy_encoder",
     "binapy_parser",
     "binapy_serializer",
+    "binapy_stream_decoder",
+    "binapy_stream_encoder",
+    "BlockCodec",
+    "Cache",
+    "CacheStats",
+    "Candidate",
+    "CharClass",
+    "ExtensionCall",
+    "ExtensionMetrics",
     "InvalidExtensionMethodError",
+    "Metrics",
+    "Pipeline",
+    "StreamCodec",
+    "Tracer",
 ]
 
-from . import compression, encoding, hashing, parsing  # noqa: F401
+
+def __getattr__(name: str) -> Any:
+    """Import the extension subpackages on first access.
+
+    Extensions are loaded lazily by `BinaPy`, so those subpackages are not imported with `binapy`.
+
+    Args:
+        name: the attribute name
+
+    Returns:
+        the subpackage
+
+    Raises:
+        AttributeError: if `name` is not an extension subpackage
+
+    """
+    if name in ("compression", "encoding", "hashing", "parsing"):
+        return importlib.import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,529 @@
+"""Benchmark suite for BinaPy extensions.
+
+This times every registered encoder, decoder, checker, parser and serializer over a range of payload sizes, and
+reports throughput, per-call overhead versus the equivalent raw library call (when there is one), and peak memory.
+Results can be saved as JSON, then compared against a saved baseline to detect performance regressions.
+
+Run with `python -m binapy.bench --help` for usage.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.parse
+import zlib
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from binapy import BinaPy
+from binapy.cli import parse_size
+from binapy.parsing.json import get_json_backend
+
+DEFAULT_SIZES = (16, 1 << 10, 64 << 10, 1 << 20, 16 << 20, 64 << 20)
+"""Default payload sizes, from 16 B to 64 MB."""
+
+FEATURES = ("encode", "decode", "check", "parse", "serialize")
+"""Features that are benchmarked."""
+
+EXTENSION_ARGS: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {
+    "caesar": ((3,), {}),
+    "vigenere": (("binapy",), {}),
+    "xor": ((b"key",), {}),
+    "shake128": ((32,), {}),
+    "shake256": ((64,), {}),
+    "sshake128": ((32,), {"salt": b"salt"}),
+    "sshake256": ((64,), {"salt": b"salt"}),
+    **{name: ((), {"salt": b"salt"}) for name in ("ssha1", "ssha256", "ssha384", "ssha512")},
+}
+"""Parameters to pass to extensions that require some, by extension name."""
+
+
+def _deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _digest(name: str) -> Callable[[bytes], bytes]:
+    func = getattr(hashlib, name)
+    return lambda data: func(data).digest()
+
+
+RAW_CALLS: dict[tuple[str, str], Callable[[Any], Any]] = {
+    ("b64", "encode"): base64.b64encode,
+    ("b64", "decode"): base64.b64decode,
+    ("b64u", "encode"): lambda data: base64.urlsafe_b64encode(data).rstrip(b"="),
+    ("b64u", "decode"): lambda data: base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4)),
+    ("b32", "encode"): base64.b32encode,
+    ("b32", "decode"): base64.b32decode,
+    ("hex", "encode"): binascii.hexlify,
+    ("hex", "decode"): binascii.unhexlify,
+    ("url", "encode"): lambda data: urllib.parse.quote_plus(data, safe="/").encode(),
+    ("url", "decode"): lambda data: urllib.parse.unquote_plus(data.decode(), errors="replace").encode(),
+    ("zlib", "encode"): lambda data: zlib.compress(data, 6),
+    ("zlib", "decode"): zlib.decompress,
+    ("deflate", "encode"): _deflate,
+    ("deflate", "decode"): lambda data: zlib.decompress(data, -zlib.MAX_WBITS),
+    **{(name, "encode"): _digest(name) for name in ("sha1", "sha256", "sha384", "sha512")},
+    ("json", "parse"): json.loads,
+    ("json", "serialize"): lambda data: json.dumps(data, separators=(",", ":")).encode(),
+    ("pickle", "parse"): pickle.loads,
+    ("pickle", "serialize"): pickle.dumps,
+}
+"""Equivalent stdlib calls, used to measure the per-call overhead of BinaPy, by (extension name, feature).
+
+For JSON, the library selected by `binapy.parsing.json.get_json_backend()` is used instead when it is not the stdlib,
+see `_json_raw_calls()`."""
+
+
+def _json_raw_calls() -> dict[tuple[str, str], Callable[[Any], Any]]:
+    """Return the raw calls to the JSON library that BinaPy uses, if it is faster than the stdlib.
+
+    Returns:
+        the raw JSON calls that replace the ones from `RAW_CALLS`, by (extension name, feature)
+
+    """
+    backend = get_json_backend()
+    calls: dict[tuple[str, str], Callable[[Any], Any]] = {}
+    if backend.name != "json":
+        calls["json", "parse"] = backend.loads
+    if backend.name == "orjson":
+        calls["json", "serialize"] = backend.module.dumps
+    return calls
+
+
+def _consume(result: Any) -> Any:
+    """Exhaust the iterators returned by some parsers, like "jsonl", so that the parsing work is actually done.
+
+    Args:
+        result: the result of a call
+
+    Returns:
+        the result
+
+    """
+    if isinstance(result, Iterator):
+        deque(result, maxlen=0)
+    return result
+
+
+def make_payload(size: int, kind: str = "random") -> bytes:
+    """Generate a binary payload.
+
+    Args:
+        size: the payload size
+        kind: "random" for random bytes, or "text" for compressible ASCII text
+
+    Returns:
+        the payload
+
+    """
+    if kind == "text":
+        words = b"lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+        return (words * (size // len(words) + 1))[:size]
+    return bytes(BinaPy.random(size))
+
+
+def make_document(size: int) -> list[dict[str, Any]]:
+    """Generate a document that serializes to roughly `size` bytes of compact JSON.
+
+    Args:
+        size: the approximate serialized size
+
+    Returns:
+        a list of small dicts
+
+    """
+    return [{"id": i, "name": f"item{i}", "value": i / 2} for i in range(max(1, size // 45))]
+
+
+def _time_per_call(func: Callable[[], Any], min_time: float) -> tuple[float, int]:
+    """Time a function, calling it as many times as needed to run for at least `min_time` seconds.
+
+    Args:
+        func: the function to time
+        min_time: the minimum total duration, in seconds
+
+    Returns:
+        a tuple of (seconds per call, number of calls)
+
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / number, number
+        number *= 10 if elapsed < min_time / 10 else 2
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    """Measure the peak memory allocated by a single call to a function.
+
+    Args:
+        func: the function to measure
+
+    Returns:
+        the peak allocated memory, in bytes
+
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def _prepare(name: str, feature: str, size: int, payload: bytes) -> tuple[Callable[[], Any], Any, int] | None:
+    """Prepare a benchmark case.
+
+    Args:
+        name: the extension name
+        feature: the feature to benchmark
+        size: the payload size
+        payload: a binary payload of that size
+
+    Returns:
+        a tuple of (function to time, raw input, input size), or `None` if this case does not apply
+
+    """
+    methods = BinaPy._get_extension_methods(name)  # noqa: SLF001
+    if feature not in methods:
+        return None
+    args, kwargs = EXTENSION_ARGS.get(name, ((), {}))
+    if feature in ("parse", "serialize"):
+        if "serialize" not in methods:
+            return None
+        document = make_document(size)
+        if feature == "serialize":
+            return lambda: BinaPy.serialize_to(name, document, *args, **kwargs), document, size
+        serialized = BinaPy.serialize_to(name, document, *args, **kwargs)
+        return lambda: _consume(serialized.parse_from(name, *args, **kwargs)), serialized, len(serialized)
+
+    bp = BinaPy(payload)
+    if feature in ("decode", "check") and "encode" in methods:
+        bp = bp.encode_to(name, *args, **kwargs)
+    if feature == "check":
+        return partial(bp.check, name), bp, len(bp)
+    method = bp.encode_to if feature == "encode" else bp.decode_from
+    return partial(method, name, *args, **kwargs), bp, len(bp)
+
+
+def run(  # noqa: PLR0913
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    extensions: Iterable[str] | None = None,
+    features: Iterable[str] = FEATURES,
+    *,
+    payload: str = "random",
+    min_time: float = 0.1,
+    memory: bool = True,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmarks.
+
+    Args:
+        sizes: the payload sizes, in bytes
+        extensions: the extension names to benchmark. Defaults to all available extensions.
+        features: the features to benchmark
+        payload: "random" for random bytes, or "text" for compressible ASCII text
+        min_time: minimum duration of each measurement, in seconds
+        memory: if `True`, measure the peak memory of each case
+        progress: a callable that is called with each result, as soon as it is available
+
+    Returns:
+        a JSON-serializable report, with environment information and a list of results
+
+    """
+    if extensions is None:
+        BinaPy.load_extensions()
+        extensions = sorted(BinaPy.extensions)
+    results = []
+    for size in sizes:
+        data = make_payload(size, payload)
+        for name in extensions:
+            for feature in features:
+                try:
+                    case = _prepare(name, feature, size, data)
+                except Exception as exc:  # noqa: BLE001
+                    result: dict[str, Any] = {"extension": name, "feature": feature, "size": size, "error": repr(exc)}
+                else:
+                    if case is None:
+                        continue
+                    result = _measure(name, feature, size, *case, min_time=min_time, memory=memory)
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "payload": payload,
+        "json_backend": get_json_backend().name,
+        "results": results,
+    }
+
+
+def _measure(  # noqa: PLR0913
+    name: str,
+    feature: str,
+    size: int,
+    func: Callable[[], Any],
+    raw_input: Any,
+    input_size: int,
+    *,
+    min_time: float,
+    memory: bool,
+) -> dict[str, Any]:
+    """Measure a single benchmark case.
+
+    Args:
+        name: the extension name
+        feature: the benchmarked feature
+        size: the payload size
+        func: the function to time
+        raw_input: the input data, to pass to the equivalent raw call
+        input_size: the input size
+        min_time: minimum duration of each measurement, in seconds
+        memory: if `True`, measure the peak memory
+
+    Returns:
+        the result, as a dict
+
+    """
+    result: dict[str, Any] = {"extension": name, "feature": feature, "size": size, "input_size": input_size}
+    try:
+        seconds, calls = _time_per_call(func, min_time)
+    except Exception as exc:  # noqa: BLE001
+        result["error"] = repr(exc)
+        return result
+    result.update(calls=calls, seconds_per_call=seconds, throughput=input_size / seconds if seconds else None)
+    raw = _json_raw_calls().get((name, feature)) or RAW_CALLS.get((name, feature))
+    if raw is not None:
+        if isinstance(raw_input, BinaPy):
+            raw_input = bytes(raw_input)
+        raw_seconds, _ = _time_per_call(lambda: raw(raw_input), min_time)
+        result.update(raw_seconds_per_call=raw_seconds, overhead=seconds - raw_seconds)
+    if memory:
+        result["peak_memory"] = _peak_memory(func)
+    return result
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1) -> list[dict[str, Any]]:
+    """Compare a benchmark report against a baseline.
+
+    Args:
+        report: the current report, as returned by `run()`
+        baseline: a previous report
+        threshold: relative slowdown above which a case is considered a regression
+
+    Returns:
+        the regressions, each with the extension name, feature, size, and the ratio of the new duration to the old one
+
+    """
+    previous = {
+        (result["extension"], result["feature"], result["size"]): result["seconds_per_call"]
+        for result in baseline["results"]
+        if "seconds_per_call" in result
+    }
+    regressions = []
+    for result in report["results"]:
+        key = (result["extension"], result["feature"], result["size"])
+        if "seconds_per_call" not in result or not previous.get(key):
+            continue
+        ratio = result["seconds_per_call"] / previous[key]
+        if ratio > 1 + threshold:
+            regressions.append({"extension": key[0], "feature": key[1], "size": key[2], "ratio": ratio})
+    return regressions
+
+
+def adoption(sizes: Iterable[int] = DEFAULT_SIZES, *, min_time: float = 0.1) -> list[dict[str, Any]]:
+    """Measure the cost of wrapping extension results into a `BinaPy`.
+
+    Extensions that return `bytes` pay for a full copy when their result is converted to a `BinaPy`, because a
+    `bytes` subclass can't share the buffer of another `bytes`. Extensions that return a `BinaPy`, for example because
+    they are built on top of other extensions, have their result adopted as-is.
+
+    Args:
+        sizes: the result sizes, in bytes
+        min_time: minimum duration of each measurement, in seconds
+
+    Returns:
+        for each size, the time it takes to wrap a `bytes` result, and a `BinaPy` result
+
+    """
+    results = []
+    for size in sizes:
+        as_bytes = make_payload(size)
+        copied, _ = _time_per_call(partial(BinaPy, as_bytes), min_time)
+        adopted, _ = _time_per_call(partial(BinaPy, BinaPy(as_bytes)), min_time)
+        results.append({"size": size, "bytes_seconds_per_call": copied, "binapy_seconds_per_call": adopted})
+    return results
+
+
+IMPORT_SCENARIOS = {
+    "import binapy": "import binapy",
+    "first use of b64u": "from binapy import BinaPy; BinaPy('foo').to('b64u')",
+    "first use of json": "from binapy import BinaPy; BinaPy.serialize_to('json', {'foo': 'bar'})",
+    "load all extensions": "from binapy import BinaPy; BinaPy.load_extensions()",
+}
+"""Code snippets whose duration is measured by `import_time()`, by label."""
+
+
+def import_time(runs: int = 20) -> dict[str, float]:
+    """Measure the time it takes to import binapy, and to use a first extension, in a fresh interpreter.
+
+    Extension modules are imported lazily, on the first use of one of their extensions, so a process that only uses
+    "b64u" does not pay for importing `json`, `pickle`, `zlib`, `hashlib` or `urllib.parse`.
+
+    Args:
+        runs: number of runs of each scenario from `IMPORT_SCENARIOS`
+
+    Returns:
+        the median duration of each scenario, in seconds, excluding interpreter startup
+
+    """
+    results = {}
+    for label, code in IMPORT_SCENARIOS.items():
+        script = f"import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"
+        durations = [
+            float(
+                subprocess.run(  # noqa: S603
+                    [sys.executable, "-c", script],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout,
+            )
+            for _ in range(runs)
+        ]
+        results[label] = statistics.median(durations)
+    return results
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return str(size)  # pragma: no cover
+
+
+def _format_result(result: dict[str, Any]) -> str:
+    label = f"{result['extension']:10} {result['feature']:9} {_format_size(result['size']):>9}"
+    if "error" in result:
+        return f"{label}  error: {result['error']}"
+    line = f"{label}  {result['seconds_per_call'] * 1e6:12.2f} µs/call"
+    if result.get("throughput") is not None:
+        line += f"  {_format_size(result['throughput'])}/s".rjust(14)
+    if "overhead" in result:
+        line += f"  overhead {result['overhead'] * 1e6:+9.2f} µs"
+    if "peak_memory" in result:
+        line += f"  peak {_format_size(result['peak_memory'])}"
+    return line
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for `python -m binapy.bench`.
+
+    Args:
+        argv: command line arguments
+
+    Returns:
+        the exit status: 1 if regressions were found against the baseline, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m binapy.bench", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=parse_size,
+        default=DEFAULT_SIZES,
+        help="payload sizes, like 16, 64K or 1M",
+    )
+    parser.add_argument("-e", "--extensions", nargs="+", help="extensions to benchmark (default: all)")
+    parser.add_argument("-f", "--features", nargs="+", choices=FEATURES, default=FEATURES, help="features to benchmark")
+    parser.add_argument("--payload", choices=("random", "text"), default="random", help="kind of payload")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum duration of each measurement, in seconds")
+    parser.add_argument("--no-memory", action="store_true", help="do not measure peak memory")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("--json", action="store_true", help="print the JSON report instead of a table")
+    parser.add_argument("-b", "--baseline", help="compare against a JSON report from a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown that counts as a regression")
+    parser.add_argument(
+        "--adoption",
+        action="store_true",
+        help="only measure the cost of wrapping extension results into a BinaPy",
+    )
+    parser.add_argument(
+        "--import-time",
+        nargs="?",
+        type=int,
+        const=20,
+        metavar="RUNS",
+        help="only measure the import time of binapy and its extensions, in fresh interpreters",
+    )
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        for label, duration in import_time(args.import_time).items():
+            print(f"  {label:25} {duration * 1e3:8.3f} ms")  # noqa: T201
+        return 0
+
+    if args.adoption:
+        for result in adoption(args.sizes, min_time=args.min_time):
+            print(  # noqa: T201
+                f"{_format_size(result['size']):>9}  bytes (copied) {result['bytes_seconds_per_call'] * 1e6:12.2f} µs"
+                f"  BinaPy (adopted) {result['binapy_seconds_per_call'] * 1e6:12.2f} µs",
+            )
+        return 0
+
+    report = run(
+        args.sizes,
+        args.extensions,
+        args.features,
+        payload=args.payload,
+        min_time=args.min_time,
+        memory=not args.no_memory,
+        progress=None if args.json else lambda result: print(_format_result(result), flush=True),  # noqa: T201
+    )
+    if args.output:
+        with open(args.output, "w") as output:  # noqa: PTH123
+            json.dump(report, output, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))  # noqa: T201
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:  # noqa: PTH123
+            baseline = json.load(baseline_file)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(  # noqa: T201
+                f"regression: {regression['extension']} {regression['feature']} {_format_size(regression['size'])}"
+                f" is {regression['ratio']:.2f}x slower",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,23 +2,163 @@
 
 from __future__ import annotations
 
+import importlib
+import os
 import re
-import secrets
-from contextlib import suppress
-from functools import wraps
+import sys
+import threading
+import time
+from functools import partial, wraps
 from typing import (
+    IO,
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
+    Iterable,
     Iterator,
     SupportsBytes,
     SupportsIndex,
     TypeVar,
+    Union,
     cast,
     overload,
 )
 
-from typing_extensions import Literal, Self
+from typing_extensions import Literal, Protocol, Self
+
+from .charclass import ALPHANUMERIC, PRINTABLE, URLSAFE, CharClass, is_ascii_compatible
+from .detection import PEEL_EXTENSIONS, Candidate, detect, peel
+from .instrumentation import ExtensionCall, Observer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor  # pragma: no cover
+
+    from .cache import Cache  # pragma: no cover
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Default size of chunks, in bytes, when streaming data."""
+
+
+class StreamCodec(Protocol):
+    """Interface for incremental codecs, as returned by streaming extensions.
+
+    Data is fed chunk by chunk with `update()`, which returns the part of the result that is
+    already available. `finalize()` must be called once at the end to get the remaining data.
+
+    """
+
+    def update(self, data: bytes) -> bytes:
+        """Feed a chunk of data to this codec.
+
+        Args:
+            data: a chunk of data
+
+        Returns:
+            the part of the result that is available so far, possibly empty
+
+        """
+        ...  # pragma: no cover
+
+    def finalize(self) -> bytes:
+        """Process any remaining buffered data, once all data has been fed.
+
+        Returns:
+            the remaining part of the result
+
+        """
+        ...  # pragma: no cover
+
+
+StreamSource = Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", IO[bytes], Iterable[bytes]]
+"""Types of data sources accepted by streaming methods."""
+
+
+def iter_chunks(source: StreamSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Iterate over a data source in chunks.
+
+    Args:
+        source: a bytes-like object, a path to a file (as `str` or `os.PathLike`),
+            a binary file object, or an iterable of `bytes` chunks.
+        chunk_size: maximum size of chunks produced from bytes-like objects and files.
+            Chunks from an iterable are produced as-is.
+
+    Returns:
+        an iterator of binary chunks
+
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield cast(bytes, view[start : start + chunk_size])
+    elif isinstance(source, (str, os.PathLike)):
+        # imported here, since pathlib imports urllib.parse, which is slow to import
+        from pathlib import Path
+
+        with Path(source).open("rb") as f:
+            yield from iter_chunks(f, chunk_size)
+    elif hasattr(source, "read"):
+        while chunk := source.read(chunk_size):
+            yield chunk
+    else:
+        yield from source
+
+
+class BlockCodec:
+    """A `StreamCodec` that applies a one-shot function on blocks of a fixed size.
+
+    Many encodings work on groups of bytes, like 3 bytes for Base64 or 5 bytes for Base32.
+    This buffers incoming data so that `func` is only ever called with a multiple of `block_size` bytes,
+    and calls `final` with the remaining bytes on `finalize()`.
+    To avoid copies, `func` may receive a `memoryview` instead of `bytes`.
+
+    """
+
+    def __init__(
+        self,
+        func: Callable[[bytes], bytes],
+        block_size: int,
+        final: Callable[[bytes], bytes] | None = None,
+    ) -> None:
+        """Initialize a BlockCodec.
+
+        Args:
+            func: the function to apply on each group of full blocks
+            block_size: the size of a block, in bytes
+            final: the function to apply on the remaining data. Defaults to `func`.
+
+        """
+        self.func = func
+        self.block_size = block_size
+        self.final = final or func
+        self._buffer = b""
+
+    def update(self, data: bytes) -> bytes:
+        """Feed some data to this codec.
+
+        Args:
+            data: a chunk of data
+
+        Returns:
+            the result for all complete blocks received so far
+
+        """
+        buffer = self._buffer + data if self._buffer else data
+        cut = len(buffer) - len(buffer) % self.block_size
+        self._buffer = bytes(buffer[cut:])
+        if not cut:
+            return b""
+        return self.func(cast(bytes, memoryview(buffer)[:cut]))
+
+    def finalize(self) -> bytes:
+        """Process the remaining buffered data.
+
+        Returns:
+            the result for the remaining data
+
+        """
+        buffer, self._buffer = self._buffer, b""
+        return self.final(buffer)
 
 
 class BinaPy(bytes):
@@ -38,12 +178,16 @@ class BinaPy(bytes):
 
     def __new__(
         cls,
-        value: bytes | str | int | SupportsBytes = b"",
+        value: bytes | bytearray | memoryview | str | int | SupportsBytes = b"",
         encoding: str = "utf-8",
         errors: str = "strict",
     ) -> Self:
         """Override base method to accept a string with a default encoding of "utf-8".
 
+        Since BinaPy instances are immutable, an exact BinaPy `value` is returned as-is instead of being copied,
+        just like `bytes()` does with a `bytes` value. This allows extensions to build their result as a BinaPy
+        directly, without paying for an extra copy in the extension decorators.
+
         See Also:
             [`bytes` constructor](https://docs.python.org/3/library/stdtypes.html#bytes) and
             [`str.encode()`](https://docs.python.org/3/library/stdtypes.html#str.encode)
@@ -54,6 +198,8 @@ class BinaPy(bytes):
             errors: 'strict', 'ignore', 'replace', 'xmlcharrefreplace', or 'backslashreplace'
 
         """
+        if type(value) is cls:
+            return value
         if isinstance(value, str):
             obj = bytes.__new__(cls, value, encoding=encoding, errors=errors)
         else:
@@ -91,6 +237,52 @@ class BinaPy(bytes):
         data = i.to_bytes(length, byteorder, signed=signed)
         return cls(data)
 
+    @overload
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        mmap: Literal[True] = True,
+    ) -> BinaPyView: ...  # pragma: no cover
+
+    @overload
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str], *, mmap: Literal[False]) -> BinaPy: ...  # pragma: no cover
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike[str], *, mmap: bool = True) -> BinaPy | BinaPyView:
+        """Read data from a file.
+
+        With `mmap=True`, the file is memory-mapped instead of read: this returns a read-only `BinaPyView` on the
+        mapped file, and the OS only pages in the parts of the file that are actually accessed. This allows slicing,
+        hashing, checking, encoding or decoding files that are larger than the available memory.
+        The file is unmapped once that view and all views derived from it are garbage collected.
+
+        Args:
+            path: path to the file
+            mmap: if `True`, memory-map the file and return a `BinaPyView`. Otherwise, read it into a `BinaPy`.
+
+        Returns:
+            a `BinaPyView` or a `BinaPy` with the file contents
+
+        Usage:
+            ```python
+            digest = BinaPy.from_file("path/to/file").to("sha256")
+            ```
+
+        """
+        from pathlib import Path
+
+        with Path(path).open("rb") as f:
+            if not mmap:
+                return cls(f.read())
+            if os.fstat(f.fileno()).st_size == 0:  # empty files can't be mapped
+                return BinaPyView(b"")
+            import mmap as mmap_module
+
+            return BinaPyView(memoryview(mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)))
+
     def ascii(self) -> str:
         """Decode this BinaPy to a str.
 
@@ -127,6 +319,32 @@ class BinaPy(bytes):
         msg = f"This value does not match pattern {pattern}"
         raise ValueError(msg)
 
+    def match_chars(self, charclass: CharClass, encoding: str = "ascii") -> str:
+        """Decode this binary value to a string, and check that it contains only characters from a `CharClass`.
+
+        This is much faster than `re_match()`, since the check is done using a precomputed table at C speed.
+
+        Args:
+            charclass: the allowed characters
+            encoding: the encoding to use to decode the binary value to a string
+
+        Returns:
+            the decoded `str`
+
+        Raises:
+            ValueError: if the value contains characters that are not part of `charclass`
+
+        """
+        res = self.decode(encoding)
+        if is_ascii_compatible(encoding):
+            valid = charclass.match(self)
+        else:
+            valid = res.isascii() and charclass.match(res.encode("ascii"))
+        if valid:
+            return res
+        msg = f"This value contains characters that are not part of {charclass}"
+        raise ValueError(msg)
+
     def text(self, encoding: str = "ascii") -> str:
         r"""Decode this BinaPy to a str, and check that the result is printable.
 
@@ -139,7 +357,7 @@ class BinaPy(bytes):
             the decoded text
 
         """
-        return self.re_match(r'^[a-zA-Z0-9!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~ ]*$', encoding)
+        return self.match_chars(PRINTABLE, encoding)
 
     def urlsafe(self) -> str:
         r"""Convert this BinaPy to a str, and check that it contains only url-safe characters.
@@ -150,7 +368,7 @@ class BinaPy(bytes):
                  a str with only URL-safe chars
 
         """
-        return self.re_match(r"^[A-Za-z0-9_.\-~]$")
+        return self.match_chars(URLSAFE)
 
     def alphanumeric(self) -> str:
         """Check that this BinaPy contains only alphanumeric characters.
@@ -159,7 +377,7 @@ class BinaPy(bytes):
                  a str with only alphanumeric chars
 
         """
-        return self.re_match(r"^[a-zA-Z]$")
+        return self.match_chars(ALPHANUMERIC)
 
     def to_int(self, *, byteorder: Literal["little", "big"] = "big", signed: bool = False) -> int:
         """Convert this BinaPy to an `int`.
@@ -231,7 +449,7 @@ class BinaPy(bytes):
             a BinaPy with randomly generated data
 
         """
-        return cls(secrets.token_bytes(length))
+        return cls(os.urandom(length))
 
     @classmethod
     def random_bits(cls, length: int) -> BinaPy:
@@ -246,7 +464,7 @@ class BinaPy(bytes):
             a BinaPy with randomly generated data
 
         """
-        return cls(secrets.token_bytes(length // 8))
+        return cls(os.urandom(length // 8))
 
     @overload
     def __getitem__(self, index: SupportsIndex) -> int: ...  # pragma: no cover
@@ -324,27 +542,132 @@ class BinaPy(bytes):
         """
         return [self.__class__(b) for b in super().split(sep, maxsplit)]
 
-    def split_at(self, *pos: int) -> tuple[BinaPy, ...]:
+    @overload
+    def split_at(self, *pos: int, copy: Literal[True] = True) -> tuple[BinaPy, ...]: ...  # pragma: no cover
+
+    @overload
+    def split_at(self, *pos: int, copy: Literal[False]) -> tuple[BinaPyView, ...]: ...  # pragma: no cover
+
+    def split_at(self, *pos: int, copy: bool = True) -> tuple[BinaPy, ...] | tuple[BinaPyView, ...]:
         """Split this BinaPy at one or more integer positions.
 
         Args:
             *pos: indexes where to cut the BinaPy
+            copy: if `False`, return zero-copy `BinaPyView` instances instead of `BinaPy`.
 
         Returns:
-            a tuple of `len(pos) + 1` instances of BinaPy
+            a tuple of `len(pos) + 1` instances of BinaPy (or BinaPyView)
 
         """
+        if not copy:
+            return self.view().split_at(*pos)
         spos = sorted(pos)
-        return tuple(self.__class__(self[start:end]) for start, end in zip([0, *spos], [*spos, len(self)]))
+        return tuple(self[start:end] for start, end in zip([0, *spos], [*spos, len(self)]))
+
+    def view(self, start: int | None = None, stop: int | None = None) -> BinaPyView:
+        """Return a zero-copy view on this BinaPy, or on a part of it.
+
+        Args:
+            start: start index of the view
+            stop: end index of the view
+
+        Returns:
+            a `BinaPyView`
+
+        """
+        return BinaPyView(memoryview(self)[start:stop])
 
     cut_at = split_at  # for backward compatibility
 
     extensions: ClassVar[dict[str, dict[str, Callable[..., Any]]]] = {}
     """Extension registry."""
 
+    alphabets: ClassVar[dict[str, CharClass]] = {}
+    """Characters allowed by formats that restrict them, by extension name. See `binapy_checker()`."""
+
+    length_checkers: ClassVar[set[str]] = set()
+    """Extensions whose checker only depends on the length of the data. See `binapy_checker()`."""
+
+    lazy_extensions: ClassVar[dict[str, str]] = {
+        **dict.fromkeys(("b32", "b64", "b64u"), "binapy.encoding.base64"),
+        **dict.fromkeys(("atbash", "caesar", "rot13", "rot47", "vigenere"), "binapy.encoding.dumb"),
+        "hex": "binapy.encoding.hex",
+        "url": "binapy.encoding.url",
+        "xor": "binapy.encoding.xor",
+        **dict.fromkeys(("deflate", "zlib"), "binapy.compression.zlib"),
+        **dict.fromkeys(
+            ("sha1", "sha256", "sha384", "sha512", "ssha1", "ssha256", "ssha384", "ssha512"),
+            "binapy.hashing.sha",
+        ),
+        **dict.fromkeys(("shake128", "shake256", "sshake128", "sshake256"), "binapy.hashing.shake"),
+        "json": "binapy.parsing.json",
+        "jsonl": "binapy.parsing.jsonl",
+        "pickle": "binapy.parsing.pickle",
+    }
+    """Modules that register extensions, by extension name, that are not imported yet.
+
+    Each module is imported on the first lookup of one of the extensions it registers."""
+
+    ENTRY_POINTS_GROUP: ClassVar[str] = "binapy.extensions"
+    """Entry points group for third-party extensions.
+
+    Each entry point name is an extension name, and its value is the module that registers it."""
+
+    _entry_points_loaded: ClassVar[bool] = False
+    _extensions_lock: ClassVar[threading.Lock] = threading.Lock()
+    """Protects `lazy_extensions` from concurrent updates. It is never held while an extension module is imported."""
+
+    @classmethod
+    def _load_extension(cls, name: str) -> None:
+        module = cls.lazy_extensions.get(name)
+        if module is None:
+            return
+        # Python's per-module import lock serializes concurrent loads: other threads importing the same module wait
+        # until it is fully executed, and so until all its extensions are registered.
+        importlib.import_module(module)
+        # only remove the lazy entries once registration is complete, so that other threads import the module too
+        with cls._extensions_lock:
+            for ext_name in [ext_name for ext_name, ext_module in cls.lazy_extensions.items() if ext_module == module]:
+                del cls.lazy_extensions[ext_name]
+
+    @classmethod
+    def _load_entry_points(cls) -> None:
+        if cls._entry_points_loaded:
+            return
+        # imported here, since importlib.metadata is slow to import and scanning entry points has a cost
+        from importlib.metadata import entry_points
+
+        eps: Any = entry_points()
+        # Python < 3.10 returns a dict of groups
+        if hasattr(eps, "select"):
+            group = eps.select(group=cls.ENTRY_POINTS_GROUP)
+        else:
+            group = eps.get(cls.ENTRY_POINTS_GROUP, ())
+        with cls._extensions_lock:
+            for ep in group:
+                cls.lazy_extensions.setdefault(ep.name, ep.value.partition(":")[0].strip())
+            cls._entry_points_loaded = True
+
+    @classmethod
+    def load_extensions(cls) -> None:
+        """Import all extension modules, including third-party ones declared with entry points.
+
+        Extension modules are otherwise only imported on the first use of one of their extensions.
+        This is only needed to list all available extensions from `BinaPy.extensions`.
+
+        """
+        cls._load_entry_points()
+        for name in list(cls.lazy_extensions):
+            cls._load_extension(name)
+
     @classmethod
     def _get_extension_methods(cls, name: str) -> dict[str, Callable[..., Any]]:
+        cls._load_extension(name)
         extension = cls.extensions.get(name)
+        if extension is None and not cls._entry_points_loaded:
+            cls._load_entry_points()
+            cls._load_extension(name)
+            extension = cls.extensions.get(name)
         if extension is None:
             msg = f"Extension {name} not found"
             raise NotImplementedError(msg)
@@ -395,6 +718,24 @@ class BinaPy(bytes):
             raise NotImplementedError(msg)
         return method
 
+    @classmethod
+    def _get_stream_encoder(cls, extension_name: str) -> Callable[..., StreamCodec]:
+        extension_methods = cls._get_extension_methods(extension_name)
+        method = extension_methods.get("encode_stream")
+        if method is None:
+            msg = f"Extension '{extension_name}' does not have a streaming encoder"
+            raise NotImplementedError(msg)
+        return method
+
+    @classmethod
+    def _get_stream_decoder(cls, extension_name: str) -> Callable[..., StreamCodec]:
+        extension_methods = cls._get_extension_methods(extension_name)
+        method = extension_methods.get("decode_stream")
+        if method is None:
+            msg = f"Extension '{extension_name}' does not have a streaming decoder"
+            raise NotImplementedError(msg)
+        return method
+
     def encode_to(self, name: str, *args: Any, **kwargs: object) -> BinaPy:
         """Encode data from this BinaPy according to the format `name`.
 
@@ -408,7 +749,8 @@ class BinaPy(bytes):
 
         """
         encoder = self._get_encoder(name)
-
+        if self._hooked:
+            return self._dispatch(name, "encode", encoder, self, args, kwargs)  # type: ignore[no-any-return]
         return encoder(self, *args, **kwargs)
 
     def to(self, name: str, *args: object, **kwargs: object) -> BinaPy:
@@ -438,7 +780,8 @@ class BinaPy(bytes):
 
         """
         decoder = self._get_decoder(name)
-
+        if self._hooked:
+            return self._dispatch(name, "decode", decoder, self, args, kwargs)  # type: ignore[no-any-return]
         return decoder(self, *args, **kwargs)
 
     def check(self, name: str, *, decode: bool = False, raise_on_error: bool = False) -> bool:
@@ -455,6 +798,18 @@ class BinaPy(bytes):
             a boolean, that is True if this BinaPy conforms to the given extension format, False otherwise.
 
         """
+        if self._hooked:
+            return self._dispatch(  # type: ignore[no-any-return]
+                name,
+                "check",
+                BinaPy._check,
+                self,
+                (name,),
+                {"decode": decode, "raise_on_error": raise_on_error},
+            )
+        return self._check(name, decode=decode, raise_on_error=raise_on_error)
+
+    def _check(self, name: str, *, decode: bool = False, raise_on_error: bool = False) -> bool:
         # raises an exception in case the extension does not exist
         self._get_extension_methods(name)
 
@@ -488,22 +843,98 @@ class BinaPy(bytes):
         """Check if this BinaPy conforms to any of the registered format extensions.
 
         Returns:
-             a list of format extensions that this BinaPy can be decoded from.
+             a list of format extensions that this BinaPy can be decoded from, from the most to the least likely.
+
+        Args:
+            decode: if `True`, for extensions that don't have a checker method,
+                try to decode this BinaPy using the decoder method to check if that works.
+
+        """
+        return [candidate.name for candidate in self.detect(decode=decode)]
+
+    def detect(
+        self,
+        *,
+        decode: bool = False,
+        budget: float | None = None,
+        max_decode_size: int | None = None,
+    ) -> list[Candidate]:
+        """Detect the formats that this BinaPy conforms to, ranked by confidence.
+
+        A cheap profile of the characters from this BinaPy is computed first, and used to rule out formats
+        that declare an alphabet, without running their checker. Remaining checkers are run next, then decoders
+        if `decode` is `True`.
+
+        Confidence is higher for formats with a small alphabet, since data is less likely to fit in it by chance.
+        Formats detected by a checker that doesn't declare an alphabet, like hashes which are only checked by
+        length, get a low confidence.
 
         Args:
             decode: if `True`, for extensions that don't have a checker method,
                 try to decode this BinaPy using the decoder method to check if that works.
+            budget: maximum time to spend, in seconds. Checks that have not started when the budget
+                is exhausted are skipped.
+            max_decode_size: do not try decoding if this BinaPy is larger than this size, in bytes.
+
+        Returns:
+            a list of `Candidate`, with `name`, `confidence` and `method` attributes,
+            from the most to the least likely format.
+
+        Usage:
+            ```python
+            BinaPy("c0ffee12").detect()
+            # [Candidate(name='hex', confidence=0.9140625, method='check'),
+            #  Candidate(name='b64', confidence=0.74609375, method='check'),
+            #  Candidate(name='b64u', confidence=0.74609375, method='check')]
+            ```
 
         """
+        return detect(self, decode=decode, budget=budget, max_decode_size=max_decode_size)
+
+    def peel(
+        self,
+        *,
+        max_depth: int = 8,
+        max_size: int = 64 * 1024 * 1024,
+        extensions: Iterable[str] = PEEL_EXTENSIONS,
+        parsers: Iterable[str] = ("json",),
+        binary: bool = False,
+    ) -> tuple[Any, list[str]]:
+        """Recursively detect and decode all layers of encoding from this BinaPy.
+
+        Each layer is detected with `detect()`, and candidate formats are tried from the most to the least likely,
+        backtracking when a decoding leads to a dead end. Peeling stops when the data can be parsed into a structured
+        value (like a JSON object or array) by one of `parsers`, or when no decoding leads to something that looks like
+        text. Intermediate contents that were already found to be dead ends are not checked again.
+
+        Args:
+            max_depth: maximum number of layers to decode
+            max_size: maximum size of intermediate decoded data, in bytes. This also protects against
+                decompression bombs.
+            extensions: the extensions to try for decoding. By default, encodings and compressions, but not
+                ciphers, since decoding any data with a cipher always succeeds.
+            parsers: the extensions to try for parsing the innermost layer
+            binary: if `True`, accept a result that is binary data. By default, only text or parsed data is accepted.
+
+        Returns:
+            a tuple of (final value, list of extension names that were decoded or parsed, from outermost to innermost)
 
-        def get_results() -> Iterator[str]:
-            for name in self.extensions:
-                with suppress(NotImplementedError):
-                    success = self.check(name, decode=decode)
-                    if success is True:
-                        yield name
+        Usage:
+            ```python
+            bp = BinaPy.serialize_to("json", {"foo": "bar"}).to("deflate").to("b64").to("url")
+            bp.peel()
+            # ({'foo': 'bar'}, ['url', 'b64', 'deflate', 'json'])
+            ```
 
-        return list(get_results())
+        """
+        return peel(
+            self,
+            max_depth=max_depth,
+            max_size=max_size,
+            extensions=extensions,
+            parsers=parsers,
+            binary=binary,
+        )
 
     def parse_from(self, name: str, *args: Any, **kwargs: Any) -> Any:
         """Parse data from this BinaPy, based on a given format extension.
@@ -518,7 +949,8 @@ class BinaPy(bytes):
 
         """
         parser = self._get_parser(name)
-
+        if self._hooked:
+            return self._dispatch(name, "parse", parser, self, args, kwargs)
         return parser(self, *args, **kwargs)
 
     @classmethod
@@ -536,113 +968,1094 @@ class BinaPy(bytes):
 
         """
         serializer = cls._get_serializer(name)
-
+        if cls._hooked:
+            return cls._dispatch(name, "serialize", serializer, None, args, kwargs)  # type: ignore[no-any-return]
         return serializer(*args, **kwargs)
 
     @classmethod
-    def register_extension(cls, name: str, feature: str, func: Callable[..., Any]) -> None:
-        """Register a new feature for the given extension name.
+    def stream_encoder(cls, name: str, *args: Any, **kwargs: Any) -> StreamCodec:
+        """Return an incremental encoder for the format `name`.
 
         Args:
-            name: the extension name
-            feature: name of the feature to register ("encode", "decode", etc.)
-            func: the method implementing the feature
+            name: format to use
+            *args: additional position parameters for the extension streaming encoder
+            **kwargs: additional keyword parameters for the extension streaming encoder
+
+        Returns:
+            a `StreamCodec`, with `update()` and `finalize()` methods
 
         """
-        ext_dict = cls.extensions.setdefault(name, {})
-        ext_dict[feature] = func
+        return cls._get_stream_encoder(name)(*args, **kwargs)
 
+    @classmethod
+    def stream_decoder(cls, name: str, *args: Any, **kwargs: Any) -> StreamCodec:
+        """Return an incremental decoder for the format `name`.
 
-F = TypeVar("F", bound=Callable[..., Any])
+        Args:
+            name: format to use
+            *args: additional position parameters for the extension streaming decoder
+            **kwargs: additional keyword parameters for the extension streaming decoder
 
+        Returns:
+            a `StreamCodec`, with `update()` and `finalize()` methods
 
-class InvalidExtensionMethodError(ValueError):
-    """Raised when an extension method returns invalid data."""
+        """
+        return cls._get_stream_decoder(name)(*args, **kwargs)
 
+    @classmethod
+    def _run_stream(cls, codec: StreamCodec, source: StreamSource, chunk_size: int) -> Iterator[BinaPy]:
+        for chunk in iter_chunks(source, chunk_size):
+            result = codec.update(chunk)
+            if result:
+                yield cls(result)
+        result = codec.finalize()
+        if result:
+            yield cls(result)
 
-def binapy_encoder(name: str) -> Callable[[F], F]:
-    """Declare new encoders for BinaPy.
+    @classmethod
+    def encode_stream(
+        cls,
+        name: str,
+        source: StreamSource,
+        *args: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[BinaPy]:
+        """Encode data from a stream according to the format `name`, chunk by chunk.
 
-    This is a method decorator. Encoders do convert a BinaPy into another BinaPy using a given format/extension.
+        Only one chunk of data is held in memory at a time, so this works for arbitrarily large data.
 
-    Args:
-    ----
-        name: name of the extension
+        Args:
+            name: format to use
+            source: the data to encode, as accepted by `iter_chunks()`
+            *args: additional position parameters for the extension streaming encoder
+            chunk_size: size of chunks to read from `source`
+            **kwargs: additional keyword parameters for the extension streaming encoder
 
-    Returns:
-    -------
-        a method decorator
+        Returns:
+            an iterator of encoded chunks
 
-    Usage:
-        To declare a special "double-encoding" which just copy the data twice:
+        """
+        return cls._run_stream(cls.stream_encoder(name, *args, **kwargs), source, chunk_size)
 
-        ```python
-        from binapy import binapy_encoder
+    @classmethod
+    def decode_stream(
+        cls,
+        name: str,
+        source: StreamSource,
+        *args: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[BinaPy]:
+        """Decode data from a stream according to the format `name`, chunk by chunk.
 
+        Args:
+            name: format to use
+            source: the data to decode, as accepted by `iter_chunks()`
+            *args: additional position parameters for the extension streaming decoder
+            chunk_size: size of chunks to read from `source`
+            **kwargs: additional keyword parameters for the extension streaming decoder
 
-        @binapy_encoder("double")
-        def double_encode(data: bytes) -> bytes:
-            return data * 2
+        Returns:
+            an iterator of decoded chunks
 
+        """
+        return cls._run_stream(cls.stream_decoder(name, *args, **kwargs), source, chunk_size)
 
-        assert BinaPy(b"abc").to("double") == b"abcabc"
-        ```
+    @classmethod
+    def hash_stream(
+        cls,
+        name: str,
+        source: StreamSource,
+        *args: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> BinaPy:
+        """Hash data from a stream, chunk by chunk.
 
-    """
+        This only holds one chunk of data in memory at a time, and returns the same result as
+        `encode_to()` would with the whole data. It works with any extension that has a streaming encoder,
+        but it is mostly useful for hashes, which produce a small result.
 
-    def decorator(func: F) -> F:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> BinaPy:
-            raw_result = func(*args, **kwargs)
-            if not isinstance(raw_result, (bytes, bytearray, str)):
-                msg = f"extension {name} encoder method did not return binary data"
-                raise InvalidExtensionMethodError(msg)
-            return BinaPy(raw_result)
+        Args:
+            name: hash format to use, such as "sha256"
+            source: the data to hash, as accepted by `iter_chunks()`
+            *args: additional position parameters for the extension streaming encoder
+            chunk_size: size of chunks to read from `source`
+            **kwargs: additional keyword parameters for the extension streaming encoder
 
-        BinaPy.register_extension(name, "encode", wrapper)
-        return cast(F, wrapper)
+        Returns:
+            the calculated hash
 
-    return decorator
+        Usage:
+            ```python
+            digest = BinaPy.hash_stream("sha256", "path/to/file")
+            ```
 
+        """
+        return cls(b"".join(cls.encode_stream(name, source, *args, chunk_size=chunk_size, **kwargs)))
 
-def binapy_decoder(name: str) -> Callable[[F], F]:
-    """Declare a new decoder for BinaPy.
+    @classmethod
+    def multi_hash(
+        cls,
+        names: Iterable[str],
+        source: StreamSource,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict[str, BinaPy]:
+        """Calculate several hashes of the same data, in a single pass.
 
-    This is a method decorator. Decoders do convert BinaPy data from a given format into another BinaPy.
+        Each chunk of data is fed to all hashes before reading the next one, so the data is read only once,
+        and only one chunk is held in memory at a time.
+        Hash names may include parameters, with the same syntax as `pipeline()` steps, like `"shake256(512)"`.
+        This works with any extension that has a streaming encoder, but other encoders than hashes, like "b64",
+        accumulate their whole result in memory.
 
-    Args:
-    ----
-        name: name of the extension
+        Args:
+            names: the hash names
+            source: the data to hash, as accepted by `iter_chunks()`. This can be a BinaPy.
+            chunk_size: size of chunks to read from `source`
 
-    Returns:
-    -------
-        a method decorator
+        Returns:
+            a mapping of each hash name to the calculated hash
 
-    Usage:
-        The matching decoder for the special "double-encoding" we created with `binapy_encoder()`:
+        Usage:
+            ```python
+            hashes = BinaPy.multi_hash(["sha1", "sha256", "shake256(512)"], "path/to/file")
+            hashes["sha256"]
+            ```
 
-        ```python
-        from binapy import binapy_decoder
+        """
+        codecs = {}
+        for spec in names:
+            _, name, args, kwargs = _parse_pipeline_step(spec)
+            codecs[spec] = cls.stream_encoder(name, *args, **kwargs)
+        outputs: dict[str, list[bytes]] = {spec: [] for spec in codecs}
+        updates = [(codec.update, outputs[spec].append) for spec, codec in codecs.items()]
+        for chunk in iter_chunks(source, chunk_size):
+            for update, append in updates:
+                result = update(chunk)
+                if result:
+                    append(result)
+        for spec, codec in codecs.items():
+            outputs[spec].append(codec.finalize())
+        return {spec: cls(b"".join(output)) for spec, output in outputs.items()}
+
+    _FEATURE_GETTERS: ClassVar[dict[str, str]] = {
+        "encode": "_get_encoder",
+        "decode": "_get_decoder",
+        "parse": "_get_parser",
+    }
 
+    @classmethod
+    def _run_many(  # noqa: PLR0913
+        cls,
+        feature: str,
+        name: str,
+        items: Iterable[bytes | str],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        executor: Executor | Literal["thread", "process"] | None,
+        max_workers: int | None,
+    ) -> list[Any]:
+        method = getattr(cls, cls._FEATURE_GETTERS[feature])(name)
+        values = (item if isinstance(item, bytes) else cls(item) for item in items)
+        if executor is None:
+            return [_call_safely(method, args, kwargs, value) for value in values]
+
+        # imported here, since importing concurrent.futures is slow
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        # process pools need a picklable function, so extensions are resolved again in each worker
+        func = (
+            partial(_apply_extension_safely, feature, name, args, kwargs)
+            if executor == "process" or isinstance(executor, ProcessPoolExecutor)
+            else partial(_call_safely, method, args, kwargs)
+        )
+        if executor == "thread":
+            with ThreadPoolExecutor(max_workers) as pool:
+                return list(pool.map(func, values))
+        if executor == "process":
+            with ProcessPoolExecutor(max_workers) as pool:
+                return list(pool.map(func, values))
+        return list(executor.map(func, values))
 
-        @binapy_decoder("double")
-        def double_decode(data: bytes) -> bytes:
-            if len(data) % 2 or data[: len(data) // 2] != data[len(data) // 2 :]:
-                raise ValueError("This is not a double-encoded data!")
-            return data[: len(data) // 2]
+    @classmethod
+    def encode_many(
+        cls,
+        name: str,
+        items: Iterable[bytes | str],
+        *args: Any,
+        executor: Executor | Literal["thread", "process"] | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[BinaPy | Exception]:
+        """Encode many values according to the format `name`.
+
+        The extension is resolved only once for the whole batch. Items can optionally be processed in parallel
+        by an `Executor`. This scales well with threads for extensions such as hashes or compression, since
+        `hashlib` and `zlib` release the GIL when working on large buffers.
+
+        Results are returned in the same order as `items`. An item that fails does not abort the whole batch:
+        the exception it raised is returned in place of its result.
 
+        Args:
+            name: format to use
+            items: the values to encode
+            *args: additional position parameters for the extension encoder method
+            executor: an `Executor` to use, or "thread" or "process" to use a new thread or process pool.
+                If `None` (default), items are processed sequentially in the current thread.
+            max_workers: the number of workers, when `executor` is "thread" or "process"
+            **kwargs: additional keyword parameters for the extension encoder method
 
-        assert BinaPy(b"abcabc").decode_from("double") == b"abc"
-        ```
+        Returns:
+            a list with the encoded data, or the exception raised, for each item
 
-    """
+        Usage:
+            ```python
+            digests = BinaPy.encode_many("sha256", payloads, executor="thread")
+            ```
 
-    def decorator(func: F) -> F:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> BinaPy:
-            raw_result = func(*args, **kwargs)
-            if not isinstance(raw_result, (bytes, bytearray)):
-                msg = f"extension {name} decoder method did not return binary data"
+        """
+        return cls._run_many("encode", name, items, args, kwargs, executor, max_workers)
+
+    @classmethod
+    def decode_many(
+        cls,
+        name: str,
+        items: Iterable[bytes | str],
+        *args: Any,
+        executor: Executor | Literal["thread", "process"] | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[BinaPy | Exception]:
+        """Decode many values according to the format `name`.
+
+        See `encode_many()` for details about batch processing.
+
+        Args:
+            name: format to use
+            items: the values to decode
+            *args: additional position parameters for the extension decoder method
+            executor: an `Executor` to use, or "thread" or "process" to use a new thread or process pool.
+            max_workers: the number of workers, when `executor` is "thread" or "process"
+            **kwargs: additional keyword parameters for the extension decoder method
+
+        Returns:
+            a list with the decoded data, or the exception raised, for each item
+
+        """
+        return cls._run_many("decode", name, items, args, kwargs, executor, max_workers)
+
+    @classmethod
+    def parse_many(
+        cls,
+        name: str,
+        items: Iterable[bytes | str],
+        *args: Any,
+        executor: Executor | Literal["thread", "process"] | None = None,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Parse many values based on the format `name`.
+
+        See `encode_many()` for details about batch processing.
+
+        Args:
+            name: format to use
+            items: the values to parse
+            *args: additional position parameters for the extension parser method
+            executor: an `Executor` to use, or "thread" or "process" to use a new thread or process pool.
+            max_workers: the number of workers, when `executor` is "thread" or "process"
+            **kwargs: additional keyword parameters for the extension parser method
+
+        Returns:
+            a list with the parsed value, or the exception raised, for each item
+
+        """
+        return cls._run_many("parse", name, items, args, kwargs, executor, max_workers)
+
+    @classmethod
+    def pipeline(cls, spec: str | Iterable[str | tuple[str, dict[str, Any]]], *, feature: str = "decode") -> Pipeline:
+        """Compile a chain of transformations into a reusable `Pipeline`.
+
+        Each step is either a string like `"[feature:]name[(args)]"`, where `args` are Python literals,
+        or a tuple `(step, kwargs)`. The whole chain can also be given as a single string, with steps separated by
+        `|`. Steps without an explicit feature use `feature`. When decoding, the last step falls back to "parse"
+        if its extension has no decoder, and when encoding the first step falls back to "serialize" if its extension
+        has no encoder.
+
+        All extensions are resolved once, when the pipeline is compiled. Parameters may be any Python literal,
+        including strings that contain `|`; other syntax, such as `**kwargs`, is rejected.
+
+        Args:
+            spec: the chain of steps
+            feature: the default feature for steps, usually "decode" or "encode"
+
+        Returns:
+            a callable `Pipeline`
+
+        Usage:
+            ```python
+            parse_token = BinaPy.pipeline("b64u|deflate|json")
+            parse_token(b"q1bKSM3JyVeyUirPL8pJUaoFAA")
+            # {'hello': 'world'}
+
+            make_token = BinaPy.pipeline("json|deflate(level=9)|b64u", feature="encode")
+            ```
+
+        """
+        if isinstance(spec, str):
+            spec = _split_pipeline(spec)
+        steps = [(step, {}) if isinstance(step, str) else step for step in spec]
+        compiled = []
+        for index, (step, extra_kwargs) in enumerate(steps):
+            step_feature, name, args, kwargs = _parse_pipeline_step(step)
+            kwargs.update(extra_kwargs)
+            methods = cls._get_extension_methods(name)
+            if step_feature is None:
+                step_feature = feature
+                if step_feature not in methods:
+                    if feature == "decode" and index == len(steps) - 1 and "parse" in methods:
+                        step_feature = "parse"
+                    elif feature == "encode" and index == 0 and "serialize" in methods:
+                        step_feature = "serialize"
+            method = methods.get(step_feature)
+            if method is None:
+                msg = f"Extension '{name}' does not have a {step_feature} method"
+                raise NotImplementedError(msg)
+            compiled.append((step_feature, name, method, tuple(args), kwargs))
+        return Pipeline(compiled)
+
+    _observers: ClassVar[tuple[Observer, ...]] = ()
+    _cache: ClassVar[Cache | None] = None
+    _hooked: ClassVar[bool] = False
+    """`True` if extension calls must go through `_dispatch()`, because there are observers or a cache."""
+
+    @classmethod
+    def add_observer(cls, observer: Observer) -> None:
+        """Register an observer, that will be notified of each extension call.
+
+        Observers are notified of calls to `encode_to()`, `decode_from()`, `check()`, `parse_from()` and
+        `serialize_to()`, once they complete. See `Metrics` for an observer that collects metrics.
+
+        Args:
+            observer: the observer to register
+
+        """
+        if observer not in cls._observers:
+            BinaPy._observers = (*cls._observers, observer)
+            BinaPy._hooked = True
+
+    @classmethod
+    def remove_observer(cls, observer: Observer) -> None:
+        """Unregister an observer.
+
+        Args:
+            observer: the observer to unregister
+
+        """
+        BinaPy._observers = tuple(registered for registered in cls._observers if registered is not observer)
+        BinaPy._hooked = bool(BinaPy._observers) or BinaPy._cache is not None
+
+    @classmethod
+    def set_cache(cls, cache: Cache | None) -> None:
+        """Set the cache that memoizes extension calls, or disable caching with `None`.
+
+        See `Cache`.
+
+        Args:
+            cache: the cache to use
+
+        """
+        BinaPy._cache = cache
+        BinaPy._hooked = bool(BinaPy._observers) or cache is not None
+
+    @classmethod
+    def _dispatch(  # noqa: PLR0913
+        cls,
+        name: str,
+        feature: str,
+        method: Callable[..., Any],
+        data: bytes | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call an extension method through the cache, if any, and notify the registered observers.
+
+        Args:
+            name: the extension name
+            feature: the called feature
+            method: the extension method
+            data: the input data, or `None` for serializers
+            args: additional position parameters for the method
+            kwargs: additional keyword parameters for the method
+
+        Returns:
+            the method result
+
+        """
+        cache = cls._cache
+        observers = cls._observers
+        if not observers and cache is not None:
+            return cache.call(name, feature, method, data, args, kwargs)
+
+        size_in = None if data is None else len(data)
+        start = time.perf_counter_ns()
+        try:
+            if cache is not None:
+                result = cache.call(name, feature, method, data, args, kwargs)
+            else:
+                result = method(*args, **kwargs) if data is None else method(data, *args, **kwargs)
+        except BaseException as exc:
+            call = ExtensionCall(name, feature, start, (time.perf_counter_ns() - start) / 1e9, size_in, None, exc)
+            cls._notify(observers, call)
+            raise
+        size_out = len(result) if isinstance(result, (bytes, bytearray)) else None
+        call = ExtensionCall(name, feature, start, (time.perf_counter_ns() - start) / 1e9, size_in, size_out, None)
+        cls._notify(observers, call)
+        return result
+
+    @staticmethod
+    def _notify(observers: Iterable[Observer], call: ExtensionCall) -> None:
+        """Notify observers of a completed call.
+
+        Exceptions raised by observers are logged, so that they neither replace the exception raised by the call,
+        nor turn a successful call into a failure.
+
+        Args:
+            observers: the observers to notify
+            call: the completed call
+
+        """
+        for observer in observers:
+            try:
+                observer.observe(call)
+            except Exception:  # noqa: PERF203
+                # imported here, since logging is slow to import and observers are not expected to fail
+                import logging
+
+                logger = logging.getLogger(__name__)
+                logger.exception("Observer %r failed on a call to %s %s", observer, call.name, call.feature)
+
+    @classmethod
+    def register_extension(cls, name: str, feature: str, func: Callable[..., Any]) -> None:
+        """Register a new feature for the given extension name.
+
+        Args:
+            name: the extension name
+            feature: name of the feature to register ("encode", "decode", etc.)
+            func: the method implementing the feature
+
+        """
+        # make sure that a built-in extension, if any, does not override this registration when it is loaded later.
+        # This is not needed if its module is already imported, or being imported: it may be the caller.
+        module = cls.lazy_extensions.get(name)
+        if module is not None and module not in sys.modules:
+            cls._load_extension(name)
+        ext_dict = cls.extensions.setdefault(name, {})
+        ext_dict[feature] = func
+
+
+class BinaPyView:
+    """A read-only, zero-copy view on binary data.
+
+    Slicing a `BinaPy` copies the sliced data, like slicing a `bytes` does. A `BinaPyView` is
+    backed by a `memoryview` instead, so slicing it or splitting it never copies the underlying data.
+    Common `BinaPy` operations are available directly on views, and use streaming codecs whenever available
+    so that the data is not materialized. Use `to_binapy()` (or `bytes()`) to get an actual copy of the data.
+
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        """Initialize a view on some data.
+
+        Args:
+            data: a bytes-like object
+
+        """
+        self._view = memoryview(data).toreadonly().cast("B")
+
+    def __len__(self) -> int:
+        """Return the length of this view.
+
+        Returns:
+            the number of bytes in this view
+
+        """
+        return len(self._view)
+
+    def __bytes__(self) -> bytes:
+        """Return a copy of the data from this view, as `bytes`.
+
+        Returns:
+            the data from this view
+
+        """
+        return self._view.tobytes()
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this view with a bytes-like object or another view.
+
+        Args:
+            other: the object to compare
+
+        Returns:
+            `True` if both hold the same data
+
+        """
+        if isinstance(other, BinaPyView):
+            return self._view == other._view
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self._view == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation of this view, which includes the data.
+
+        Returns:
+            a string representation
+
+        """
+        return f"{self.__class__.__name__}({self._view.tobytes()!r})"
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> int: ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, slice: slice) -> BinaPyView: ...  # pragma: no cover
+
+    def __getitem__(self, slice: slice | SupportsIndex) -> int | BinaPyView:  # noqa: A002
+        """Return a single byte, or a zero-copy sub-view of this view.
+
+        Args:
+            slice: a slice or index
+
+        Returns:
+            an int or a BinaPyView
+
+        """
+        result = self._view[slice]
+        if isinstance(result, int):
+            return result
+        return self.__class__(result)
+
+    def memoryview(self) -> memoryview:
+        """Return the `memoryview` backing this view.
+
+        Returns:
+            a read-only `memoryview`
+
+        """
+        return self._view
+
+    def to_binapy(self) -> BinaPy:
+        """Materialize this view into a `BinaPy`. This copies the data.
+
+        Returns:
+            a BinaPy with the same data
+
+        """
+        return BinaPy(self._view)
+
+    def view(self, start: int | None = None, stop: int | None = None) -> BinaPyView:
+        """Return a zero-copy view on a part of this view.
+
+        Args:
+            start: start index of the view
+            stop: end index of the view
+
+        Returns:
+            a `BinaPyView`
+
+        """
+        return self.__class__(self._view[start:stop])
+
+    def split_at(self, *pos: int) -> tuple[BinaPyView, ...]:
+        """Split this view at one or more integer positions, without copying.
+
+        Args:
+            *pos: indexes where to cut the view
+
+        Returns:
+            a tuple of `len(pos) + 1` instances of BinaPyView
+
+        """
+        spos = sorted(pos)
+        return tuple(self[start:end] for start, end in zip([0, *spos], [*spos, len(self)]))
+
+    def to_int(self, *, byteorder: Literal["little", "big"] = "big", signed: bool = False) -> int:
+        """Convert this view to an `int`.
+
+        Args:
+            byteorder: "little" or "big" (defaults to "big")
+            signed: determines whether two's complement is used to represent the integer. Default to False.
+
+        Returns:
+            an integer based on the binary value from this view
+
+        """
+        return int.from_bytes(self._view, byteorder, signed=signed)
+
+    def _run_codec(self, codec: StreamCodec) -> BinaPy:
+        # feed the codec chunk by chunk, so that a view on a memory-mapped file is only paged in progressively.
+        # Results are accumulated in a single buffer, so that only that buffer and the final BinaPy coexist.
+        result = bytearray()
+        for chunk in iter_chunks(self._view):
+            result += codec.update(chunk)
+        result += codec.finalize()
+        return BinaPy(result)
+
+    def encode_to(self, name: str, *args: Any, **kwargs: Any) -> BinaPy:
+        """Encode data from this view according to the format `name`.
+
+        If the extension has a streaming encoder, data is fed to it directly from this view.
+        Otherwise, the data is first materialized into a `BinaPy`.
+
+        Args:
+            name: format to use
+            *args: additional position parameters for the extension encoder method
+            **kwargs: additional keyword parameters for the extension encoder method
+
+        Returns:
+            the resulting data
+
+        """
+        try:
+            factory = BinaPy._get_stream_encoder(name)  # noqa: SLF001
+        except NotImplementedError:
+            return self.to_binapy().encode_to(name, *args, **kwargs)
+        return self._run_codec(factory(*args, **kwargs))
+
+    to = encode_to
+
+    def decode_from(self, name: str, *args: Any, **kwargs: Any) -> BinaPy:
+        """Decode data from this view according to the format `name`.
+
+        If the extension has a streaming decoder, data is fed to it directly from this view.
+        Otherwise, the data is first materialized into a `BinaPy`.
+
+        Args:
+            name: format to use
+            *args: additional position parameters for the extension decoder method
+            **kwargs: additional keyword parameters for the extension decoder method
+
+        Returns:
+            the resulting data
+
+        """
+        try:
+            factory = BinaPy._get_stream_decoder(name)  # noqa: SLF001
+        except NotImplementedError:
+            return self.to_binapy().decode_from(name, *args, **kwargs)
+        return self._run_codec(factory(*args, **kwargs))
+
+    def check(self, name: str, *, decode: bool = False, raise_on_error: bool = False) -> bool:
+        """Check that the data from this view conforms to a given format extension.
+
+        See `BinaPy.check()`. Small views are materialized into a `BinaPy` and checked with the extension checker.
+        Larger views are checked without materializing them whenever possible: first against the extension
+        alphabet, if it declares one, then, if the extension has a streaming decoder, by decoding them chunk by
+        chunk. Checkers that only depend on the length of the data are called with the underlying memoryview.
+        Note that this may be slightly stricter than the checker, for example with Base64url data that has an
+        invalid length, which the checker accepts but which can't be decoded.
+
+        Args:
+            name: the name of the extension to check
+            decode: if `True`, and the given extension does not have a checker method,
+                try to decode the data using the decoder method to check if that works.
+            raise_on_error: if `True`, exceptions from the checker method, if any,
+                will be raised instead of returning `False`.
+
+        Returns:
+            `True` if the data conforms to the given extension format, `False` otherwise.
+
+        """
+        if len(self._view) > DEFAULT_CHUNK_SIZE:
+            methods = BinaPy._get_extension_methods(name)  # noqa: SLF001
+            if not decode:
+                # raises an exception in case the extension does not have a checker
+                BinaPy._get_checker(name)  # noqa: SLF001
+            alphabet = BinaPy.alphabets.get(name)
+            if alphabet is not None and not all(alphabet.match(chunk) for chunk in iter_chunks(self._view)):
+                return False
+            if name in BinaPy.length_checkers and "check" in methods:
+                try:
+                    return bool(methods["check"](self._view))
+                except Exception as exc:
+                    if raise_on_error:
+                        raise exc from exc
+                    return False
+            if "decode_stream" in methods:
+                try:
+                    self._run_codec(_DiscardingCodec(methods["decode_stream"]()))
+                except Exception as exc:
+                    if raise_on_error:
+                        raise exc from exc
+                    return False
+                return True
+        return self.to_binapy().check(name, decode=decode, raise_on_error=raise_on_error)
+
+    def check_all(self, *, decode: bool = False) -> list[str]:
+        """Check if the data from this view conforms to any of the registered format extensions.
+
+        See `BinaPy.check_all()`, which ranks formats the same way. Large views are profiled chunk by chunk, and
+        checked with `check()` for extensions with a streaming decoder or a length-only checker. For the other
+        extensions, the data is materialized once into a `BinaPy`, and only if one of them is not ruled out by the
+        profile.
+
+        Args:
+            decode: if `True`, for extensions that don't have a checker method,
+                try to decode the data using the decoder method to check if that works.
+
+        Returns:
+            a list of format extensions that the data can be decoded from, from the most to the least likely.
+
+        """
+        if len(self._view) <= DEFAULT_CHUNK_SIZE:
+            return self.to_binapy().check_all(decode=decode)
+        materialized: list[BinaPy] = []
+
+        def check(name: str, *, decode: bool) -> bool:
+            methods = BinaPy._get_extension_methods(name)  # noqa: SLF001
+            if name in BinaPy.length_checkers or "decode_stream" in methods:
+                return self.check(name, decode=decode)
+            if not materialized:
+                materialized.append(self.to_binapy())
+            return materialized[0].check(name, decode=decode)
+
+        return [candidate.name for candidate in detect(self, decode=decode, check=check)]
+
+    def parse_from(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Parse data from this view, based on a given format extension.
+
+        The data is materialized into a `BinaPy` first.
+
+        Args:
+            name: name of the extension to use
+            *args: additional position parameters for the extension parser method
+            **kwargs: additional keyword parameters for the extension parser method
+
+        Returns:
+            the result from parsing the data
+
+        """
+        return self.to_binapy().parse_from(name, *args, **kwargs)
+
+
+class _DiscardingCodec:
+    """A `StreamCodec` wrapper that discards the results of another codec, to only check that it accepts some data.
+
+    If the wrapped codec has an `iter_update(data, max_length)` method, like `ZlibDecompressor`, it is used so that
+    at most `max_length` bytes of results are held in memory at once, even when decompressing a highly compressed
+    chunk.
+
+    """
+
+    def __init__(self, codec: StreamCodec, max_length: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize a _DiscardingCodec.
+
+        Args:
+            codec: the wrapped codec
+            max_length: maximum size of results to hold at once, for codecs that support it
+
+        """
+        self.codec = codec
+        self.max_length = max_length
+        self._iter_update: Callable[[bytes, int], Iterable[bytes]] | None = getattr(codec, "iter_update", None)
+
+    def update(self, data: bytes) -> bytes:
+        if self._iter_update is not None:
+            for _ in self._iter_update(data, self.max_length):
+                pass
+        else:
+            self.codec.update(data)
+        return b""
+
+    def finalize(self) -> bytes:
+        self.codec.finalize()
+        return b""
+
+
+def _call_safely(method: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any], value: bytes) -> Any:
+    """Call an extension method, and return the exception it raises instead of raising it.
+
+    Args:
+        method: the extension method
+        args: additional position parameters for the method
+        kwargs: additional keyword parameters for the method
+        value: the data to pass to the method
+
+    Returns:
+        the method result, or the exception it raised
+
+    """
+    try:
+        return method(value, *args, **kwargs)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
+def _apply_extension_safely(
+    feature: str,
+    name: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    value: bytes,
+) -> Any:
+    """Resolve and call an extension method by name. This is picklable, so it can be used with process pools.
+
+    Args:
+        feature: the extension feature, such as "encode"
+        name: the extension name
+        args: additional position parameters for the method
+        kwargs: additional keyword parameters for the method
+        value: the data to pass to the method
+
+    Returns:
+        the method result, or the exception it raised
+
+    """
+    method = getattr(BinaPy, BinaPy._FEATURE_GETTERS[feature])(name)  # noqa: SLF001
+    return _call_safely(method, args, kwargs, value)
+
+
+_PIPELINE_STEP = re.compile(r"^\s*(?:(\w+)\s*:)?\s*(.+?)\s*$", re.DOTALL)
+
+
+def _split_pipeline(spec: str) -> list[str]:
+    """Split a pipeline specification into steps, on each `|` that is not part of a step parameter.
+
+    Args:
+        spec: the pipeline specification, like `"b64u|deflate|json"`
+
+    Returns:
+        the list of steps
+
+    """
+    import io
+    import tokenize  # imported here, like `ast`, since it is only needed for pipelines
+
+    steps = []
+    start = depth = 0
+    offsets = [0]
+    for line in spec.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(spec).readline):
+            if token.type != tokenize.OP:
+                continue
+            if token.string in "([{":
+                depth += 1
+            elif token.string in ")]}":
+                depth -= 1
+            elif token.string == "|" and depth == 0:
+                position = offsets[token.start[0] - 1] + token.start[1]
+                steps.append(spec[start:position])
+                start = position + 1
+    except (tokenize.TokenError, SyntaxError):
+        # the remaining step is invalid, which is reported when it is parsed
+        pass
+    steps.append(spec[start:])
+    return steps
+
+
+def _parse_pipeline_step(step: str) -> tuple[str | None, str, list[Any], dict[str, Any]]:
+    """Parse a pipeline step like `"decode:zlib"` or `"shake256(512)"`.
+
+    Args:
+        step: the step to parse
+
+    Returns:
+        a tuple of (feature, extension name, args, kwargs). Feature is `None` if not specified.
+
+    Raises:
+        ValueError: if the step is not valid
+
+    """
+    import ast  # imported here, since it is slow to import and only needed for pipelines
+
+    match = _PIPELINE_STEP.match(step)
+    try:
+        if match is None:
+            raise ValueError  # noqa: TRY301
+        feature, call = match.groups()
+        node = ast.parse(call, mode="eval").body
+        if isinstance(node, ast.Name):
+            return feature, node.id, [], {}
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            args = [ast.literal_eval(arg) for arg in node.args]
+            kwargs = {}
+            for kw in node.keywords:
+                if kw.arg is None:  # **kwargs
+                    raise ValueError  # noqa: TRY301
+                kwargs[kw.arg] = ast.literal_eval(kw.value)
+            return feature, node.func.id, args, kwargs
+        raise ValueError  # noqa: TRY301
+    except (SyntaxError, ValueError):
+        msg = f"Invalid pipeline step: '{step}'"
+        raise ValueError(msg) from None
+
+
+class Pipeline:
+    """A compiled chain of transformations, as returned by `BinaPy.pipeline()`.
+
+    Calling a `Pipeline` with some data applies all its steps in order, and returns the result.
+    Steps are applied like `encode_to()`, `decode_from()`, `parse_from()` or `serialize_to()` would, so they are
+    visible to the observers and the cache registered on `BinaPy`. When there are none, intermediate results are
+    passed as-is from one extension function to the next, and only the final result is wrapped into a `BinaPy`,
+    which avoids a copy of the data per step.
+
+    """
+
+    def __init__(self, steps: list[tuple[str, str, Callable[..., Any], tuple[Any, ...], dict[str, Any]]]) -> None:
+        """Initialize a Pipeline.
+
+        Args:
+            steps: a list of (feature, extension name, method, args, kwargs)
+
+        """
+        if not steps:
+            msg = "A pipeline must have at least one step"
+            raise ValueError(msg)
+        self.steps = steps
+        # the undecorated extension functions, for the intermediate steps
+        self._raw_steps = [
+            (feature, name, getattr(method, "__wrapped__", method), args, kwargs)
+            for feature, name, method, args, kwargs in steps[:-1]
+        ]
+
+    def __repr__(self) -> str:
+        """Return a representation of this pipeline, with all its steps.
+
+        Returns:
+            a string representation
+
+        """
+        return f"{self.__class__.__name__}({'|'.join(f'{feature}:{name}' for feature, name, *_ in self.steps)!r})"
+
+    def __call__(self, data: Any) -> Any:
+        """Apply this pipeline to some data.
+
+        Args:
+            data: the input data. Usually bytes, or any Python object if the first step is a serializer.
+
+        Returns:
+            the result from the last step. It is a `BinaPy` if the last step produces binary data.
+
+        """
+        if not BinaPy._hooked:  # noqa: SLF001
+            for feature, name, func, args, kwargs in self._raw_steps:
+                data = func(data, *args, **kwargs)
+                if feature == "encode" and isinstance(data, str):
+                    data = data.encode()
+                elif not isinstance(data, (bytes, bytearray)):
+                    msg = f"extension {name} {feature}r method did not return binary data"
+                    raise InvalidExtensionMethodError(msg)
+            _, _, method, args, kwargs = self.steps[-1]
+            return method(data, *args, **kwargs)
+        for feature, name, method, args, kwargs in self.steps:
+            if feature == "serialize":
+                data = BinaPy._dispatch(name, feature, method, None, (data, *args), kwargs)  # noqa: SLF001
+            else:
+                data = BinaPy._dispatch(name, feature, method, data, args, kwargs)  # noqa: SLF001
+        return data
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class InvalidExtensionMethodError(ValueError):
+    """Raised when an extension method returns invalid data."""
+
+
+def binapy_encoder(name: str) -> Callable[[F], F]:
+    """Declare new encoders for BinaPy.
+
+    This is a method decorator. Encoders do convert a BinaPy into another BinaPy using a given format/extension.
+
+    Args:
+    ----
+        name: name of the extension
+
+    Returns:
+    -------
+        a method decorator
+
+    Usage:
+        To declare a special "double-encoding" which just copy the data twice:
+
+        ```python
+        from binapy import binapy_encoder
+
+
+        @binapy_encoder("double")
+        def double_encode(data: bytes) -> bytes:
+            return data * 2
+
+
+        assert BinaPy(b"abc").to("double") == b"abcabc"
+        ```
+
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> BinaPy:
+            raw_result = func(*args, **kwargs)
+            if not isinstance(raw_result, (bytes, bytearray, str)):
+                msg = f"extension {name} encoder method did not return binary data"
+                raise InvalidExtensionMethodError(msg)
+            return BinaPy(raw_result)
+
+        BinaPy.register_extension(name, "encode", wrapper)
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def binapy_decoder(name: str) -> Callable[[F], F]:
+    """Declare a new decoder for BinaPy.
+
+    This is a method decorator. Decoders do convert BinaPy data from a given format into another BinaPy.
+
+    Args:
+    ----
+        name: name of the extension
+
+    Returns:
+    -------
+        a method decorator
+
+    Usage:
+        The matching decoder for the special "double-encoding" we created with `binapy_encoder()`:
+
+        ```python
+        from binapy import binapy_decoder
+
+
+        @binapy_decoder("double")
+        def double_decode(data: bytes) -> bytes:
+            if len(data) % 2 or data[: len(data) // 2] != data[len(data) // 2 :]:
+                raise ValueError("This is not a double-encoded data!")
+            return data[: len(data) // 2]
+
+
+        assert BinaPy(b"abcabc").decode_from("double") == b"abc"
+        ```
+
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> BinaPy:
+            raw_result = func(*args, **kwargs)
+            if not isinstance(raw_result, (bytes, bytearray)):
+                msg = f"extension {name} decoder method did not return binary data"
                 raise InvalidExtensionMethodError(msg)
             return BinaPy(raw_result)
 
@@ -652,14 +2065,29 @@ def binapy_decoder(name: str) -> Callable[[F], F]:
     return decorator
 
 
-def binapy_checker(name: str) -> Callable[[F], F]:
+def binapy_checker(
+    name: str,
+    *,
+    alphabet: CharClass | str | bytes | None = None,
+    length_only: bool = False,
+) -> Callable[[F], F]:
     """Declare a new checker for BinaPy.
 
     This is a decorator. Checker checks that some data is valid for a given format/extension.
 
+    Formats that only allow a given set of characters may declare it with `alphabet`. This is registered in
+    `BinaPy.alphabets`, which allows quickly ruling out that format for data that contains other characters,
+    without calling the checker.
+
+    Checkers that only look at the length of the data may declare it with `length_only`. They are registered in
+    `BinaPy.length_checkers`, and may then be called with any object that supports `len()`, such as a
+    `memoryview`, which allows checking large views without copying them.
+
     Args:
     ----
         name: name of the extension
+        alphabet: the characters that data in this format may contain, if restricted
+        length_only: `True` if the checker only depends on the length of the data
 
     Returns:
     -------
@@ -693,6 +2121,12 @@ def binapy_checker(name: str) -> Callable[[F], F]:
             return raw_result
 
         BinaPy.register_extension(name, "check", wrapper)
+        if alphabet is not None:
+            BinaPy.alphabets[name] = alphabet if isinstance(alphabet, CharClass) else CharClass(alphabet)
+        if length_only:
+            BinaPy.length_checkers.add(name)
+        else:
+            BinaPy.length_checkers.discard(name)
         return cast(F, wrapper)
 
     return decorator
@@ -750,3 +2184,64 @@ def binapy_parser(name: str) -> Callable[[F], F]:
         return func
 
     return decorator
+
+
+def binapy_stream_encoder(name: str) -> Callable[[F], F]:
+    """Declare a new streaming encoder for BinaPy.
+
+    This is a decorator for a factory that returns a `StreamCodec`, such as a class implementing
+    `update()` and `finalize()`. The factory takes the same additional parameters as the regular encoder for the
+    same extension, and the concatenation of all chunks it produces must be the same as the regular encoder result.
+
+    Args:
+    ----
+        name: name of the extension
+
+    Returns:
+    -------
+        a decorator
+
+    Usage:
+        A streaming version of the "double" encoding can't be done, but upper-casing can:
+
+        ```python
+        from binapy import BlockCodec, binapy_stream_encoder
+
+
+        @binapy_stream_encoder("upper")
+        def upper_stream() -> BlockCodec:
+            return BlockCodec(lambda data: bytes(data).upper(), 1)
+
+
+        assert b"".join(BinaPy.encode_stream("upper", [b"ab", b"c"])) == b"ABC"
+        ```
+
+    """
+
+    def decorator(func: F) -> F:
+        BinaPy.register_extension(name, "encode_stream", func)
+        return func
+
+    return decorator
+
+
+def binapy_stream_decoder(name: str) -> Callable[[F], F]:
+    """Declare a new streaming decoder for BinaPy.
+
+    This is a decorator for a factory that returns a `StreamCodec`. See `binapy_stream_encoder()`.
+
+    Args:
+    ----
+        name: name of the extension
+
+    Returns:
+    -------
+        a decorator
+
+    """
+
+    def decorator(func: F) -> F:
+        BinaPy.register_extension(name, "decode_stream", func)
+        return func
+
+    return decorator
@@ -0,0 +1,228 @@
+"""This module contains an opt-in memoization cache for BinaPy extension calls.
+
+When a `Cache` is enabled, results of `encode_to()`, `decode_from()`, `check()`, `parse_from()` and `serialize_to()`
+are memoized, for the extensions that are enabled in that cache, keyed by extension name, feature, parameters and
+input data. Least recently used results are evicted once the cache exceeds a given total size.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+DETERMINISTIC_EXTENSIONS = frozenset(
+    (
+        *("b32", "b64", "b64u", "hex", "url"),
+        *("atbash", "caesar", "rot13", "rot47", "vigenere", "xor"),
+        *("deflate", "zlib"),
+        *("sha1", "sha256", "sha384", "sha512", "shake128", "shake256"),
+        *("ssha1", "ssha256", "ssha384", "ssha512", "sshake128", "sshake256"),
+        "json",
+    ),
+)
+"""Built-in extensions that are cached by default.
+
+Their results only depend on their input data and parameters. "pickle" is excluded, since unpickling may have side
+effects."""
+
+_IMMUTABLE_TYPES = (bytes, str, int, float, complex, bool, type(None))
+
+
+def _typed(value: Any) -> Any:
+    """Make a cache key part that also depends on the types of a value and of its items.
+
+    Values such as `1`, `1.0` and `True` are equal and have the same hash, but extensions may produce different
+    results for each of them, so they must not share cache entries.
+
+    Args:
+        value: a parameter value
+
+    Returns:
+        a hashable key part, if the value is hashable
+
+    """
+    if isinstance(value, tuple):
+        return type(value), tuple(_typed(item) for item in value)
+    if isinstance(value, frozenset):
+        return type(value), frozenset(_typed(item) for item in value)
+    return type(value), value
+
+
+class CacheStats(NamedTuple):
+    """Statistics about a `Cache`, as returned by `Cache.stats()`."""
+
+    hits: int
+    """Number of calls that were answered from the cache."""
+    misses: int
+    """Number of cacheable calls that were not in the cache."""
+    evictions: int
+    """Number of results that were evicted from the cache."""
+    entries: int
+    """Number of results currently in the cache."""
+    size: int
+    """Estimated total size of the cache, in bytes."""
+
+
+class Cache:
+    """A LRU cache for the results of extension calls, bounded by total size.
+
+    Results that are immutable, such as `BinaPy` or `bool`, are shared between calls. Other results, such as the
+    `dict` returned by the JSON parser, are deep-copied when they are cached and each time they are returned, so that
+    callers can't alter cached results.
+
+    Usage:
+        ```python
+        cache = Cache(max_size=16 * 1024 * 1024)
+        with cache:
+            BinaPy(payload).to("sha256")
+            BinaPy(payload).to("sha256")  # answered from the cache
+        cache.stats()
+        # CacheStats(hits=1, misses=1, evictions=0, entries=1, size=...)
+        ```
+
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024, extensions: Iterable[str] | None = None) -> None:
+        """Initialize a Cache.
+
+        Args:
+            max_size: maximum total size of cached input data and results, in bytes
+            extensions: names of the extensions to cache. Those must be deterministic. Defaults to
+                `DETERMINISTIC_EXTENSIONS`. This is available as the `extensions` attribute, which can be modified
+                later.
+
+        """
+        self.max_size = max_size
+        self.extensions = set(DETERMINISTIC_EXTENSIONS if extensions is None else extensions)
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def call(  # noqa: PLR0913
+        self,
+        name: str,
+        feature: str,
+        method: Callable[..., Any],
+        data: bytes | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call an extension method, or return its cached result.
+
+        Args:
+            name: the extension name
+            feature: the called feature
+            method: the extension method
+            data: the input data, or `None` for serializers
+            args: additional position parameters for the method
+            kwargs: additional keyword parameters for the method
+
+        Returns:
+            the method result
+
+        """
+        if name not in self.extensions:
+            return method(*args, **kwargs) if data is None else method(data, *args, **kwargs)
+        typed_kwargs = tuple((param, _typed(value)) for param, value in sorted(kwargs.items()))
+        key = (name, feature, data, _typed(args), typed_kwargs)
+        try:
+            hash(key)
+        except TypeError:  # some parameters are not hashable
+            return method(*args, **kwargs) if data is None else method(data, *args, **kwargs)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is not None:
+            result = entry[0]
+            return result if isinstance(result, _IMMUTABLE_TYPES) else deepcopy(result)
+
+        result = method(*args, **kwargs) if data is None else method(data, *args, **kwargs)
+        input_size = len(data) if data is not None else 0
+        cached: Any
+        if isinstance(result, (bytes, bytearray)):
+            size = input_size + len(result)
+            # a bytearray is copied when it is stored, like other mutable results, and when it is returned on a hit
+            cached = result if isinstance(result, bytes) else bytearray(result)
+        else:
+            size = 2 * input_size
+            cached = result if isinstance(result, _IMMUTABLE_TYPES) else deepcopy(result)
+        if size <= self.max_size:
+            self._store(key, cached, size)
+        return result
+
+    def _store(self, key: Hashable, result: Any, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (result, size)
+            self._size += size
+            while self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Return statistics about this cache.
+
+        Returns:
+            the hit, miss and eviction counts, and the current number of entries and size
+
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size)
+
+    def clear(self) -> None:
+        """Discard all cached results, and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+
+    def enable(self) -> None:
+        """Start caching extension calls, by making this the cache used by `BinaPy`."""
+        from .binapy import BinaPy
+
+        BinaPy.set_cache(self)
+
+    def disable(self) -> None:
+        """Stop caching extension calls, if this is the cache used by `BinaPy`."""
+        from .binapy import BinaPy
+
+        if BinaPy._cache is self:  # noqa: SLF001
+            BinaPy.set_cache(None)
+
+    def __enter__(self) -> Self:
+        """Start caching extension calls.
+
+        Returns:
+            this Cache
+
+        """
+        self.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop caching extension calls."""
+        self.disable()
@@ -0,0 +1,171 @@
+"""This module contains a table-driven engine to validate the characters that binary data is made of.
+
+Most text-based formats, such as Base64 or hexadecimal, only allow a given set of characters.
+Checking that some data contains only those characters is done at C speed with `bytes.translate()`,
+using a precomputed table of allowed bytes, instead of iterating over the data in Python.
+
+"""
+
+from __future__ import annotations
+
+import string
+from functools import lru_cache
+from typing import Iterable
+
+
+class CharClass:
+    """A set of allowed bytes, which can check binary data at C speed.
+
+    Attributes:
+        chars: the allowed bytes, sorted
+        table: a 256-entry table, with 1 for allowed bytes and 0 for others
+
+    Usage:
+        ```python
+        HEX = CharClass("0123456789abcdefABCDEF")
+        HEX.match(b"c0ffee")
+        # True
+        HEX.match(b"coffee")
+        # False
+        ```
+
+    """
+
+    __slots__ = ("chars", "table")
+
+    def __init__(self, chars: str | bytes | Iterable[int]) -> None:
+        """Initialize a CharClass.
+
+        Args:
+            chars: the allowed characters, as a `str` (which must contain only ASCII characters),
+                as `bytes`, or as an iterable of byte values.
+
+        """
+        if isinstance(chars, str):
+            chars = chars.encode("ascii")
+        allowed = frozenset(chars)
+        self.chars = bytes(sorted(allowed))
+        self.table = bytes(1 if c in allowed else 0 for c in range(256))
+
+    def __repr__(self) -> str:
+        """Return a representation of this CharClass.
+
+        Returns:
+            a string representation
+
+        """
+        return f"{self.__class__.__name__}({self.chars!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this CharClass with another.
+
+        Args:
+            other: another CharClass
+
+        Returns:
+            `True` if both allow the same bytes
+
+        """
+        if isinstance(other, CharClass):
+            return self.chars == other.chars
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash this CharClass, based on its allowed bytes.
+
+        Returns:
+            a hash value
+
+        """
+        return hash(self.chars)
+
+    def __len__(self) -> int:
+        """Return the number of allowed bytes.
+
+        Returns:
+            the number of allowed bytes
+
+        """
+        return len(self.chars)
+
+    def __contains__(self, c: int) -> bool:
+        """Check if a single byte value is allowed.
+
+        Args:
+            c: a byte value
+
+        Returns:
+            `True` if `c` is allowed
+
+        """
+        return bool(self.table[c])
+
+    def __or__(self, other: CharClass) -> CharClass:
+        """Return the union of 2 CharClasses.
+
+        Args:
+            other: another CharClass
+
+        Returns:
+            a CharClass allowing the bytes from both
+
+        """
+        return self.__class__(self.chars + other.chars)
+
+    def match(self, data: bytes | bytearray | memoryview) -> bool:
+        """Check that `data` contains only allowed bytes.
+
+        Args:
+            data: the data to check
+
+        Returns:
+            `True` if all bytes from `data` are allowed. This is `True` for an empty data.
+
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return not data.translate(None, self.chars)
+
+    __call__ = match
+
+
+@lru_cache(maxsize=None)
+def is_ascii_compatible(encoding: str) -> bool:
+    """Check if an encoding encodes ASCII characters like ASCII does.
+
+    This is the case for "utf-8", "latin-1", "cp1252", etc. but not for "utf-16" or EBCDIC-based encodings.
+
+    Args:
+        encoding: the encoding name
+
+    Returns:
+        `True` if the encoding is ASCII-compatible
+
+    """
+    ascii_chars = "".join(chr(c) for c in range(128))
+    try:
+        return ascii_chars.encode(encoding) == ascii_chars.encode("ascii")
+    except UnicodeError:
+        return False
+
+
+ALPHANUMERIC = CharClass(string.ascii_letters + string.digits)
+"""ASCII letters and digits."""
+
+PRINTABLE = CharClass(range(32, 127))
+"""Printable ASCII characters, including space but excluding other whitespace."""
+
+URLSAFE = ALPHANUMERIC | CharClass("_.-~")
+"""Unreserved characters from RFC3986, that don't need to be url-encoded."""
+
+HEX = CharClass(string.hexdigits)
+"""Hexadecimal digits, both lower and uppercase."""
+
+BASE64 = ALPHANUMERIC | CharClass("+/=")
+"""Base64 characters, including padding."""
+
+BASE64URL = ALPHANUMERIC | CharClass("-_=")
+"""Base64-url characters, including padding."""
+
+BASE32 = CharClass(string.ascii_uppercase + "234567=")
+"""Base32 characters, including padding."""
@@ -0,0 +1,249 @@
+"""Command line interface for BinaPy.
+
+This applies a chain of transformations to data from stdin or a file, and writes the result to stdout or a file.
+Steps use the same syntax as `BinaPy.pipeline()`, like `decode:b64`, `zlib` or `shake256(64)`, and are applied in
+order. Steps without an explicit feature encode their input, unless `--decode` is given.
+
+Data is streamed in fixed-size chunks through all steps whose extension has a streaming codec, so that memory use
+stays bounded. Other steps buffer their whole input before applying the extension.
+
+Run with `binapy --help`, or `python -m binapy --help`, for usage.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import IO, Any, Callable, Iterable, Iterator, Sequence
+
+from .binapy import DEFAULT_CHUNK_SIZE, BinaPy, StreamCodec, _parse_pipeline_step, iter_chunks
+
+STEP_FEATURES = ("encode", "decode")
+"""Features that can be used in steps."""
+
+
+class _BufferingCodec:
+    """A `StreamCodec` for extensions that can't stream, which buffers all data and processes it on `finalize()`.
+
+    Args:
+        method: the extension method
+        args: additional position parameters for the method
+        kwargs: additional keyword parameters for the method
+
+    """
+
+    def __init__(self, method: Callable[..., bytes], args: Sequence[Any], kwargs: dict[str, Any]) -> None:
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self._buffer = bytearray()
+
+    def update(self, data: bytes) -> bytes:
+        self._buffer += data
+        return b""
+
+    def finalize(self) -> bytes:
+        buffer, self._buffer = bytes(self._buffer), bytearray()
+        return self.method(buffer, *self.args, **self.kwargs)
+
+
+def parse_size(size: str) -> int:
+    """Parse a size such as "16", "64K" or "16M" into a number of bytes.
+
+    Args:
+        size: the size, with an optional "K", "M" or "G" suffix
+
+    Returns:
+        the size in bytes
+
+    """
+    size = size.strip().upper().rstrip("B")
+    for suffix, shift in (("K", 10), ("M", 20), ("G", 30)):
+        if size.endswith(suffix):
+            return int(size[:-1]) << shift
+    return int(size)
+
+
+def make_codec(step: str, *, feature: str = "encode") -> StreamCodec:
+    """Make a `StreamCodec` for a step.
+
+    Args:
+        step: the step, like `"[feature:]name[(args)]"`
+        feature: the feature to use if the step does not specify one
+
+    Returns:
+        the streaming codec from the extension, if it has one, or a codec that buffers all data otherwise
+
+    Raises:
+        ValueError: if the step is not valid
+        TypeError: if the step parameters are not accepted by the streaming codec factory
+        NotImplementedError: if the extension does not exist, or does not have the requested feature
+
+    """
+    step_feature, name, args, kwargs = _parse_pipeline_step(step)
+    step_feature = step_feature or feature
+    if step_feature not in STEP_FEATURES:
+        msg = f"Invalid feature '{step_feature}' in step '{step}', must be one of {', '.join(STEP_FEATURES)}"
+        raise ValueError(msg)
+    methods = BinaPy._get_extension_methods(name)  # noqa: SLF001
+    factory = methods.get(f"{step_feature}_stream")
+    if factory is not None:
+        return factory(*args, **kwargs)  # type: ignore[no-any-return]
+    method = methods.get(step_feature)
+    if method is None:
+        msg = f"Extension '{name}' does not have a {step_feature} method"
+        raise NotImplementedError(msg)
+    return _BufferingCodec(method, args, kwargs)
+
+
+def transform(codecs: Sequence[StreamCodec], chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Stream chunks of data through a chain of codecs.
+
+    Args:
+        codecs: the codecs to apply, in order
+        chunks: the input data
+
+    Returns:
+        an iterator of output chunks
+
+    """
+    for chunk in chunks:
+        for codec in codecs:
+            if not chunk:
+                break
+            chunk = codec.update(chunk)  # noqa: PLW2901
+        if chunk:
+            yield chunk
+    for index, codec in enumerate(codecs):
+        # flush each codec, and feed the result through the next ones
+        chunk = codec.finalize()
+        for next_codec in codecs[index + 1 :]:
+            if not chunk:
+                break
+            chunk = next_codec.update(chunk)
+        if chunk:
+            yield chunk
+
+
+def list_extensions(output: IO[str]) -> None:
+    """Write the available extensions and their features.
+
+    Args:
+        output: the text file where to write the list
+
+    """
+    BinaPy.load_extensions()
+    width = max(len(name) for name in BinaPy.extensions)
+    for name, methods in sorted(BinaPy.extensions.items()):
+        output.write(f"{name.ljust(width)}  {' '.join(sorted(methods))}\n")
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    """Make the command line parser.
+
+    Returns:
+        the parser
+
+    """
+    parser = argparse.ArgumentParser(prog="binapy", description=__doc__.splitlines()[0])
+    parser.add_argument("steps", nargs="*", metavar="STEP", help="steps to apply, like decode:b64, zlib or sha256")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("-l", "--list", action="store_true", help="list available extensions and their features")
+    mode.add_argument("-c", "--check", action="store_true", help="list the formats that the input conforms to")
+    parser.add_argument("-d", "--decode", action="store_true", help="decode instead of encoding by default")
+    parser.add_argument("-i", "--input", default="-", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument(
+        "--chunk-size",
+        type=parse_size,
+        default=DEFAULT_CHUNK_SIZE,
+        help="size of chunks to read, like 64K or 1M",
+    )
+    return parser
+
+
+def check_formats(source: str, *, decode: bool = False) -> list[str]:
+    """List the formats that some input conforms to.
+
+    Files are memory-mapped, so that large files are checked without reading them entirely in memory whenever
+    possible. See `BinaPyView.check_all()`.
+
+    Args:
+        source: path to the input file, or "-" for stdin
+        decode: if `True`, for extensions that don't have a checker method, try to decode the input
+
+    Returns:
+        the formats, from the most to the least likely
+
+    """
+    if source == "-":
+        return BinaPy(sys.stdin.buffer.read()).check_all(decode=decode)
+    return BinaPy.from_file(source).check_all(decode=decode)
+
+
+def _run(codecs: Sequence[StreamCodec], source: str, output_path: str, chunk_size: int) -> int:
+    """Stream the input through codecs, and write the result.
+
+    Args:
+        codecs: the codecs to apply, in order
+        source: path to the input file, or "-" for stdin
+        output_path: path to the output file, or "-" for stdout
+        chunk_size: size of chunks to read
+
+    Returns:
+        the exit status
+
+    """
+    output = sys.stdout.buffer if output_path == "-" else open(output_path, "wb")  # noqa: SIM115, PTH123
+    try:
+        for chunk in transform(codecs, iter_chunks(sys.stdin.buffer if source == "-" else source, chunk_size)):
+            output.write(chunk)
+        output.flush()
+    except BrokenPipeError:  # the reader exited, like `head` does
+        return 1
+    except Exception as exc:  # noqa: BLE001
+        print(f"binapy: error: {exc}", file=sys.stderr)  # noqa: T201
+        return 1
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point for the `binapy` command.
+
+    Args:
+        argv: command line arguments
+
+    Returns:
+        the exit status
+
+    """
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_extensions(sys.stdout)
+        return 0
+
+    if args.check:
+        if args.steps:
+            parser.error("steps can't be used with --check")
+        formats = check_formats(args.input, decode=args.decode)
+        for name in formats:
+            print(name)  # noqa: T201
+        return 0 if formats else 1
+
+    if not args.steps:
+        parser.error("at least one step is required")
+    try:
+        codecs = [make_codec(step, feature="decode" if args.decode else "encode") for step in args.steps]
+    except (ValueError, TypeError, NotImplementedError) as exc:  # TypeError on invalid step parameters
+        parser.error(str(exc))
+    return _run(codecs, args.input, args.output, args.chunk_size)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
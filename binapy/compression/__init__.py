@@ -1,3 +1 @@
 """This module contains compression related utilities."""
-
-from . import zlib  # noqa: F401
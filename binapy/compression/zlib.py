@@ -1,23 +1,291 @@
 """This module contains helpers for compressing/decompressing data using `zlib`."""
 
+from __future__ import annotations
+
+import os
+import sys
 import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from binapy import binapy_decoder, binapy_encoder, binapy_stream_decoder, binapy_stream_encoder
+
+
+class ZlibCompressor:
+    """Incremental compressor, based on `zlib.compressobj()`."""
+
+    def __init__(self, level: int = -1, wbits: int = zlib.MAX_WBITS) -> None:
+        """Initialize a ZlibCompressor.
+
+        Args:
+            level: the compression level
+            wbits: the window size and container format, with the same semantics as `zlib.compressobj()`.
+                Use a negative value to produce a raw DEFLATE stream, without zlib header and checksum.
+
+        """
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def update(self, data: bytes) -> bytes:
+        """Compress a chunk of data.
+
+        Args:
+            data: the data to compress
+
+        Returns:
+            the compressed data that is available so far
+
+        """
+        return self._compressobj.compress(data)
+
+    def finalize(self) -> bytes:
+        """Flush the remaining compressed data.
+
+        Returns:
+            the remaining compressed data
+
+        """
+        return self._compressobj.flush()
+
+
+class ZlibDecompressor:
+    """Incremental decompressor, based on `zlib.decompressobj()`."""
+
+    def __init__(self, wbits: int = zlib.MAX_WBITS) -> None:
+        """Initialize a ZlibDecompressor.
+
+        Args:
+            wbits: the window size and container format, with the same semantics as `zlib.decompressobj()`.
+
+        """
+        self._decompressobj = zlib.decompressobj(wbits)
+
+    def update(self, data: bytes) -> bytes:
+        """Decompress a chunk of data.
+
+        Args:
+            data: the data to decompress
+
+        Returns:
+            the decompressed data that is available so far
+
+        """
+        return self._decompressobj.decompress(data)
+
+    def iter_update(self, data: bytes, max_length: int) -> Iterator[bytes]:
+        """Decompress a chunk of data, in pieces of bounded size.
+
+        Unlike `update()`, this never holds more than `max_length` bytes of decompressed data at once, even if `data`
+        is highly compressed.
+
+        Args:
+            data: the data to decompress
+            max_length: maximum size of each piece of decompressed data
+
+        Returns:
+            an iterator over the decompressed data that is available so far
+
+        """
+        piece = self._decompressobj.decompress(data, max_length)
+        while True:
+            if piece:
+                yield piece
+            # the output may be truncated even if all input was consumed, so also continue when it hit the limit
+            if not self._decompressobj.unconsumed_tail and len(piece) < max_length:
+                return
+            piece = self._decompressobj.decompress(self._decompressobj.unconsumed_tail, max_length)
+
+    def finalize(self) -> bytes:
+        """Flush the remaining decompressed data.
+
+        Returns:
+            the remaining decompressed data
+
+        Raises:
+            zlib.error: if the compressed stream is incomplete
+
+        """
+        result = self._decompressobj.flush()
+        if not self._decompressobj.eof:
+            msg = "incomplete or truncated stream"
+            raise zlib.error(msg)
+        return result
+
+
+_ADLER_BASE = 65521
+_WINDOW_SIZE = 32 * 1024
+DEFAULT_BLOCK_SIZE = 128 * 1024
+"""Default size of blocks of data that are compressed in parallel."""
+
+
+def adler32_combine(adler1: int, adler2: int, len2: int) -> int:
+    """Combine two Adler-32 checksums into the checksum of the concatenated data.
+
+    This is the same as `adler32_combine()` from the `zlib` C library, which is not exposed by Python.
+
+    Args:
+        adler1: the Adler-32 checksum of the first part of the data
+        adler2: the Adler-32 checksum of the second part of the data
+        len2: the length of the second part of the data
+
+    Returns:
+        the Adler-32 checksum of both parts of the data concatenated
+
+    """
+    rem = len2 % _ADLER_BASE
+    sum1 = adler1 & 0xFFFF
+    sum2 = (adler1 >> 16) + (adler2 >> 16) + rem * (sum1 - 1)
+    sum1 += (adler2 & 0xFFFF) - 1
+    return (sum1 % _ADLER_BASE) | ((sum2 % _ADLER_BASE) << 16)
+
+
+def _zlib_header(level: int) -> bytes:
+    """Return the 2-bytes zlib header that `zlib` produces for a given compression level.
+
+    Args:
+        level: the compression level
+
+    Returns:
+        the zlib header
+
+    """
+    if level == -1:
+        level = 6
+    flevel = 0 if level < 2 else 1 if level < 6 else 2 if level == 6 else 3
+    cmf, flg = 0x78, flevel << 6
+    flg += 31 - ((cmf << 8) | flg) % 31
+    return bytes((cmf, flg))
 
-from binapy import binapy_decoder, binapy_encoder
+
+def _compress_block(  # noqa: PLR0913
+    bp: memoryview,
+    start: int,
+    end: int,
+    level: int,
+    *,
+    last: bool,
+    prime: bool,
+) -> tuple[bytes, int, int]:
+    """Compress a single block of data as part of a raw DEFLATE stream.
+
+    Args:
+        bp: the whole data
+        start: start index of the block
+        end: end index of the block
+        level: the compression level
+        last: `True` if this is the last block of the stream
+        prime: if `True`, use the previous 32 KB of data as dictionary
+
+    Returns:
+        a tuple of (compressed block, Adler-32 checksum of the block, length of the block)
+
+    """
+    if prime and start > 0:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, zdict=bp[max(0, start - _WINDOW_SIZE) : start])
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    block = bp[start:end]
+    compressed = compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_FULL_FLUSH)
+    return compressed, zlib.adler32(block), end - start
+
+
+def _parallel_compress(
+    bp: bytes,
+    level: int,
+    workers: int,
+    block_size: int,
+    *,
+    prime: bool,
+) -> tuple[list[bytes], int]:
+    """Compress data into a raw DEFLATE stream, using multiple threads.
+
+    Data is split into blocks that are compressed concurrently. Each block but the last ends with a full flush,
+    which aligns it on a byte boundary, so that the compressed blocks can be concatenated into a valid stream.
+    This is the technique used by `pigz`.
+
+    Args:
+        bp: the data to compress
+        level: the compression level
+        workers: the number of threads to use
+        block_size: the size of each block
+        prime: if `True`, each block is compressed with the previous 32 KB of data as dictionary,
+            for a better compression ratio
+
+    Returns:
+        a tuple of (compressed blocks, Adler-32 checksum of the whole data)
+
+    """
+    view = memoryview(bp)
+    starts = range(0, max(len(view), 1), block_size)
+    last_start = starts[-1]
+    with ThreadPoolExecutor(workers) as executor:
+        results = list(
+            executor.map(
+                lambda start: _compress_block(
+                    view,
+                    start,
+                    start + block_size,
+                    level,
+                    last=start == last_start,
+                    prime=prime,
+                ),
+                starts,
+            ),
+        )
+    adler = 1
+    for _, block_adler, block_len in results:
+        adler = adler32_combine(adler, block_adler, block_len)
+    return [compressed for compressed, _, _ in results], adler
+
+
+def _workers(workers: int) -> int:
+    return workers if workers > 0 else os.cpu_count() or 1
 
 
 @binapy_encoder("zlib")
-def compress_zlib(bp: bytes, level: int = 6) -> bytes:
+def compress_zlib(
+    bp: bytes,
+    level: int = 6,
+    *,
+    workers: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    prime: bool = True,
+) -> bytes:
     """Compress some data using `zlib`.
 
+    Large data can be compressed using multiple threads, by passing `workers`.
+    The result is still a single valid zlib stream, but it is not byte-for-byte identical to single-threaded
+    compression.
+
     Args:
         bp: the data to compress
         level: the compression level to use
+        workers: the number of threads to use. Use 0 for one thread per CPU.
+        block_size: the size of blocks of data that are compressed in parallel
+        prime: if `True`, each block is compressed with the previous 32 KB of data as dictionary
 
     Returns:
         the compressed data
 
     """
-    return zlib.compress(bp, level)
+    workers = _workers(workers)
+    if workers == 1 or len(bp) <= block_size:
+        return zlib.compress(bp, level)
+    blocks, adler = _parallel_compress(bp, level, workers, block_size, prime=prime)
+    return b"".join((_zlib_header(level), *blocks, adler.to_bytes(4, "big")))
+
+
+@binapy_stream_encoder("zlib")
+def compress_zlib_stream(level: int = 6) -> ZlibCompressor:
+    """Incrementally compress some data using `zlib`.
+
+    Args:
+        level: the compression level to use
+
+    Returns:
+        a `ZlibCompressor`
+
+    """
+    return ZlibCompressor(level)
 
 
 @binapy_decoder("zlib")
@@ -34,21 +302,63 @@ def decompress_zlib(bp: bytes) -> bytes:
     return zlib.decompress(bp)
 
 
+@binapy_stream_decoder("zlib")
+def decompress_zlib_stream() -> ZlibDecompressor:
+    """Incrementally decompress some data using zlib.
+
+    Returns:
+        a `ZlibDecompressor`
+
+    """
+    return ZlibDecompressor()
+
+
 @binapy_encoder("deflate")
-def compress_deflate(bp: bytes, level: int = -1) -> bytes:
+def compress_deflate(
+    bp: bytes,
+    level: int = -1,
+    *,
+    workers: int = 1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    prime: bool = True,
+) -> bytes:
     """Compress data using DEFLATE.
 
     Notably, this is the algorithm used to compress `SAMLRequest` when using the Redirect Binding.
+    Large data can be compressed using multiple threads, by passing `workers`. See `compress_zlib()`.
 
     Args:
         bp: the data to compress
         level: the compression level
+        workers: the number of threads to use. Use 0 for one thread per CPU.
+        block_size: the size of blocks of data that are compressed in parallel
+        prime: if `True`, each block is compressed with the previous 32 KB of data as dictionary
 
     Returns:
         the compressed data.
 
     """
-    return zlib.compress(bp, level=level)[2:-4]  # removes the 2 bytes zlib header and the final 4 bytes Adler checksum
+    workers = _workers(workers)
+    if workers > 1 and len(bp) > block_size:
+        return b"".join(_parallel_compress(bp, level, workers, block_size, prime=prime)[0])
+    if sys.version_info >= (3, 11):
+        return zlib.compress(bp, level, wbits=-15)
+    compressor = ZlibCompressor(level, wbits=-15)  # pragma: no cover
+    return compressor.update(bp) + compressor.finalize()  # pragma: no cover
+
+
+@binapy_stream_encoder("deflate")
+def compress_deflate_stream(level: int = -1) -> ZlibCompressor:
+    """Incrementally compress data using DEFLATE.
+
+    Args:
+        level: the compression level
+
+    Returns:
+        a `ZlibCompressor` that produces a raw DEFLATE stream
+
+    """
+    return ZlibCompressor(level, wbits=-15)
 
 
 @binapy_decoder("deflate")
@@ -66,3 +376,14 @@ def decompress_deflate(bp: bytes, bufsize: int = zlib.DEF_BUF_SIZE) -> bytes:
 
     """
     return zlib.decompress(bp, wbits=-15, bufsize=bufsize)
+
+
+@binapy_stream_decoder("deflate")
+def decompress_deflate_stream() -> ZlibDecompressor:
+    """Incrementally decompress some data using DEFLATE.
+
+    Returns:
+        a `ZlibDecompressor` that reads a raw DEFLATE stream
+
+    """
+    return ZlibDecompressor(wbits=-15)
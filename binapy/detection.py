@@ -0,0 +1,323 @@
+"""This module contains the format detection engine behind `BinaPy.detect()` and `BinaPy.check_all()`.
+
+Detection starts by computing a cheap profile of which characters are present in the data.
+Extensions that declare an alphabet (see `binapy_checker()`) are ruled out from that profile alone, without running
+their checker. Remaining checkers are then run, from the cheapest to the most expensive, and matching formats are
+ranked by confidence.
+
+"""
+
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    from .binapy import BinaPy, BinaPyView  # pragma: no cover
+    from .charclass import CharClass  # pragma: no cover
+
+
+class Candidate(NamedTuple):
+    """A format that some data may conform to, as returned by `BinaPy.detect()`."""
+
+    name: str
+    """The extension name."""
+    confidence: float
+    """A score between 0 and 1. Higher means more likely."""
+    method: str
+    """How the format was detected: "check" if a checker returned `True`, or "decode" if decoding succeeded."""
+
+
+CHECKER_CONFIDENCE = 0.25
+"""Confidence for formats detected by a checker, when the format does not declare an alphabet.
+
+Such checkers, like the ones for hashes, often only check the data length."""
+
+DECODE_CONFIDENCE = 0.5
+"""Confidence for formats detected by successfully decoding the data."""
+
+_PROFILE_CHUNK_SIZE = 1024 * 1024
+"""Size of the chunks that are copied at once when profiling a `memoryview`, which can't be translated directly."""
+
+
+@lru_cache(maxsize=16)
+def _atoms(alphabets: tuple[CharClass, ...]) -> tuple[bytes, int, dict[CharClass, frozenset[int]]]:
+    """Split all byte values into atoms, which are groups of bytes that belong to exactly the same alphabets.
+
+    Args:
+        alphabets: the alphabets
+
+    Returns:
+        a tuple of (translation table from each byte value to its atom, number of atoms,
+        mapping of each alphabet to the atoms it contains)
+
+    """
+    signatures: dict[tuple[bool, ...], int] = {}
+    table = bytes(
+        signatures.setdefault(tuple(c in alphabet for alphabet in alphabets), len(signatures)) for c in range(256)
+    )
+    contents = {
+        alphabet: frozenset(atom for signature, atom in signatures.items() if signature[index])
+        for index, alphabet in enumerate(alphabets)
+    }
+    return table, len(signatures), contents
+
+
+class ByteProfile:
+    """A summary of which characters some data contains, relative to a set of alphabets.
+
+    The data is translated once into atom codes, which are groups of byte values that belong to exactly the same
+    alphabets. Whether the data fits in an alphabet can then be answered from the set of atoms that are present,
+    without reading the data again.
+
+    """
+
+    def __init__(self, data: bytes | memoryview, alphabets: Iterable[CharClass]) -> None:
+        """Initialize a ByteProfile.
+
+        Args:
+            data: the data to profile. A `memoryview`, like the one from a `BinaPyView`, is profiled chunk by chunk.
+            alphabets: the alphabets that will be checked
+
+        """
+        table, count, self._contents = _atoms(tuple(dict.fromkeys(alphabets)))
+        self.length = len(data)
+        chunks: Iterable[bytes]
+        if isinstance(data, bytes):
+            chunks = (data,)
+        else:
+            step = _PROFILE_CHUNK_SIZE
+            chunks = (bytes(data[start : start + step]) for start in range(0, len(data), step))
+        atoms: set[int] = set()
+        for chunk in chunks:
+            translated = chunk.translate(table)
+            atoms.update(atom for atom in range(count) if atom not in atoms and bytes((atom,)) in translated)
+        self.atoms = frozenset(atoms)
+
+    def allows(self, alphabet: CharClass) -> bool:
+        """Check if the profiled data only contains characters from `alphabet`.
+
+        Args:
+            alphabet: one of the alphabets given when creating this profile
+
+        Returns:
+            `True` if all characters from the data are part of the alphabet
+
+        """
+        return self.atoms <= self._contents[alphabet]
+
+
+def _plan(
+    extensions: dict[str, dict[str, Any]],
+    alphabets: dict[str, CharClass],
+    profile: ByteProfile,
+    *,
+    try_decode: bool,
+) -> list[tuple[str, float, str]]:
+    """Select the checks to run for `detect()`, from the cheapest to the most expensive.
+
+    Extensions with an alphabet that the profiled data does not fit in are ruled out.
+
+    Args:
+        extensions: the extensions to consider, with their methods
+        alphabets: the alphabets declared by those extensions
+        profile: the profile of the data
+        try_decode: if `True`, include extensions that don't have a checker but can decode
+
+    Returns:
+        a list of (extension name, confidence, method), with alphabet checkers first, then other checkers,
+        then decoders
+
+    """
+    with_alphabet: list[tuple[str, float, str]] = []
+    checkers: list[tuple[str, float, str]] = []
+    decoders: list[tuple[str, float, str]] = []
+    for name, methods in extensions.items():
+        alphabet = alphabets.get(name)
+        if alphabet is not None and not profile.allows(alphabet):
+            continue
+        if "check" in methods:
+            if alphabet is not None:
+                with_alphabet.append((name, 1 - len(alphabet) / 256, "check"))
+            else:
+                checkers.append((name, CHECKER_CONFIDENCE, "check"))
+        elif try_decode and "decode" in methods:
+            decoders.append((name, DECODE_CONFIDENCE, "decode"))
+    return with_alphabet + checkers + decoders
+
+
+def detect(  # noqa: PLR0913
+    bp: BinaPy | BinaPyView,
+    *,
+    decode: bool = False,
+    budget: float | None = None,
+    max_decode_size: int | None = None,
+    names: Iterable[str] | None = None,
+    check: Callable[..., bool] | None = None,
+) -> list[Candidate]:
+    """Detect the formats that some data conforms to, ranked by confidence.
+
+    See `BinaPy.detect()` and `BinaPyView.check_all()`.
+
+    Args:
+        bp: the data
+        decode: if `True`, for extensions that don't have a checker method, try to decode the data.
+        budget: maximum time to spend, in seconds. Checks that have not started when the budget is exhausted are
+            skipped.
+        max_decode_size: do not try decoding data larger than this size, in bytes.
+        names: if not `None`, only consider those extensions
+        check: the function that checks the data, called like `check(name, decode=...)`. Defaults to `bp.check`.
+
+    Returns:
+        a list of `Candidate`, from the most to the least likely format
+
+    """
+    from .binapy import BinaPy
+
+    deadline = None if budget is None else time.perf_counter() + budget
+    cls = type(bp) if isinstance(bp, BinaPy) else BinaPy
+    if names is None:
+        cls.load_extensions()
+    extensions = cls.extensions
+    if names is not None:
+        extensions = {name: cls._get_extension_methods(name) for name in names}
+    alphabets = {name: cls.alphabets[name] for name in extensions if name in cls.alphabets}
+    profile = ByteProfile(bp if isinstance(bp, BinaPy) else bp.memoryview(), alphabets.values())
+    try_decode = decode and (max_decode_size is None or len(bp) <= max_decode_size)
+    if check is None:
+        check = bp.check
+
+    candidates = []
+    for name, confidence, method in _plan(extensions, alphabets, profile, try_decode=try_decode):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        if check(name, decode=method == "decode"):
+            candidates.append(Candidate(name, confidence, method))
+    candidates.sort(key=lambda candidate: candidate.confidence, reverse=True)
+    return candidates
+
+
+PEEL_EXTENSIONS = ("b64", "b64u", "b32", "hex", "url", "zlib", "deflate")
+"""Extensions that `peel()` tries by default.
+
+Ciphers such as "rot13" or "xor" are excluded, since decoding any data with them always succeeds."""
+
+_WHITESPACE_TO_SPACE = str.maketrans("\t\r\n", "   ")
+
+
+def _is_text(bp: bytes) -> bool:
+    """Check if some data looks like text: valid UTF-8 with only printable characters or whitespace.
+
+    Args:
+        bp: the data
+
+    Returns:
+        `True` if the data looks like text
+
+    """
+    try:
+        return bp.decode().translate(_WHITESPACE_TO_SPACE).isprintable()
+    except UnicodeDecodeError:
+        return False
+
+
+def _is_structured(value: object) -> bool:
+    """Check if a parsed value is structured, as opposed to scalars that almost any data could be parsed as.
+
+    Args:
+        value: the parsed value
+
+    Returns:
+        `True` if the value is not a `str`, `bytes`, number, boolean or `None`
+
+    """
+    return not isinstance(value, (str, bytes, int, float, bool)) and value is not None
+
+
+def _decode_bounded(bp: BinaPy, name: str, max_size: int) -> BinaPy | None:
+    """Decode data, giving up if the result is larger than `max_size`.
+
+    When the extension has a streaming decoder, data is decoded by small chunks, so that decompression bombs
+    are aborted early.
+
+    Args:
+        bp: the data to decode
+        name: the extension name
+        max_size: maximum size of the decoded data
+
+    Returns:
+        the decoded data, or `None` if decoding failed or the result is too large
+
+    """
+    try:
+        if "decode_stream" in type(bp)._get_extension_methods(name):  # noqa: SLF001
+            chunks = []
+            size = 0
+            for chunk in type(bp).decode_stream(name, bp, chunk_size=4096):
+                size += len(chunk)
+                if size > max_size:
+                    return None
+                chunks.append(chunk)
+            return type(bp)(b"".join(chunks))
+        decoded = bp.decode_from(name)
+    except Exception:  # noqa: BLE001
+        return None
+    return decoded if len(decoded) <= max_size else None
+
+
+def peel(  # noqa: PLR0913
+    bp: BinaPy,
+    *,
+    max_depth: int = 8,
+    max_size: int = 64 * 1024 * 1024,
+    extensions: Iterable[str] = PEEL_EXTENSIONS,
+    parsers: Iterable[str] = ("json",),
+    binary: bool = False,
+) -> tuple[Any, list[str]]:
+    """Recursively detect and decode the layers of encoding of some data.
+
+    See `BinaPy.peel()`.
+
+    Args:
+        bp: the data
+        max_depth: maximum number of layers to decode
+        max_size: maximum size of intermediate decoded data
+        extensions: the extensions to try for decoding
+        parsers: the extensions to try for parsing the innermost layer
+        binary: if `True`, accept a result that is binary data. By default, only text or parsed data is accepted.
+
+    Returns:
+        a tuple of (final value, list of the extension names that were decoded, from outermost to innermost)
+
+    """
+    extensions = tuple(extensions)
+    parsers = tuple(parsers)
+    # the largest number of remaining layers with which each data could not be peeled
+    dead_ends: dict[bytes, int] = {}
+
+    def explore(data: BinaPy, depth: int, path: frozenset[bytes]) -> tuple[Any, list[str]] | None:
+        for parser in parsers:
+            try:
+                value = data.parse_from(parser)
+            except Exception:  # noqa: BLE001, S112
+                continue
+            if _is_structured(value):
+                return value, [parser]
+
+        if depth < max_depth and dead_ends.get(data, -1) < max_depth - depth:
+            for candidate in detect(data, decode=True, names=extensions):
+                decoded = _decode_bounded(data, candidate.name, max_size)
+                if decoded is None or not decoded or decoded == data or decoded in path:
+                    continue
+                result = explore(decoded, depth + 1, path | {decoded})
+                if result is not None:
+                    value, chain = result
+                    return value, [candidate.name, *chain]
+            dead_ends[data] = max_depth - depth
+
+        if binary or _is_text(data):
+            return data, []
+        return None
+
+    return explore(bp, 0, frozenset((bp,))) or (bp, [])
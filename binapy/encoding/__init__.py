@@ -3,5 +3,3 @@
 This includes Base64, Hexadecidemal, url-encoding, etc.
 
 """
-
-from . import base64, dumb, hex, url  # noqa: F401
@@ -1,9 +1,88 @@
 """This module contains helpers for Base64, and other encodings based on the `base64` module."""
 
+from __future__ import annotations
+
 import base64
-import string
+from typing import Callable
+
+from binapy import (
+    BlockCodec,
+    binapy_checker,
+    binapy_decoder,
+    binapy_encoder,
+    binapy_stream_decoder,
+    binapy_stream_encoder,
+)
+from binapy.charclass import BASE32, BASE64, BASE64URL
+
+
+class _IgnoringCodec:
+    """Wraps a `BlockCodec` to remove ignored characters before they are buffered.
+
+    This keeps the block boundaries aligned when non-strict decoding skips invalid characters.
+
+    """
+
+    def __init__(self, codec: BlockCodec, ignored: bytes) -> None:
+        self.codec = codec
+        self.ignored = ignored
+
+    def update(self, data: bytes) -> bytes:
+        return self.codec.update(bytes(data).translate(None, self.ignored))
+
+    def finalize(self) -> bytes:
+        return self.codec.finalize()
+
+
+def _rejecting_data_after_padding(decode: Callable[[bytes], bytes]) -> Callable[[bytes], bytes]:
+    """Wrap a block decoder for a `BlockCodec`, so that it rejects any data after a block that ends with padding.
+
+    A one-shot decoder only accepts padding at the very end of its input, but a `BlockCodec` calls its decoder
+    separately for each chunk of data.
+
+    Args:
+        decode: the block decoder
+
+    Returns:
+        a block decoder that raises a `ValueError` on any data that follows padding
+
+    """
+    padded = False
+
+    def decode_block(block: bytes) -> bytes:
+        nonlocal padded
+        if padded and block:
+            msg = "data after padding"
+            raise ValueError(msg)
+        result = decode(block)
+        padded = block[-1:] == b"="
+        return result
+
+    return decode_block
+
+
+_NOT_B64 = bytes(c for c in range(256) if c not in BASE64)
+_NOT_B64U = bytes(c for c in range(256) if c not in BASE64URL)
+_B32_PADDINGS = frozenset((0, 1, 3, 4, 6))
+"""Valid numbers of padding characters in Base32, for a last group of 5, 4, 3, 2 or 1 bytes."""
 
-from binapy import binapy_checker, binapy_decoder, binapy_encoder
+
+def _is_padded(bp: bytes, max_padding: int | None = None) -> bool:
+    """Check that `=` characters, if any, only appear at the end of `bp`.
+
+    Args:
+        bp: the data to check
+        max_padding: the maximum number of padding characters, if any
+
+    Returns:
+        `True` if padding is valid
+
+    """
+    start = bp.find(b"=")
+    if start == -1:
+        return True
+    padding = len(bp) - start
+    return bp.count(b"=", start) == padding and (max_padding is None or padding <= max_padding)
 
 
 @binapy_encoder("b64")
@@ -41,7 +120,7 @@ def decode_b64(bp: bytes, *, strict: bool = True) -> bytes:
     return base64.b64decode(bp)
 
 
-@binapy_checker("b64")
+@binapy_checker("b64", alphabet=BASE64)
 def is_b64(bp: bytes) -> bool:
     """Check if a data is valid Base64 encoded data.
 
@@ -57,14 +136,41 @@ def is_b64(bp: bytes) -> bool:
         `True` if data is valid Base64, `False` otherwise.
 
     """
-    if len(bp) % 4:
-        return False
-    payload_len = len(bp.rstrip(b"="))
-    padding_size = 4 - (payload_len % 4)
-    return set(bp.rstrip(b"=")).issubset(bytes(string.ascii_letters + string.digits + "+/", encoding="ascii")) and (
-        padding_size == 4  # which means no padding
-        or (padding_size == 1 and bp.endswith(b"=") or (padding_size == 2) and bp.endswith(b"=="))
-    )
+    return len(bp) % 4 == 0 and BASE64.match(bp) and _is_padded(bp, max_padding=2)
+
+
+@binapy_stream_encoder("b64")
+def encode_b64_stream() -> BlockCodec:
+    """Incrementally encode data using Base64.
+
+    Data is encoded by groups of 3 bytes, so that padding is only added at the very end.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(base64.b64encode, 3)
+
+
+@binapy_stream_decoder("b64")
+def decode_b64_stream(*, strict: bool = True) -> BlockCodec | _IgnoringCodec:
+    """Incrementally decode data using Base64.
+
+    Args:
+        strict: if `True` (default), raise a `ValueError` if the data contains invalid characters for Base64.
+            If `False`, ignore those characters.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+
+    def decode(block: bytes) -> bytes:
+        return decode_b64.__wrapped__(bytes(block), strict=strict)  # type: ignore[attr-defined,no-any-return]
+
+    if not strict:
+        return _IgnoringCodec(BlockCodec(decode, 4), _NOT_B64)
+    return BlockCodec(_rejecting_data_after_padding(decode), 4)
 
 
 @binapy_encoder("b64u")
@@ -104,7 +210,7 @@ def decode_b64u(bp: bytes, *, strict: bool = True) -> bytes:
     return base64.urlsafe_b64decode(data)
 
 
-@binapy_checker("b64u")
+@binapy_checker("b64u", alphabet=BASE64URL)
 def is_b64u(bp: bytes) -> bool:
     """Check if a data is valid Base64-url encoded data.
 
@@ -115,7 +221,39 @@ def is_b64u(bp: bytes) -> bool:
         `True` if data contains only valid Base64-url, `False` otherwise
 
     """
-    return set(bp.rstrip(b"=")).issubset(bytes(string.ascii_letters + string.digits + "-_", encoding="ascii"))
+    return BASE64URL.match(bp) and _is_padded(bp)
+
+
+@binapy_stream_encoder("b64u")
+def encode_b64u_stream() -> BlockCodec:
+    """Incrementally encode data using Base64-url.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(base64.urlsafe_b64encode, 3, lambda rest: base64.urlsafe_b64encode(rest).rstrip(b"="))
+
+
+@binapy_stream_decoder("b64u")
+def decode_b64u_stream(*, strict: bool = True) -> BlockCodec | _IgnoringCodec:
+    """Incrementally decode data using Base64-url.
+
+    Args:
+        strict: if `True` (default), raise a `ValueError` if the data contains invalid characters for Base64-url.
+           If `False`, ignore those characters.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+
+    def decode(block: bytes) -> bytes:
+        return decode_b64u.__wrapped__(bytes(block), strict=strict)  # type: ignore[attr-defined,no-any-return]
+
+    if not strict:
+        return _IgnoringCodec(BlockCodec(decode, 4), _NOT_B64U)
+    return BlockCodec(_rejecting_data_after_padding(decode), 4)
 
 
 @binapy_encoder("b32")
@@ -144,3 +282,46 @@ def decode_b32(bp: bytes) -> bytes:
 
     """
     return base64.b32decode(bp)
+
+
+@binapy_checker("b32", alphabet=BASE32)
+def is_b32(bp: bytes) -> bool:
+    """Check if a data is valid Base32 encoded data.
+
+    Args:
+        bp: the data to check
+
+    Returns:
+        `True` if data is valid Base32, `False` otherwise.
+
+    """
+    return (
+        len(bp) % 8 == 0
+        and BASE32.match(bp)
+        and _is_padded(bp, max_padding=6)
+        and len(bp) - len(bp.rstrip(b"=")) in _B32_PADDINGS
+    )
+
+
+@binapy_stream_encoder("b32")
+def encode_b32_stream() -> BlockCodec:
+    """Incrementally encode data using Base32.
+
+    Data is encoded by groups of 5 bytes, so that padding is only added at the very end.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(base64.b32encode, 5)
+
+
+@binapy_stream_decoder("b32")
+def decode_b32_stream() -> BlockCodec:
+    """Incrementally decode data using Base32.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(_rejecting_data_after_padding(base64.b32decode), 8)
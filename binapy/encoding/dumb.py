@@ -1,11 +1,71 @@
-"""Implement support for 'dumb' ciphers such as Caesar cipher."""
+"""Implement support for 'dumb' ciphers such as Caesar cipher.
+
+All ciphers from this module are substitution ciphers, and are implemented with translation tables
+(see `bytes.maketrans()`), which are computed once then cached. Applying them is done at C speed by `bytes.translate()`.
+
+"""
 
 from __future__ import annotations
 
 import string
+from functools import lru_cache
+from typing import Sequence
 
 from binapy import binapy_decoder, binapy_encoder
 
+_UPPERCASE = string.ascii_uppercase.encode()
+_LOWERCASE = string.ascii_lowercase.encode()
+_LETTERS = string.ascii_letters.encode()
+_ASCII = bytes(range(128))
+_OCTETS = bytes(range(256))
+_ROT47 = bytes(range(33, 127))
+
+# maps each byte to its class: 1 for uppercase letters, 2 for lowercase letters, 4 for other ASCII, 8 for non-ASCII
+_CLASS_TABLE = bytes(1 if c in _UPPERCASE else 2 if c in _LOWERCASE else 4 if c < 128 else 8 for c in range(256))
+
+
+@lru_cache(maxsize=4096)
+def rotation_table(shift: int, *alphabets: bytes) -> bytes:
+    """Return a translation table that rotates each alphabet by `shift` positions.
+
+    Each alphabet is rotated independently, so that passing both lowercase and uppercase letters
+    will preserve case. Bytes that are not part of any alphabet are left as-is.
+    Tables are cached, so repeatedly using the same shift and alphabets is cheap.
+
+    Args:
+        shift: number of positions to shift each character
+        *alphabets: the alphabets to rotate
+
+    Returns:
+        a translation table, usable with `bytes.translate()`
+
+    """
+    source = b"".join(alphabets)
+    target = b"".join(alphabet[shift % len(alphabet) :] + alphabet[: shift % len(alphabet)] for alphabet in alphabets)
+    return bytes.maketrans(source, target)
+
+
+def detect_alphabet(bp: bytes) -> bytes:
+    """Detect the smallest alphabet that contains all characters from `bp`.
+
+    The data is read in a single pass, by translating each byte to a class code.
+
+    Args:
+        bp: the data
+
+    Returns:
+        the detected alphabet, as `bytes`
+
+    """
+    classes = bp.translate(_CLASS_TABLE)
+    if b"\x08" in classes:
+        return _OCTETS
+    if b"\x04" in classes:
+        return _ASCII
+    if b"\x02" in classes:
+        return _LETTERS if b"\x01" in classes else _LOWERCASE
+    return _UPPERCASE
+
 
 @binapy_encoder("caesar")
 def encode_caesar(
@@ -37,21 +97,12 @@ def encode_caesar(
 
     """
     if not alphabet:
-        if all(65 <= c <= 90 for c in bp):
-            alphabet = string.ascii_uppercase
-        elif all(97 <= c <= 122 for c in bp):
-            alphabet = string.ascii_lowercase
-        elif all(65 <= c <= 90 or 97 <= c <= 122 for c in bp):
-            alphabet = string.ascii_letters
-        elif all(0 <= c <= 127 for c in bp):
-            alphabet = bytes(range(128))
-        else:
-            alphabet = bytes(range(256))
+        alphabet = detect_alphabet(bp)
 
     if isinstance(alphabet, str):
         alphabet = alphabet.encode()
 
-    return bytes(alphabet[(alphabet.index(c) + shift) % len(alphabet)] if c in alphabet else c for c in bp)
+    return bp.translate(rotation_table(shift, alphabet))
 
 
 @binapy_decoder("caesar")
@@ -67,3 +118,140 @@ def decode_caesar(
 
     """
     return encode_caesar(bp, -shift, alphabet)
+
+
+@binapy_encoder("rot13")
+@binapy_decoder("rot13")
+def rot13(bp: bytes) -> bytes:
+    """Apply ROT13 to data.
+
+    This rotates lowercase and uppercase ASCII letters by 13 positions, preserving case.
+    Since ROT13 is its own inverse, this is both the encoder and the decoder.
+
+    Args:
+        bp: input data
+
+    Returns:
+        the result of applying ROT13 to `bp`
+
+    """
+    return bp.translate(rotation_table(13, _LOWERCASE, _UPPERCASE))
+
+
+@binapy_encoder("rot47")
+@binapy_decoder("rot47")
+def rot47(bp: bytes) -> bytes:
+    """Apply ROT47 to data.
+
+    This rotates all printable ASCII characters, except space, by 47 positions.
+    Since ROT47 is its own inverse, this is both the encoder and the decoder.
+
+    Args:
+        bp: input data
+
+    Returns:
+        the result of applying ROT47 to `bp`
+
+    """
+    return bp.translate(rotation_table(47, _ROT47))
+
+
+_ATBASH_TABLE = bytes.maketrans(_LOWERCASE + _UPPERCASE, _LOWERCASE[::-1] + _UPPERCASE[::-1])
+
+
+@binapy_encoder("atbash")
+@binapy_decoder("atbash")
+def atbash(bp: bytes) -> bytes:
+    """Apply Atbash cipher to data.
+
+    This substitutes each ASCII letter with the letter at the same position from the end of the alphabet,
+    preserving case. Since Atbash is its own inverse, this is both the encoder and the decoder.
+
+    Args:
+        bp: input data
+
+    Returns:
+        the result of applying Atbash to `bp`
+
+    """
+    return bp.translate(_ATBASH_TABLE)
+
+
+def _vigenere_shifts(key: str | bytes | Sequence[int]) -> list[int]:
+    """Convert a Vigenère key to a list of shifts.
+
+    Args:
+        key: the key, either as letters (where `A` or `a` is a shift of 0), or as a sequence of `int` shifts
+
+    Returns:
+        the list of shifts
+
+    """
+    if isinstance(key, str):
+        key = key.encode()
+    if isinstance(key, bytes):
+        if not key.isalpha():
+            msg = "Vigenère key must contain only ASCII letters"
+            raise ValueError(msg)
+        return [c - ord("a") for c in key.lower()]
+    if not key:
+        msg = "Vigenère key must not be empty"
+        raise ValueError(msg)
+    return list(key)
+
+
+def _vigenere(bp: bytes, shifts: list[int]) -> bytearray:
+    """Apply a Vigenère cipher with the given shifts.
+
+    Each position modulo the key length uses its own translation table, and is processed as a whole
+    with an extended slice, so that there is no per-byte Python loop.
+
+    Args:
+        bp: input data
+        shifts: the shift for each position of the key
+
+    Returns:
+        the result
+
+    """
+    result = bytearray(len(bp))
+    period = len(shifts)
+    for offset, shift in enumerate(shifts):
+        result[offset::period] = bytes.__getitem__(bp, slice(offset, None, period)).translate(
+            rotation_table(shift, _LOWERCASE, _UPPERCASE),
+        )
+    return result
+
+
+@binapy_encoder("vigenere")
+def encode_vigenere(bp: bytes, key: str | bytes | Sequence[int]) -> bytearray:
+    """Encode data with a Vigenère cipher.
+
+    Each ASCII letter is shifted, preserving case, by a number of positions given by the key character at the same
+    position, with the key repeated as needed. The key position advances on every byte, including those that are not
+    letters, which are left as-is.
+
+    Args:
+        bp: input data
+        key: the key, either as letters (where `A` or `a` is a shift of 0), or as a sequence of `int` shifts
+
+    Returns:
+        the encoded data
+
+    """
+    return _vigenere(bp, _vigenere_shifts(key))
+
+
+@binapy_decoder("vigenere")
+def decode_vigenere(bp: bytes, key: str | bytes | Sequence[int]) -> bytearray:
+    """Decode data with a Vigenère cipher.
+
+    Args:
+        bp: input data
+        key: the key, either as letters (where `A` or `a` is a shift of 0), or as a sequence of `int` shifts
+
+    Returns:
+        the decoded data
+
+    """
+    return _vigenere(bp, [-shift for shift in _vigenere_shifts(key)])
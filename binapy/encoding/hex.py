@@ -1,6 +1,16 @@
 """Hexadecimal encoding and decoding methods."""
 
-from binapy import binapy_checker, binapy_decoder, binapy_encoder
+import binascii
+
+from binapy import (
+    BlockCodec,
+    binapy_checker,
+    binapy_decoder,
+    binapy_encoder,
+    binapy_stream_decoder,
+    binapy_stream_encoder,
+)
+from binapy.charclass import HEX
 
 
 @binapy_decoder("hex")
@@ -31,7 +41,7 @@ def encode_hex(bp: bytes) -> bytes:
     return bp.hex().encode()
 
 
-@binapy_checker("hex")
+@binapy_checker("hex", alphabet=HEX)
 def is_hex(bp: bytes) -> bool:
     """Check if a `bytes` value contains a valid hexadecimal string.
 
@@ -42,4 +52,26 @@ def is_hex(bp: bytes) -> bool:
         `True` if `bp` is a valid hexadecimal string
 
     """
-    return len(bp) % 2 == 0 and bp.isalnum() and set(bp.lower()).issubset(b"abcdef0123456789")
+    return len(bp) > 0 and len(bp) % 2 == 0 and HEX.match(bp)
+
+
+@binapy_stream_decoder("hex")
+def decode_hex_stream() -> BlockCodec:
+    """Incrementally decode hexadecimal data.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(binascii.unhexlify, 2)
+
+
+@binapy_stream_encoder("hex")
+def encode_hex_stream() -> BlockCodec:
+    """Incrementally encode data to hexadecimal.
+
+    Returns:
+        a `BlockCodec`
+
+    """
+    return BlockCodec(binascii.hexlify, 1)
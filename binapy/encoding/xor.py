@@ -0,0 +1,154 @@
+"""Implement support for XOR "encryption" with a single-byte or repeating key.
+
+XOR is done on whole buffers at once, either with NumPy if it is installed, or with Python big integers,
+which are much faster than a per-byte Python loop.
+
+"""
+
+from __future__ import annotations
+
+import string
+from collections import Counter
+
+from binapy import binapy_decoder, binapy_encoder
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _key_bytes(key: int | bytes | str) -> bytes:
+    """Convert a XOR key to bytes.
+
+    Args:
+        key: a single byte as `int`, or a key as `bytes` or `str` (which is encoded with 'utf-8')
+
+    Returns:
+        the key as bytes
+
+    """
+    if isinstance(key, int):
+        return bytes((key,))
+    if isinstance(key, str):
+        key = key.encode()
+    if not key:
+        msg = "XOR key must not be empty"
+        raise ValueError(msg)
+    return bytes(key)
+
+
+def xor(bp: bytes, key: int | bytes | str) -> bytes:
+    """XOR data with a key, which is repeated as needed to cover the whole data.
+
+    Args:
+        bp: the data
+        key: a single byte as `int`, or a key as `bytes` or `str` (which is encoded with 'utf-8')
+
+    Returns:
+        the result of XORing `bp` with the repeated `key`
+
+    """
+    key = _key_bytes(key)
+    length = len(bp)
+    if not length:
+        return b""
+    if np is not None:
+        data = np.frombuffer(bp, dtype=np.uint8)
+        return (data ^ np.resize(np.frombuffer(key, dtype=np.uint8), length)).tobytes()  # type: ignore[no-any-return]
+    keystream = key * (length // len(key) + 1)
+    xored = int.from_bytes(bp, "little") ^ int.from_bytes(keystream[:length], "little")
+    return xored.to_bytes(length, "little")
+
+
+@binapy_encoder("xor")
+def encode_xor(bp: bytes, key: int | bytes | str) -> bytes:
+    """Encode data with a XOR key.
+
+    Args:
+        bp: the data to encode
+        key: a single byte as `int`, or a key as `bytes` or `str` (which is encoded with 'utf-8')
+
+    Returns:
+        the encoded data
+
+    """
+    return xor(bp, key)
+
+
+@binapy_decoder("xor")
+def decode_xor(bp: bytes, key: int | bytes | str) -> bytes:
+    """Decode data with a XOR key.
+
+    Since XOR is symmetric, this is the same as `encode_xor()`.
+
+    Args:
+        bp: the data to decode
+        key: a single byte as `int`, or a key as `bytes` or `str` (which is encoded with 'utf-8')
+
+    Returns:
+        the decoded data
+
+    """
+    return xor(bp, key)
+
+
+# relative frequencies of letters in English text, in percent
+_LETTER_FREQUENCIES = dict(
+    zip(
+        string.ascii_lowercase,
+        (
+            *(8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.15, 0.77, 4.0, 2.4),
+            *(6.7, 7.5, 1.9, 0.095, 6.0, 6.3, 9.1, 2.8, 0.98, 2.4, 0.15, 2.0, 0.074),
+        ),
+    ),
+)
+
+
+def _plaintext_weight(c: int) -> float:
+    char = chr(c).lower()
+    if char in _LETTER_FREQUENCIES:
+        return _LETTER_FREQUENCIES[char]
+    if char == " ":
+        return 13.0
+    if 32 < c < 127 or char in "\t\r\n":
+        return 0.5
+    return -10.0
+
+
+_WEIGHTS = [_plaintext_weight(c) for c in range(256)]
+
+
+def find_xor_keys(bp: bytes, top: int | None = None) -> list[tuple[int, float]]:
+    """Rank all single-byte XOR keys by how much the decoded data looks like English text.
+
+    The data is read only once, to compute a histogram of byte values. Each key is then scored from
+    that histogram, so the cost of scoring all 256 keys does not depend on the data size.
+
+    Args:
+        bp: the XOR-encoded data
+        top: the number of keys to return. Return all 256 keys if `None`.
+
+    Returns:
+        a list of `(key, score)`, sorted from the most to the least likely key
+
+    Usage:
+        ```python
+        data = BinaPy("Attack at dawn!").to("xor", 0x42)
+        key, score = find_xor_keys(data)[0]
+        data.decode_from("xor", key)
+        # b'Attack at dawn!'
+        ```
+
+    """
+    length = len(bp) or 1
+    if np is not None:
+        histogram = np.bincount(np.frombuffer(bp, dtype=np.uint8), minlength=256)
+        values = np.arange(256)
+        weights = np.array(_WEIGHTS)[values[:, None] ^ values[None, :]]
+        scores = (weights @ histogram / length).tolist()
+    else:
+        counts = Counter(bp).items()
+        scores = [sum(count * _WEIGHTS[value ^ key] for value, count in counts) / length for key in range(256)]
+    ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+    return ranked[:top] if top is not None else ranked
@@ -1,3 +1 @@
 """This module contains helpers to compute hashes from data."""
-
-from . import sha, shake  # noqa: F401
@@ -4,19 +4,67 @@ Those include SHA1, SHA256, etc.
 
 """
 
+from __future__ import annotations
+
 import functools
 import hashlib
 from typing import Callable, Sequence
 
 from typing_extensions import Protocol
 
-from binapy import binapy_checker, binapy_encoder
+from binapy import binapy_checker, binapy_encoder, binapy_stream_encoder
 
 
 class ShaProtocol(Protocol):
+    def update(self, data: bytes, /) -> None: ...  # pragma: no cover
+
     def digest(self) -> bytes: ...  # pragma: no cover
 
 
+class ShaHasher:
+    """A `StreamCodec` that calculates a SHA hash incrementally.
+
+    `update()` never returns any data, and `finalize()` returns the hash.
+
+    Args:
+        func: the `hashlib` method to use for hashing
+        salt: an optional salt
+        append: if `True`, salt will be appended to data. If `False`, it will be prepended.
+
+    """
+
+    def __init__(self, func: Callable[..., ShaProtocol], *, salt: bytes | None = None, append: bool = True) -> None:
+        self._hash = func()
+        self._salt = salt
+        self._append = append
+        if salt is not None and not append:
+            self._hash.update(salt)
+
+    def update(self, data: bytes) -> bytes:
+        """Feed some data to the hash.
+
+        Args:
+            data: a chunk of data
+
+        Returns:
+            an empty `bytes`
+
+        """
+        self._hash.update(data)
+        return b""
+
+    def finalize(self) -> bytes:
+        """Return the calculated hash.
+
+        Returns:
+            the calculated hash
+
+        """
+        if self._salt is not None and self._append:
+            self._hash.update(self._salt)
+        return self._hash.digest()
+
+
 def sha_hash(func: Callable[[bytes], ShaProtocol], bp: bytes) -> bytes:
     """Calculate a SHA hash for a data.
 
@@ -60,10 +108,11 @@ for alg, func, length in (
 ):
     # see why we need to use functools: https://stackoverflow.com/questions/3431676/creating-functions-in-a-loop
     binapy_encoder(alg)(functools.partial(sha_hash, func))
-    binapy_checker(alg)(functools.partial(is_sha_hash, length))
+    binapy_checker(alg, length_only=True)(functools.partial(is_sha_hash, length))
+    binapy_stream_encoder(alg)(functools.partial(ShaHasher, func))
 
 
-def salted_sha_hash(func: Callable[[bytes], ShaProtocol], bp: bytes, *, salt: bytes, append: bool = True) -> bytes:
+def salted_sha_hash(func: Callable[..., ShaProtocol], bp: bytes, *, salt: bytes, append: bool = True) -> bytes:
     """Calculate a salted SHA.
 
     Args:
@@ -78,8 +127,26 @@ def salted_sha_hash(func: Callable[[bytes], ShaProtocol], bp: bytes, *, salt: by
         the calculated hash
 
     """
-    salted = bp + salt if append else salt + bp
-    return func(salted).digest()
+    hasher = ShaHasher(func, salt=salt, append=append)
+    hasher.update(bp)
+    return hasher.finalize()
+
+
+def salted_sha_hasher(func: Callable[..., ShaProtocol], *, salt: bytes, append: bool = True) -> ShaHasher:
+    """Return an incremental hasher for a salted SHA.
+
+    Args:
+    ----
+        func: the hash method from `hashlib` to use
+        salt: the salt to use
+        append: if `True`, salt will be appended to data. If `False`, it will be prepended.
+
+    Returns:
+    -------
+        a `ShaHasher`
+
+    """
+    return ShaHasher(func, salt=salt, append=append)
 
 
 def is_salted_sha_hash(bp: bytes, min_len: int, max_len: int) -> bool:
@@ -108,6 +175,7 @@ for alg, func, min_length, max_length in (
     ("ssha512", hashlib.sha512, 64, 128),
 ):
     binapy_encoder(alg)(functools.partial(salted_sha_hash, func))
-    binapy_checker(alg)(functools.partial(is_salted_sha_hash, min_len=min_length, max_len=max_length))
+    binapy_checker(alg, length_only=True)(functools.partial(is_salted_sha_hash, min_len=min_length, max_len=max_length))
+    binapy_stream_encoder(alg)(functools.partial(salted_sha_hasher, func))
 
 __all__: Sequence[str] = []
@@ -1,18 +1,78 @@
 """Helpers for the Shake Hash family."""
 
+from __future__ import annotations
+
 import functools
 import hashlib
 from typing import Callable, Sequence
 
 from typing_extensions import Protocol
 
-from binapy import binapy_encoder
+from binapy import binapy_encoder, binapy_stream_encoder
 
 
 class ShakeProtocol(Protocol):
+    def update(self, data: bytes, /) -> None: ...  # pragma: no cover
+
     def digest(self, length: int) -> bytes: ...  # pragma: no cover
 
 
+class ShakeHasher:
+    """A `StreamCodec` that calculates a Shake hash incrementally.
+
+    `update()` never returns any data, and `finalize()` returns the hash.
+
+    Args:
+        func: the `hashlib` method to use for hashing
+        length: the desired hash length, in bits
+        salt: an optional salt
+        append: if `True`, salt will be appended to data. If `False`, it will be prepended.
+
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., ShakeProtocol],
+        length: int,
+        *,
+        salt: bytes | None = None,
+        append: bool = True,
+    ) -> None:
+        if length % 8:
+            msg = "Shake hash length is a number of bits and must be a multiple of 8"
+            raise ValueError(msg)
+        self._hash = func()
+        self._length = length // 8
+        self._salt = salt
+        self._append = append
+        if salt is not None and not append:
+            self._hash.update(salt)
+
+    def update(self, data: bytes) -> bytes:
+        """Feed some data to the hash.
+
+        Args:
+            data: a chunk of data
+
+        Returns:
+            an empty `bytes`
+
+        """
+        self._hash.update(data)
+        return b""
+
+    def finalize(self) -> bytes:
+        """Return the calculated hash.
+
+        Returns:
+            the calculated hash
+
+        """
+        if self._salt is not None and self._append:
+            self._hash.update(self._salt)
+        return self._hash.digest(self._length)
+
+
 def shake_hash(func: Callable[[bytes], ShakeProtocol], bp: bytes, length: int) -> bytes:
     """Calculate a Shake hash for a data.
 
@@ -38,10 +98,11 @@ for alg, func in (
     ("shake256", hashlib.shake_256),
 ):
     binapy_encoder(alg)(functools.partial(shake_hash, func))
+    binapy_stream_encoder(alg)(functools.partial(ShakeHasher, func))
 
 
 def salted_shake_hash(
-    func: Callable[[bytes], ShakeProtocol],
+    func: Callable[..., ShakeProtocol],
     bp: bytes,
     length: int,
     *,
@@ -63,12 +124,33 @@ def salted_shake_hash(
         the calculated hash
 
     """
-    if length % 8:
-        msg = "Shake-128 hash length is a number of bits and must be a multiple of 8"
-        raise ValueError(msg)
+    hasher = ShakeHasher(func, length, salt=salt, append=append)
+    hasher.update(bp)
+    return hasher.finalize()
+
 
-    salted = bp + salt if append else salt + bp
-    return func(salted).digest(length // 8)
+def salted_shake_hasher(
+    func: Callable[..., ShakeProtocol],
+    length: int,
+    *,
+    salt: bytes,
+    append: bool = True,
+) -> ShakeHasher:
+    """Return an incremental hasher for a salted Shake hash.
+
+    Args:
+    ----
+        func: the hash method from `hashlib` to use
+        length: the desired hash length
+        salt: the salt to use
+        append: if `True`, salt will be appended to data. If `False`, it will be prepended.
+
+    Returns:
+    -------
+        a `ShakeHasher`
+
+    """
+    return ShakeHasher(func, length, salt=salt, append=append)
 
 
 for alg, func in (
@@ -76,5 +158,6 @@ for alg, func in (
     ("sshake256", hashlib.shake_256),
 ):
     binapy_encoder(alg)(functools.partial(salted_shake_hash, func))
+    binapy_stream_encoder(alg)(functools.partial(salted_shake_hasher, func))
 
 __all__: Sequence[str] = []
@@ -0,0 +1,199 @@
+"""This module contains opt-in instrumentation of BinaPy extension calls.
+
+Observers registered with `BinaPy.add_observer()` are notified of each call to `encode_to()`, `decode_from()`,
+`check()`, `parse_from()` and `serialize_to()`, after it completes. When no observer is registered, the only cost on
+those methods is checking a class-level flag.
+
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from typing_extensions import Protocol
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+class ExtensionCall(NamedTuple):
+    """A completed call to an extension, as passed to observers."""
+
+    name: str
+    """The extension name."""
+    feature: str
+    """The called feature: "encode", "decode", "check", "parse" or "serialize"."""
+    start: int
+    """Start time, in nanoseconds, from `time.perf_counter_ns()`."""
+    duration: float
+    """Duration of the call, in seconds."""
+    size_in: int | None
+    """Size of the input data, or `None` for serializers."""
+    size_out: int | None
+    """Size of the resulting data, or `None` for checkers, parsers, or when the call failed."""
+    error: BaseException | None
+    """The exception raised by the call, if any."""
+
+
+class Observer(Protocol):
+    """Interface for objects that observe extension calls."""
+
+    def observe(self, call: ExtensionCall) -> None:
+        """Observe a completed extension call.
+
+        This is called synchronously, in the thread that made the call.
+
+        Args:
+            call: the completed call
+
+        """
+
+
+DEFAULT_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, math.inf)
+"""Default upper bounds of latency histogram buckets, in seconds."""
+
+
+class ExtensionMetrics(NamedTuple):
+    """Metrics for a given extension and feature, as returned by `Metrics.snapshot()`."""
+
+    calls: int
+    """Number of calls."""
+    errors: int
+    """Number of calls that raised an exception."""
+    bytes_in: int
+    """Total size of input data."""
+    bytes_out: int
+    """Total size of resulting data."""
+    total_time: float
+    """Total duration of calls, in seconds."""
+    histogram: dict[float, int]
+    """Number of calls by latency bucket, with the upper bound of each bucket as key."""
+
+
+class Metrics:
+    """Collect call counts, sizes, errors and latency histograms, per extension and feature.
+
+    Usage:
+        ```python
+        metrics = Metrics(slow_threshold=0.1, on_slow_call=print)
+        with metrics:
+            BinaPy("foo").to("b64u")
+        metrics.snapshot()[("b64u", "encode")].calls
+        # 1
+        ```
+
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        slow_threshold: float | None = None,
+        on_slow_call: Callable[[ExtensionCall], object] | None = None,
+    ) -> None:
+        """Initialize a Metrics.
+
+        Args:
+            buckets: upper bounds of the latency histogram buckets, in seconds, in increasing order.
+                A last `math.inf` bucket is added if it is missing, so that every call fits in a bucket.
+            slow_threshold: duration, in seconds, above which a call is considered slow
+            on_slow_call: a callable that is called with each slow call. Exceptions that it raises are logged,
+                without affecting the observed call.
+
+        Raises:
+            ValueError: if the buckets are not in increasing order
+
+        """
+        if list(buckets) != sorted(buckets):
+            msg = "Histogram buckets must be in increasing order"
+            raise ValueError(msg)
+        if not buckets or buckets[-1] != math.inf:
+            buckets = (*buckets, math.inf)
+        self.buckets = buckets
+        self.slow_threshold = slow_threshold
+        self.on_slow_call = on_slow_call
+        self._lock = threading.Lock()
+        # for each (name, feature): calls, errors, bytes_in, bytes_out, total_time, then one count per bucket
+        self._stats: dict[tuple[str, str], list[float]] = {}
+
+    def observe(self, call: ExtensionCall) -> None:
+        """Record a completed extension call.
+
+        Args:
+            call: the completed call
+
+        """
+        bucket = next(index for index, bound in enumerate(self.buckets) if call.duration <= bound)
+        with self._lock:
+            stats = self._stats.get((call.name, call.feature))
+            if stats is None:
+                stats = self._stats[call.name, call.feature] = [0] * (5 + len(self.buckets))
+            stats[0] += 1
+            if call.error is not None:
+                stats[1] += 1
+            stats[2] += call.size_in or 0
+            stats[3] += call.size_out or 0
+            stats[4] += call.duration
+            stats[5 + bucket] += 1
+        if self.on_slow_call is not None and self.slow_threshold is not None and call.duration > self.slow_threshold:
+            self.on_slow_call(call)
+
+    def snapshot(self) -> dict[tuple[str, str], ExtensionMetrics]:
+        """Return the metrics collected so far.
+
+        Returns:
+            a dict of metrics, with tuples of (extension name, feature) as keys
+
+        """
+        with self._lock:
+            return {
+                key: ExtensionMetrics(
+                    calls=int(stats[0]),
+                    errors=int(stats[1]),
+                    bytes_in=int(stats[2]),
+                    bytes_out=int(stats[3]),
+                    total_time=stats[4],
+                    histogram={bound: int(count) for bound, count in zip(self.buckets, stats[5:])},
+                )
+                for key, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Discard all metrics collected so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def enable(self) -> None:
+        """Start collecting metrics, by registering this as an observer of `BinaPy`."""
+        from .binapy import BinaPy
+
+        BinaPy.add_observer(self)
+
+    def disable(self) -> None:
+        """Stop collecting metrics."""
+        from .binapy import BinaPy
+
+        BinaPy.remove_observer(self)
+
+    def __enter__(self) -> Self:
+        """Start collecting metrics.
+
+        Returns:
+            this Metrics
+
+        """
+        self.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop collecting metrics."""
+        self.disable()
@@ -1,3 +1 @@
 """This module contains helpers for parsing or serializing data in various formats."""
-
-from . import json, pickle  # noqa: F401
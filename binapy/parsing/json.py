@@ -1,20 +1,125 @@
-"""This module contains helpers for converting data to/from JSON."""
+"""This module contains helpers for converting data to/from JSON.
+
+Parsing and serializing is delegated to a backend, which is by default the fastest installed library among `orjson`,
+`msgspec` and `ujson`, or the stdlib `json` module (see `set_json_backend()`). Whenever a backend can't honor some
+parameters, or fails on some data that the stdlib `json` module accepts, that module is used instead.
+
+"""
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import math
+import re
 from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from importlib import import_module
+from operator import attrgetter
 from typing import Any, Callable, Iterable, Mapping
+from uuid import UUID
+
+from binapy import BinaPy, binapy_parser, binapy_serializer
+
+
+def _timestamp(data: datetime) -> int:
+    return int(data.timestamp())
+
+
+def _b64u(data: bytes) -> str:
+    return BinaPy(data).to("b64u").decode()
+
 
-from binapy import binapy_parser, binapy_serializer
+_JSON_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    datetime: _timestamp,
+    UUID: str,
+    Decimal: str,
+    Enum: attrgetter("value"),
+    bytes: _b64u,
+    bytearray: _b64u,
+    memoryview: _b64u,
+}
+_json_dispatch: dict[type, Callable[[Any], Any]] = {}
+
+
+def register_json_type(cls: type, handler: Callable[[Any], Any]) -> None:
+    """Register how instances of a type, and its subclasses, are serialized to JSON by the default encoder.
+
+    Note that the handler is only used for types that the JSON library can't serialize natively. Subclasses of `str`,
+    `int`, `float`, `list` or `dict` are serialized natively. With `orjson`, this is also the case for `UUID` and
+    `Enum` subclasses.
+
+    Args:
+        cls: the type
+        handler: a function that converts an instance of that type into a value that can be serialized to JSON
+
+    Usage:
+        ```python
+        register_json_type(complex, lambda c: [c.real, c.imag])
+        BinaPy.serialize_to("json", {"c": 1 + 2j})
+        # b'{"c":[1.0,2.0]}'
+        ```
+
+    """
+    _JSON_HANDLERS[cls] = handler
+    _json_dispatch.clear()
+
+
+def _dataclass_handler(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Return a handler that converts a dataclass instance to a dict of its fields.
+
+    Unlike `dataclasses.asdict()`, this does not recursively copy the field values, since those are serialized by
+    the JSON library.
+
+    Args:
+        cls: the dataclass
+
+    Returns:
+        a handler for that dataclass
+
+    """
+    names = tuple(field.name for field in dataclasses.fields(cls))
+    return lambda data: {name: getattr(data, name) for name in names}
+
+
+def _resolve_json_handler(cls: type) -> Callable[[Any], Any]:
+    """Find the handler to serialize instances of a given type.
+
+    Args:
+        cls: the type
+
+    Returns:
+        the handler
+
+    """
+    for base in cls.__mro__:
+        handler = _JSON_HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    if dataclasses.is_dataclass(cls):
+        return _dataclass_handler(cls)
+    if issubclass(cls, Mapping):
+        return dict
+    if issubclass(cls, Iterable):
+        return list
+    return str
 
 
 def _default_json_encode(data: Any) -> Any:
     """A JSON encoder which handles more default types.
 
     - `datetime` instances are converted to UTC timestamps.
+    - `UUID` and `Decimal` instances are converted to strings
+    - `Enum` members are converted to their value
+    - `bytes` are converted to Base64url strings
+    - dataclasses are converted to a dict of their fields
     - `Mapping`  subclasses are converted to dict
     - `Iterable` subclasses are converted to list
+    - other types are converted to strings
+
+    Additional types can be handled with `register_json_type()`. The handler to use is resolved once per concrete type,
+    then cached.
 
     Args:
         data: the data to serialize
@@ -23,13 +128,255 @@ def _default_json_encode(data: Any) -> Any:
         the serialized data
 
     """
-    if isinstance(data, datetime):
-        return int(data.timestamp())
-    if isinstance(data, Mapping):
-        return dict(data)
-    if isinstance(data, Iterable):
-        return list(data)
-    return str(data)
+    cls = type(data)
+    handler = _json_dispatch.get(cls)
+    if handler is None:
+        handler = _json_dispatch[cls] = _resolve_json_handler(cls)
+    return handler(data)
+
+
+def _memoize(default_encoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a JSON default encoder so that it is called only once per value.
+
+    Args:
+        default_encoder: the default encoder
+
+    Returns:
+        a wrapped default encoder
+
+    """
+    converted: dict[int, tuple[Any, Any]] = {}
+
+    def default(value: Any) -> Any:
+        if id(value) not in converted:
+            # keep a reference to the value, so that its id can't be reused
+            converted[id(value)] = (value, default_encoder(value))
+        return converted[id(value)][1]
+
+    return default
+
+
+class JsonBackend:
+    """A JSON library that can be used to parse or serialize JSON.
+
+    The base implementation uses the stdlib `json` module. Subclasses implement faster libraries.
+
+    """
+
+    name = "json"
+
+    def __init__(self, module: Any) -> None:
+        """Initialize a JsonBackend.
+
+        Args:
+            module: the imported library
+
+        """
+        self.module = module
+
+    def loads(self, bp: bytes) -> Any:
+        """Parse JSON.
+
+        Args:
+            bp: the JSON data
+
+        Returns:
+            the parsed value
+
+        Raises:
+            ValueError: if the data is not valid JSON, or if this backend can't parse it
+
+        """
+        return json.loads(bp)
+
+    def dumps(self, data: Any, default: Callable[[Any], Any], **kwargs: Any) -> bytes | None:  # noqa: ARG002
+        """Serialize data to compact JSON.
+
+        Args:
+            data: the data to serialize
+            default: a function that converts values that can't be serialized natively
+            **kwargs: additional parameters, as accepted by `json.dumps()`
+
+        Returns:
+            the serialized data, or `None` if this backend can't produce the same result as `json.dumps()`
+
+        """
+        return None
+
+
+_NON_ASCII = re.compile("[^\x00-\x7e]")
+_ORJSON_EXPONENT = re.compile(rb"e(?<=\de)")
+"""Matches `orjson` output that may contain floats with an exponent.
+
+Starting with a literal lets `re` skip quickly to each "e", which is much faster than searching for digits first."""
+
+
+def _has_orjson_float_mismatch(values: Iterable[Any]) -> bool:
+    """Check if some values contain floats that `orjson` serializes differently from the stdlib `json` module.
+
+    Those are the non-finite floats, and the floats that the stdlib serializes with an exponent. Only the types that
+    `orjson` serializes natively are walked: other values go through the default encoder, whose results must be
+    checked as well.
+
+    Args:
+        values: the values to check
+
+    Returns:
+        `True` if any of the values contains such a float
+
+    """
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Enum):
+            stack.append(value.value)
+        elif isinstance(value, float):
+            if not math.isfinite(value) or (value and not 1e-4 <= abs(value) < 1e16):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    """Escape a character like `json.dumps()` does with `ensure_ascii=True`.
+
+    Args:
+        match: a match on a single character
+
+    Returns:
+        the escaped character, using a surrogate pair for characters outside the BMP
+
+    """
+    c = ord(match.group())
+    if c < 0x10000:
+        return f"\\u{c:04x}"
+    c -= 0x10000
+    return f"\\u{0xD800 | (c >> 10):04x}\\u{0xDC00 | (c & 0x3FF):04x}"
+
+
+class OrjsonBackend(JsonBackend):
+    """A backend based on `orjson`, which serializes directly to `bytes`.
+
+    Unlike the stdlib `json` module, `orjson` formats floats with an exponent without a '+' sign or leading zeros
+    (like `1e16`), and serializes `NaN` and infinity as `null`. When the output contains `null` or something that
+    looks like an exponent, the serialized values are checked for such floats, and the stdlib is used instead if
+    there are any. `orjson` also rejects keys that are not strings, which the stdlib converts to strings, so the
+    stdlib is used for those as well.
+
+    """
+
+    name = "orjson"
+
+    def loads(self, bp: bytes) -> Any:  # noqa: D102
+        # orjson does not accept subclasses of bytes, like BinaPy
+        return self.module.loads(memoryview(bp))
+
+    def dumps(self, data: Any, default: Callable[[Any], Any], **kwargs: Any) -> bytes | None:  # noqa: D102
+        ensure_ascii = kwargs.pop("ensure_ascii", True)
+        option = self.module.OPT_PASSTHROUGH_DATETIME | self.module.OPT_PASSTHROUGH_DATACLASS
+        if kwargs.pop("sort_keys", False):
+            option |= self.module.OPT_SORT_KEYS
+        if kwargs:
+            return None
+        converted: list[Any] = []
+
+        def default_and_keep(value: Any) -> Any:
+            converted.append(default(value))
+            return converted[-1]
+
+        try:
+            result: bytes = self.module.dumps(data, default=default_and_keep, option=option)
+        except TypeError:  # orjson.JSONEncodeError, for example on integers larger than 64 bits or non-str keys
+            return None
+        # non-finite floats are serialized as null
+        maybe_mismatch = b"null" in result or _ORJSON_EXPONENT.search(result)
+        if maybe_mismatch and _has_orjson_float_mismatch((data, *converted)):
+            return None
+        # orjson never escapes non-ASCII characters
+        if ensure_ascii and (not result.isascii() or b"\x7f" in result):
+            return _NON_ASCII.sub(_escape_char, result.decode()).encode()
+        return result
+
+
+class MsgspecBackend(JsonBackend):
+    """A backend based on `msgspec`, used for parsing only.
+
+    `msgspec` serializes `datetime` natively, so it can't preserve the behaviour of `_default_json_encode()`.
+
+    """
+
+    name = "msgspec"
+
+    def loads(self, bp: bytes) -> Any:  # noqa: D102
+        try:
+            return self.module.json.decode(bp)
+        except self.module.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+class UjsonBackend(JsonBackend):
+    """A backend based on `ujson`, used for parsing only."""
+
+    name = "ujson"
+
+    def loads(self, bp: bytes) -> Any:  # noqa: D102
+        return self.module.loads(bp)
+
+
+BACKENDS: dict[str, type[JsonBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "ujson": UjsonBackend,
+    "json": JsonBackend,
+}
+"""Available backends, from the most to the least preferred."""
+
+_STDLIB = JsonBackend(json)
+_backend: JsonBackend | None = None
+
+
+def set_json_backend(name: str | None = None) -> JsonBackend:
+    """Select the backend used to parse and serialize JSON.
+
+    Args:
+        name: name of the backend to use, among `BACKENDS`. If `None`, select the first one that is installed.
+
+    Returns:
+        the selected backend
+
+    Raises:
+        ImportError: if the requested backend library is not installed
+
+    """
+    global _backend  # noqa: PLW0603
+    names = BACKENDS if name is None else (name,)
+    for candidate in names:
+        if candidate == "json":
+            _backend = _STDLIB
+            break
+        try:
+            module = import_module(candidate)
+        except ImportError:
+            if name is not None:
+                raise
+            continue
+        _backend = BACKENDS[candidate](module)
+        break
+    assert _backend is not None  # noqa: S101
+    return _backend
+
+
+def get_json_backend() -> JsonBackend:
+    """Return the backend used to parse and serialize JSON, selecting it on first use.
+
+    Returns:
+        the current backend
+
+    """
+    return _backend or set_json_backend()
 
 
 @binapy_parser("json")
@@ -43,6 +390,13 @@ def to_json(bp: bytes) -> Any:
         the resulting Python object
 
     """
+    backend = _backend or set_json_backend()
+    if backend is not _STDLIB:
+        try:
+            return backend.loads(bp)
+        except ValueError:
+            # the stdlib also accepts UTF-16/32, NaN or huge numbers, and raises the usual exceptions otherwise
+            pass
     return json.loads(bp)
 
 
@@ -59,7 +413,8 @@ def from_json(
     Args:
         data: the data to serialize to JSON
         compact: if `True`, produce a JSON that is as compact as possible (no spaces or new lines).
-        default_encoder: the JSON encoder to use. By default, `datetime` will be serialized as UTC timestamps.
+        default_encoder: the JSON encoder to use. By default, `datetime` will be serialized as UTC timestamps,
+            and other types as described in `_default_json_encode()`.
         **kwargs: additional parameters that will be passed to `json.dumps()`
 
     Returns:
@@ -67,6 +422,15 @@ def from_json(
 
     """
     if compact:
+        backend = _backend or set_json_backend()
+        if backend is not _STDLIB and kwargs.get("separators", (",", ":")) == (",", ":") and not kwargs.get("indent"):
+            # values are converted only once, even if serialization is retried with the stdlib,
+            # since they may be one-shot iterators
+            default_encoder = _memoize(default_encoder)
+            options = {key: value for key, value in kwargs.items() if key not in ("separators", "indent")}
+            result = backend.dumps(data, default_encoder, **options)
+            if result is not None:
+                return result
         kwargs.setdefault("separators", (",", ":"))
         kwargs.setdefault("indent", None)
     else:
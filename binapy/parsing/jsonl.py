@@ -0,0 +1,155 @@
+"""This module contains helpers for converting data to/from JSON Lines (also known as NDJSON).
+
+JSON Lines contain one JSON document per line. Records are parsed lazily, chunk by chunk, so that parsing a large
+file only needs as much memory as its largest record.
+
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from binapy import binapy_parser, binapy_serializer
+from binapy.binapy import DEFAULT_CHUNK_SIZE, StreamSource, iter_chunks
+
+from .json import _default_json_encode, from_json, to_json
+
+_dump_json: Callable[..., bytes] = from_json.__wrapped__  # type: ignore[attr-defined]
+
+
+@binapy_parser("jsonl")
+def to_jsonl(source: StreamSource, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    r"""Lazily parse JSON Lines into Python objects.
+
+    Empty lines are ignored.
+
+    Args:
+        source: the data to parse. Besides a `BinaPy`, this may be a path to a file, a binary file object,
+            or an iterable of `bytes` chunks.
+        chunk_size: size of the chunks that are read at once from `source`
+
+    Returns:
+        an iterator over the parsed records
+
+    Usage:
+        ```python
+        for record in BinaPy(b'{"a": 1}\n{"a": 2}\n').parse_from("jsonl"):
+            print(record)
+        # {'a': 1}
+        # {'a': 2}
+
+        with open("events.jsonl", "rb") as f:
+            for record in to_jsonl(f):
+                ...
+        ```
+
+    """
+    pending = bytearray()
+    for chunk in iter_chunks(source, chunk_size):
+        data = bytes(chunk)
+        end = data.find(b"\n")
+        if end < 0:
+            pending += data
+            continue
+        pending += data[:end]
+        if pending.strip():
+            yield to_json(bytes(pending))
+        start = end + 1
+        end = data.find(b"\n", start)
+        while end >= 0:
+            line = data[start:end]
+            if line.strip():
+                yield to_json(line)
+            start = end + 1
+            end = data.find(b"\n", start)
+        pending = bytearray(data[start:])
+    if pending.strip():
+        yield to_json(bytes(pending))
+
+
+def iter_jsonl(
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default_encoder: Callable[[Any], Any] = _default_json_encode,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """Serialize records to JSON Lines, as a stream of chunks.
+
+    Records are serialized like `from_json()` does, always in compact form. Lines are grouped in chunks of about
+    `chunk_size` bytes, and each chunk only contains complete lines.
+
+    Args:
+        records: the records to serialize
+        chunk_size: minimum size of chunks, except the last one
+        default_encoder: the JSON default encoder, like for `from_json()`
+        **kwargs: additional parameters for `from_json()`
+
+    Returns:
+        an iterator of chunks of JSON Lines
+
+    Raises:
+        ValueError: if `compact=False` is passed, since each record must fit on a single line
+
+    """
+    if not kwargs.pop("compact", True):
+        msg = "JSON Lines records are always serialized in compact form"
+        raise ValueError(msg)
+    buffer = bytearray()
+    for record in records:
+        buffer += _dump_json(record, compact=True, default_encoder=default_encoder, **kwargs)
+        buffer += b"\n"
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def write_jsonl(
+    records: Iterable[Any],
+    file: IO[bytes],
+    *,
+    default_encoder: Callable[[Any], Any] = _default_json_encode,
+    **kwargs: Any,
+) -> int:
+    """Serialize records to JSON Lines, and write them to a binary file object.
+
+    Args:
+        records: the records to serialize
+        file: a binary file object, opened for writing
+        default_encoder: the JSON default encoder, like for `from_json()`
+        **kwargs: additional parameters for `from_json()`
+
+    Returns:
+        the number of bytes written
+
+    """
+    written = 0
+    for chunk in iter_jsonl(records, default_encoder=default_encoder, **kwargs):
+        file.write(chunk)
+        written += len(chunk)
+    return written
+
+
+@binapy_serializer("jsonl")
+def from_jsonl(
+    records: Iterable[Any],
+    *,
+    default_encoder: Callable[[Any], Any] = _default_json_encode,
+    **kwargs: Any,
+) -> bytes:
+    """Serialize records to JSON Lines.
+
+    To serialize a large number of records without holding them all in memory, use `iter_jsonl()` or `write_jsonl()`.
+
+    Args:
+        records: the records to serialize
+        default_encoder: the JSON default encoder, like for `from_json()`
+        **kwargs: additional parameters for `from_json()`
+
+    Returns:
+        the JSON Lines
+
+    """
+    return b"".join(iter_jsonl(records, default_encoder=default_encoder, **kwargs))
@@ -1,13 +1,87 @@
-"""This module implements helpers for (de)serializing to/from Python `pickle` objects."""
+"""This module implements helpers for (de)serializing to/from Python `pickle` objects.
+
+With `out_of_band=True`, objects are pickled with protocol 5 and their out-of-band buffers (see PEP 574) are written
+after the pickle stream, in a single frame. This avoids copying large buffers, such as arrays, into the pickle stream
+itself. The frame contains, in order:
+
+- the pickle stream length, and the number of buffers, as unsigned 64-bit and 32-bit little-endian integers
+- the length of each buffer, as unsigned 64-bit little-endian integers
+- the pickle stream
+- the buffers
+
+"""
 
 from __future__ import annotations
 
 import pickle
+import struct
 from pickle import PickleBuffer
-from typing import Any, Callable, Iterable
+from typing import IO, Any, Callable, Iterable, Iterator
 
 from binapy import binapy_parser, binapy_serializer
 
+_HEADER = struct.Struct("<QI")
+_LENGTH = struct.Struct("<Q")
+
+
+def _iter_pickle_frame(o: object, *, protocol: int | None, fix_imports: bool) -> Iterator[bytes | memoryview]:
+    """Pickle an object with out-of-band buffers, as the successive parts of a frame.
+
+    Buffers are yielded as `memoryview`s on the original object data, without copying it.
+
+    Args:
+        o: the object to pickle
+        protocol: the pickle protocol to use, at least 5. Defaults to 5.
+        fix_imports: see `pickle.dumps()`
+
+    Returns:
+        an iterator over the parts of the frame
+
+    """
+    if protocol is None:
+        protocol = 5
+    elif 0 <= protocol < 5:
+        msg = "Out-of-band buffers require pickle protocol 5 or higher."
+        raise ValueError(msg)
+
+    buffers: list[memoryview] = []
+
+    def buffer_callback(buffer: PickleBuffer) -> bool:
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:  # non-contiguous buffer, which is pickled in-band
+            return True
+        return False
+
+    stream = pickle.dumps(o, protocol=protocol, fix_imports=fix_imports, buffer_callback=buffer_callback)
+    yield _HEADER.pack(len(stream), len(buffers)) + b"".join(_LENGTH.pack(buffer.nbytes) for buffer in buffers)
+    yield stream
+    yield from buffers
+
+
+def write_pickle(o: object, file: IO[bytes], *, protocol: int | None = None, fix_imports: bool = True) -> int:
+    """Pickle an object with out-of-band buffers, and write the resulting frame to a binary file object.
+
+    Unlike `BinaPy.serialize_to("pickle", o, out_of_band=True)`, this does not gather the frame in memory, so the
+    buffers are never copied. `serialize_to()` copies each buffer twice: once when joining the frame, and once more
+    when the resulting `bytes` is wrapped into a `BinaPy`. Prefer this function for large buffers.
+
+    Args:
+        o: the object to pickle
+        file: a binary file object, opened for writing
+        protocol: the pickle protocol to use, at least 5. Defaults to 5.
+        fix_imports: see `pickle.dumps()`
+
+    Returns:
+        the number of bytes written
+
+    """
+    written = 0
+    for part in _iter_pickle_frame(o, protocol=protocol, fix_imports=fix_imports):
+        file.write(part)
+        written += len(part) if isinstance(part, bytes) else part.nbytes
+    return written
+
 
 @binapy_serializer("pickle")
 def to_pickle(
@@ -16,19 +90,94 @@ def to_pickle(
     protocol: int | None = None,
     fix_imports: bool = True,
     buffer_callback: Callable[[PickleBuffer], Any] | None = None,
+    out_of_band: bool = False,
 ) -> bytes:
-    """Serialize an object using `pickle.dumps()`."""
+    """Serialize an object using `pickle.dumps()`.
+
+    Args:
+        o: the object to serialize
+        protocol: the pickle protocol to use
+        fix_imports: see `pickle.dumps()`
+        buffer_callback: see `pickle.dumps()`
+        out_of_band: if `True`, serialize out-of-band buffers along with the pickle stream, in a single frame.
+            This frame must be parsed with `out_of_band=True` as well. Buffers are copied into the frame, see
+            `write_pickle()` to avoid that.
+
+    Returns:
+        the pickled object
+
+    """
+    if out_of_band:
+        if buffer_callback is not None:
+            msg = "buffer_callback can't be used with out_of_band=True."
+            raise ValueError(msg)
+        return b"".join(_iter_pickle_frame(o, protocol=protocol, fix_imports=fix_imports))
     return pickle.dumps(o, protocol=protocol, fix_imports=fix_imports, buffer_callback=buffer_callback)
 
 
+def _split_pickle_frame(bp: bytes) -> tuple[memoryview, list[memoryview]]:
+    """Split a frame produced with `out_of_band=True` into the pickle stream and its buffers.
+
+    Args:
+        bp: the frame
+
+    Returns:
+        a tuple of the pickle stream and the buffers, as `memoryview`s on `bp`
+
+    Raises:
+        ValueError: if `bp` is not a valid frame
+
+    """
+    view = memoryview(bp).cast("B")
+    try:
+        stream_length, count = _HEADER.unpack_from(view)
+        lengths = struct.unpack_from(f"<{count}Q", view, _HEADER.size)
+    except struct.error as exc:
+        msg = "Truncated pickle frame."
+        raise ValueError(msg) from exc
+    offset = _HEADER.size + count * _LENGTH.size
+    if offset + stream_length + sum(lengths) != len(view):
+        msg = "Invalid pickle frame length."
+        raise ValueError(msg)
+    stream = view[offset : offset + stream_length]
+    offset += stream_length
+    buffers = []
+    for length in lengths:
+        buffers.append(view[offset : offset + length])
+        offset += length
+    return stream, buffers
+
+
 @binapy_parser("pickle")
-def from_pickle(
+def from_pickle(  # noqa: PLR0913
     bp: bytes,
     *,
     fix_imports: bool = True,
     encoding: str = "ASCII",
     errors: str = "strict",
     buffers: Iterable[object] | None = None,
+    out_of_band: bool = False,
 ) -> object:
-    """Deserialize an object using `pickle.loads()`."""
+    """Deserialize an object using `pickle.loads()`.
+
+    Args:
+        bp: the pickled data
+        fix_imports: see `pickle.loads()`
+        encoding: see `pickle.loads()`
+        errors: see `pickle.loads()`
+        buffers: see `pickle.loads()`
+        out_of_band: if `True`, parse a frame produced by `to_pickle()` with `out_of_band=True`, or by
+            `write_pickle()`. Out-of-band buffers are then passed to `pickle.loads()` as read-only `memoryview`s on
+            `bp`, without copying. Objects that support it, like numpy arrays, keep referencing `bp` instead of
+            owning a copy of their data.
+
+    Returns:
+        the unpickled object
+
+    """
+    if out_of_band:
+        if buffers is not None:
+            msg = "buffers can't be used with out_of_band=True."
+            raise ValueError(msg)
+        bp, buffers = _split_pickle_frame(bp)  # type: ignore[assignment]
     return pickle.loads(bp, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers)  # noqa: S301
@@ -0,0 +1,148 @@
+"""This module contains a tracer that records BinaPy extension calls as Chrome trace events.
+
+Traces can be opened with `chrome://tracing` or https://ui.perfetto.dev, which display each extension call as a
+span on a timeline, per thread, nested under the spans that contain it.
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from .instrumentation import ExtensionCall
+
+
+class Tracer:
+    """Record extension calls as spans, and export them in Chrome trace-event format.
+
+    Use it as a context manager: calls are recorded while it is active, from all threads, and the trace is written
+    to `path` when it exits, if a path was given.
+
+    Usage:
+        ```python
+        with Tracer("trace.json") as tracer:
+            with tracer.span("handle request"):
+                BinaPy(token).decode_from("b64u").parse_from("json")
+        ```
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Initialize a Tracer.
+
+        Args:
+            path: the file to write the trace to, when exiting the context manager
+
+        """
+        self.path = path
+        self.events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._threads: set[int] = set()
+
+    def _add_event(self, event: dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        event.update(pid=self._pid, tid=tid)
+        with self._lock:
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self.events.append(
+                    {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": thread.name}},
+                )
+            self.events.append(event)
+
+    def observe(self, call: ExtensionCall) -> None:
+        """Record a completed extension call as a span.
+
+        Args:
+            call: the completed call
+
+        """
+        args: dict[str, Any] = {"size_in": call.size_in, "size_out": call.size_out}
+        if call.error is not None:
+            args["error"] = repr(call.error)
+        self._add_event(
+            {
+                "name": f"{call.feature}:{call.name}",
+                "cat": call.feature,
+                "ph": "X",
+                "ts": call.start / 1000,
+                "dur": call.duration * 1e6,
+                "args": args,
+            },
+        )
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """Record a custom span, such as a request handler, that will contain the extension calls made inside it.
+
+        Args:
+            name: the span name
+            **args: additional data to attach to the span
+
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self._add_event(
+                {"name": name, "cat": "span", "ph": "X", "ts": start / 1000, "dur": (end - start) / 1000, "args": args},
+            )
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the recorded trace.
+
+        Returns:
+            the trace, in Chrome trace-event JSON format
+
+        """
+        with self._lock:
+            return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the recorded trace to a file.
+
+        Args:
+            path: the file to write to
+
+        """
+        import json  # imported here, so that importing binapy does not import json
+
+        with open(path, "w") as output:  # noqa: PTH123
+            json.dump(self.to_json(), output)
+
+    def __enter__(self) -> Self:
+        """Start recording extension calls.
+
+        Returns:
+            this Tracer
+
+        """
+        from .binapy import BinaPy
+
+        BinaPy.add_observer(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop recording extension calls, and write the trace to `path`, if any."""
+        from .binapy import BinaPy
+
+        BinaPy.remove_observer(self)
+        if self.path is not None:
+            self.save(self.path)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from typing_extensions import Literal
+
+from binapy import BinaPy
+
+PAYLOADS = [BinaPy.random(size) for size in (0, 1, 100, 10000, 100000)]
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_encode_many(executor: Literal["thread", "process"] | None) -> None:
+    results = BinaPy.encode_many("sha256", PAYLOADS, executor=executor, max_workers=2)
+    assert results == [payload.to("sha256") for payload in PAYLOADS]
+    assert all(isinstance(result, BinaPy) for result in results)
+
+    results = BinaPy.encode_many("zlib", PAYLOADS, executor=executor, level=9)
+    assert results == [payload.to("zlib", level=9) for payload in PAYLOADS]
+
+
+def test_executor_instance() -> None:
+    with ThreadPoolExecutor(4) as executor:
+        results = BinaPy.encode_many("shake256", PAYLOADS, 256, executor=executor)
+    assert results == [payload.to("shake256", 256) for payload in PAYLOADS]
+
+
+def test_decode_and_parse_many() -> None:
+    items: list[bytes | str] = [b"YWJj", b"not base64!", "ZGVm"]
+    results = BinaPy.decode_many("b64", items, executor="thread")
+    assert results[0] == b"abc"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == b"def"
+
+    parsed = BinaPy.parse_many("json", [b'{"a": 1}', b"{", b"[1, 2]"])
+    assert parsed[0] == {"a": 1}
+    assert isinstance(parsed[1], ValueError)
+    assert parsed[2] == [1, 2]
+
+
+def test_unknown_extension() -> None:
+    with pytest.raises(NotImplementedError):
+        BinaPy.encode_many("something_not_known", PAYLOADS)
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from binapy import BinaPy, binapy_parser, binapy_serializer
+from binapy.bench import IMPORT_SCENARIOS, RAW_CALLS, adoption, compare, import_time, main, make_document, make_payload, run
+from binapy.parsing.json import get_json_backend
+
+
+def test_run() -> None:
+    report = run([16, 1024], ["b64", "json", "sha256"], min_time=0)
+    results = {(result["extension"], result["feature"], result["size"]): result for result in report["results"]}
+    assert set(results) == {
+        (name, feature, size)
+        for size in (16, 1024)
+        for name, feature in (
+            ("b64", "encode"),
+            ("b64", "decode"),
+            ("b64", "check"),
+            ("json", "parse"),
+            ("json", "serialize"),
+            ("sha256", "encode"),
+            ("sha256", "check"),
+        )
+    }
+    b64_encode = results["b64", "encode", 1024]
+    assert b64_encode["input_size"] == 1024
+    assert b64_encode["seconds_per_call"] > 0
+    assert b64_encode["throughput"] > 0
+    assert "overhead" in b64_encode
+    assert b64_encode["peak_memory"] >= 1024 * 4 // 3
+    assert "overhead" not in results["sha256", "check", 16]
+
+    assert report["json_backend"] == get_json_backend().name
+    json.dumps(report)
+
+
+def test_run_consumes_iterators() -> None:
+    parsed: List[bytes] = []
+
+    @binapy_serializer("bench_lines")
+    def serialize_lines(data: Any) -> bytes:
+        return b"".join(f"{item}\n".encode() for item in data)
+
+    @binapy_parser("bench_lines")
+    def parse_lines(bp: bytes) -> Iterator[bytes]:
+        for line in bp.splitlines():
+            parsed.append(line)
+            yield line
+
+    report = run([1024], ["bench_lines"], ["parse"], min_time=0, memory=False)
+    (result,) = report["results"]
+    # each call parses the whole document, instead of only creating a generator
+    assert len(parsed) == result["calls"] * len(make_document(1024))
+
+
+def test_raw_calls() -> None:
+    # raw calls must do the same work as the extensions, for the overhead to be meaningful
+    data = make_payload(1024, "text") + b" /?&=+%"
+    for (name, feature), raw in RAW_CALLS.items():
+        if feature == "encode":
+            assert raw(data) == BinaPy(data).encode_to(name), name
+        elif feature == "decode":
+            encoded = BinaPy(data).encode_to(name)
+            assert raw(bytes(encoded)) == encoded.decode_from(name), name
+
+
+def test_compare() -> None:
+    baseline = {"results": [{"extension": "b64", "feature": "encode", "size": 16, "seconds_per_call": 1.0}]}
+    report = {
+        "results": [
+            {"extension": "b64", "feature": "encode", "size": 16, "seconds_per_call": 1.5},
+            {"extension": "b64", "feature": "decode", "size": 16, "seconds_per_call": 1.5},
+        ]
+    }
+    assert compare(report, baseline) == [{"extension": "b64", "feature": "encode", "size": 16, "ratio": 1.5}]
+    assert compare(report, baseline, threshold=1) == []
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    output = tmp_path / "bench.json"
+    args = ["-s", "16", "-e", "hex", "-f", "encode", "--min-time", "0", "--no-memory"]
+    assert main([*args, "-o", str(output)]) == 0
+    assert "hex" in capsys.readouterr().out
+    assert main([*args, "--json", "-b", str(output), "--threshold", "1000"]) == 0
+    assert json.loads(capsys.readouterr().out)["results"][0]["extension"] == "hex"
+
+
+def test_adoption(capsys: pytest.CaptureFixture[str]) -> None:
+    results = adoption([16, 1024], min_time=0)
+    assert [result["size"] for result in results] == [16, 1024]
+    assert all(result["bytes_seconds_per_call"] > 0 and result["binapy_seconds_per_call"] > 0 for result in results)
+    assert main(["--adoption", "-s", "1K", "--min-time", "0"]) == 0
+    assert "adopted" in capsys.readouterr().out
+
+
+def test_import_time(capsys: pytest.CaptureFixture[str]) -> None:
+    results = import_time(runs=1)
+    assert list(results) == list(IMPORT_SCENARIOS)
+    assert all(duration > 0 for duration in results.values())
+    assert main(["--import-time", "1"]) == 0
+    assert "import binapy" in capsys.readouterr().out
@@ -1,11 +1,21 @@
 #!/usr/bin/env python
 """Tests for `binapy` package."""
+import importlib
+import importlib.metadata
 import string
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
 
 import pytest
 
 from binapy import (
     BinaPy,
+    BinaPyView,
     InvalidExtensionMethodError,
     binapy_checker,
     binapy_decoder,
@@ -253,3 +263,239 @@ def test_invalid_features() -> None:
 
     with pytest.raises(ValueError):
         assert BinaPy("foo").check("foo", raise_on_error=True)
+
+
+def test_view() -> None:
+    bp = BinaPy(BINARY)
+    view = bp.view()
+    assert isinstance(view, BinaPyView)
+    assert view == bp
+    assert len(view) == len(bp)
+    assert view[0] == bp[0]
+    assert isinstance(view[2:6], BinaPyView)
+    assert view[2:6] == bp[2:6]
+    assert view.memoryview().obj is bp
+    assert view[2:6].memoryview().obj is bp
+    assert bytes(view[2:6]) == bp[2:6]
+    assert isinstance(view.to_binapy(), BinaPy)
+    assert BinaPy(view) == bp
+
+    assert view.to_int() == bp.to_int()
+    assert view.encode_to("b64") == BASE64
+    assert view.encode_to("sha256") == SHA256
+    assert view.to("url") == bp.to("url")
+    assert BinaPy(BASE64).view().decode_from("b64") == BINARY
+    assert BinaPy(BASE64).view().check("b64")
+    assert BinaPy(b'{"foo": "bar"}').view(0).parse_from("json") == {"foo": "bar"}
+
+    head, tail = bp.split_at(4, copy=False)
+    assert isinstance(head, BinaPyView)
+    assert head == BINARY[:4]
+    assert tail == BINARY[4:]
+    assert head.memoryview().obj is bp
+    assert [bytes(part) for part in bp.view(2, 10).split_at(3)] == [BINARY[2:5], BINARY[5:10]]
+
+    pieces = bp.split_at(4, 8)
+    assert all(isinstance(piece, BinaPy) for piece in pieces)
+    assert pieces == (BINARY[:4], BINARY[4:8], BINARY[8:])
+
+
+def test_from_file(tmp_path: Path) -> None:
+    data = BinaPy.random(200_000)
+    encoded = data.to("b64")
+    path = tmp_path / "data.b64"
+    path.write_bytes(encoded)
+
+    view = BinaPy.from_file(path)
+    assert isinstance(view, BinaPyView)
+    assert view == encoded
+    assert view[:100] == encoded[:100]
+    assert view.view(1000, 2000).to_binapy() == encoded[1000:2000]
+    assert view.to("sha256") == encoded.to("sha256")
+    assert view.decode_from("b64") == data
+    assert view.check("b64")
+    assert view.check("b64", decode=True)
+    assert not view.check("hex")
+    assert not view[:-1].check("b64")
+    with pytest.raises(ValueError):
+        view[:-1].check("b64", raise_on_error=True)
+    with pytest.raises(NotImplementedError):
+        view.check("json")
+    with pytest.raises(NotImplementedError):
+        view.check("not_an_extension")
+
+    compressed = tmp_path / "data.zlib"
+    compressed.write_bytes(data.to("zlib"))
+    assert BinaPy.from_file(compressed).check("zlib", decode=True)
+    assert not BinaPy.from_file(compressed)[:-10].check("zlib", decode=True)
+
+    bp = BinaPy.from_file(str(path), mmap=False)
+    assert type(bp) is BinaPy
+    assert bp == encoded
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert BinaPy.from_file(empty) == b""
+    assert BinaPy.from_file(empty, mmap=False) == b""
+
+
+def test_view_checks_memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    size = 16 * 1024 * 1024
+    path = tmp_path / "large"
+    path.write_bytes(BinaPy.random(size))
+    view = BinaPy.from_file(path)
+    # ignore the extensions registered by other tests, whose checkers need the data itself
+    BinaPy.load_extensions()
+    builtins = {
+        name: methods
+        for name, methods in BinaPy.extensions.items()
+        if not any(method.__module__.startswith("tests.") for method in methods.values())
+    }
+    monkeypatch.setattr(BinaPy, "extensions", builtins)
+
+    tracemalloc.start()
+    try:
+        assert not view.check("sha256")
+        assert not view.check("ssha512")
+        assert view[:32].check("sha256")
+        formats = view.check_all()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert "sha256" not in formats
+    # profiling copies a few chunks of the view at once, but never the whole view
+    assert peak < size // 4
+
+
+def test_result_adoption() -> None:
+    result = BinaPy(b"result")
+
+    @binapy_encoder("adopted")
+    def encode_adopted(bp: bytes) -> bytes:
+        return result
+
+    assert BinaPy(b"foo").to("adopted") is result
+    assert BinaPy(result) is result
+    assert BinaPy(b"foo") is not BinaPy(b"foo")
+
+
+def test_lazy_extensions() -> None:
+    code = """
+import sys
+from binapy import BinaPy
+assert "json" not in sys.modules and "zlib" not in sys.modules and "hashlib" not in sys.modules
+assert "urllib.parse" not in sys.modules and "logging" not in sys.modules
+assert BinaPy("foo").to("b64u") == b"Zm9v"
+assert "binapy.encoding.base64" in sys.modules and "binapy.parsing.json" not in sys.modules
+assert "b64" in BinaPy.extensions and "json" not in BinaPy.extensions
+BinaPy.load_extensions()
+assert "json" in BinaPy.extensions and not BinaPy.lazy_extensions
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_entry_points(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "binapy_plugin_test.py").write_text(
+        "from binapy import binapy_encoder\n"
+        "@binapy_encoder('reverse')\n"
+        "def encode_reverse(bp: bytes) -> bytes:\n"
+        "    return bp[::-1]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    entry_point = importlib.metadata.EntryPoint("reverse", "binapy_plugin_test", BinaPy.ENTRY_POINTS_GROUP)
+    if sys.version_info >= (3, 10):
+        monkeypatch.setattr(importlib.metadata, "entry_points", lambda: importlib.metadata.EntryPoints([entry_point]))
+    else:
+        monkeypatch.setattr(importlib.metadata, "entry_points", lambda: {BinaPy.ENTRY_POINTS_GROUP: [entry_point]})
+    monkeypatch.setattr(BinaPy, "_entry_points_loaded", False)
+
+    assert BinaPy("abc").to("reverse") == b"cba"
+    with pytest.raises(NotImplementedError):
+        BinaPy("abc").to("unknown_extension")
+
+
+def test_lazy_extension_threads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # registration is slow, so that all threads look up the extension while the module is being imported
+    (tmp_path / "binapy_slow_plugin_test.py").write_text(
+        "import time\n"
+        "from binapy import binapy_decoder, binapy_encoder\n"
+        "@binapy_encoder('slow')\n"
+        "def encode_slow(bp: bytes) -> bytes:\n"
+        "    return bp[::-1]\n"
+        "time.sleep(0.1)\n"
+        "@binapy_decoder('slow')\n"
+        "def decode_slow(bp: bytes) -> bytes:\n"
+        "    return bp[::-1]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(BinaPy, "extensions", dict(BinaPy.extensions))
+    monkeypatch.setattr(BinaPy, "lazy_extensions", {"slow": "binapy_slow_plugin_test"})
+    monkeypatch.setattr(BinaPy, "_entry_points_loaded", True)
+
+    barrier = threading.Barrier(8)
+    results: List[bytes] = []
+    errors: List[Exception] = []
+
+    def use_extension() -> None:
+        barrier.wait()
+        try:
+            results.append(BinaPy("abc").to("slow").decode_from("slow"))
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=use_extension) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert results == [b"abc"] * 8
+    assert not BinaPy.lazy_extensions
+
+
+def test_lazy_extension_direct_import(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # one thread imports the module directly while another one loads it lazily: this must not deadlock
+    (tmp_path / "binapy_direct_plugin_test.py").write_text(
+        "import time\n"
+        "from binapy import binapy_encoder\n"
+        "time.sleep(0.2)\n"
+        "@binapy_encoder('direct')\n"
+        "def encode_direct(bp: bytes) -> bytes:\n"
+        "    return bp[::-1]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(BinaPy, "extensions", dict(BinaPy.extensions))
+    monkeypatch.setattr(BinaPy, "lazy_extensions", {"direct": "binapy_direct_plugin_test"})
+    monkeypatch.setattr(BinaPy, "_entry_points_loaded", True)
+    monkeypatch.delitem(sys.modules, "binapy_direct_plugin_test", raising=False)
+
+    results: List[bytes] = []
+
+    def lazy_load() -> None:
+        time.sleep(0.05)  # let the other thread start importing first
+        results.append(BinaPy("abc").to("direct"))
+
+    threads = [
+        threading.Thread(target=importlib.import_module, args=("binapy_direct_plugin_test",), daemon=True),
+        threading.Thread(target=lazy_load, daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in threads)
+    assert results == [b"cba"]
+    assert not BinaPy.lazy_extensions
+
+
+def test_override_lazy_extension(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BinaPy, "extensions", {})
+    monkeypatch.setattr(BinaPy, "lazy_extensions", {"hex": "binapy.encoding.hex"})
+    monkeypatch.delitem(sys.modules, "binapy.encoding.hex", raising=False)
+
+    @binapy_encoder("hex")
+    def encode_hex_upper(bp: bytes) -> bytes:
+        return bp.hex().upper().encode()
+
+    assert BinaPy(b"\xab").to("hex") == b"AB"
+    assert BinaPy(b"AB").decode_from("hex") == b"\xab"
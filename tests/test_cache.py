@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from binapy import BinaPy, Cache, CacheStats, Metrics, binapy_encoder, binapy_parser
+
+
+def test_cache() -> None:
+    calls = []
+
+    @binapy_encoder("counted")
+    def encode_counted(bp: bytes, suffix: bytes | list[int] = b"") -> bytes:
+        calls.append(bp)
+        return bp + bytes(suffix)
+
+    cache = Cache(extensions={"counted", "json"})
+    with cache:
+        first = BinaPy("foo").to("counted")
+        second = BinaPy("foo").to("counted")
+        assert first == second == b"foo"
+        assert second is first  # immutable results are shared
+        assert BinaPy("foo").to("counted", suffix=b"bar") == b"foobar"
+        assert BinaPy("foo").to("counted", b"bar") == b"foobar"
+        assert len(calls) == 3
+        # unhashable parameters are not cached
+        assert BinaPy("foo").to("counted", [33]) == b"foo!"
+        assert BinaPy("foo").to("counted", [33]) == b"foo!"
+        assert len(calls) == 5
+
+        # mutable results are copied
+        parsed = BinaPy('{"foo": ["bar"]}').parse_from("json")
+        parsed["foo"].append("baz")
+        assert BinaPy('{"foo": ["bar"]}').parse_from("json") == {"foo": ["bar"]}
+
+        # extensions that are not enabled are not cached
+        BinaPy("foo").to("hex")
+
+    assert cache.stats() == CacheStats(hits=2, misses=4, evictions=0, entries=4, size=cache.stats().size)
+    BinaPy("foo").to("counted")
+    assert len(calls) == 6
+
+    cache.clear()
+    assert cache.stats() == CacheStats(0, 0, 0, 0, 0)
+
+
+def test_cache_bytearray() -> None:
+    @binapy_parser("mutable_bytes")
+    def parse_mutable_bytes(bp: bytes) -> bytearray:
+        return bytearray(bp)
+
+    with Cache(extensions={"mutable_bytes"}):
+        first = BinaPy("foo").parse_from("mutable_bytes")
+        first += b"bar"
+        second = BinaPy("foo").parse_from("mutable_bytes")
+        assert second == bytearray(b"foo")
+        assert isinstance(second, bytearray)
+        second[0] = 0
+        assert BinaPy("foo").parse_from("mutable_bytes") == bytearray(b"foo")
+
+
+def test_cache_key_types() -> None:
+    with Cache():
+        # 1, 1.0 and True are equal, but their serializations are not
+        assert BinaPy.serialize_to("json", 1) == b"1"
+        assert BinaPy.serialize_to("json", 1.0) == b"1.0"
+        assert BinaPy.serialize_to("json", True) == b"true"
+        assert BinaPy.serialize_to("json", (1, 2)) == b"[1,2]"
+        assert BinaPy.serialize_to("json", (True, 2)) == b"[true,2]"
+        assert BinaPy("foo").to("caesar", 1) == BinaPy("foo").to("caesar", True) == b"gpp"
+
+
+def test_cache_eviction() -> None:
+    cache = Cache(max_size=100)
+    with cache:
+        for i in range(10):
+            BinaPy(f"data{i}").to("sha256")
+        stats = cache.stats()
+        assert stats.size <= 100
+        assert stats.evictions == 10 - stats.entries
+        # least recently used entries were evicted
+        BinaPy("data9").to("sha256")
+        assert cache.stats().hits == 1
+        BinaPy("data0").to("sha256")
+        assert cache.stats().hits == 1
+
+        BinaPy(bytes(200)).to("sha256")  # too large to be cached
+        assert cache.stats().size <= 100
+
+
+def test_cache_with_observers() -> None:
+    with Cache() as cache, Metrics() as metrics:
+        BinaPy("foo").to("b64u")
+        BinaPy("foo").to("b64u")
+        with pytest.raises(ValueError):
+            BinaPy("!").decode_from("hex")
+    assert metrics.snapshot()["b64u", "encode"].calls == 2
+    assert cache.stats().hits == 1
+    assert not BinaPy._hooked
@@ -0,0 +1,87 @@
+import string
+
+import pytest
+
+from binapy import BinaPy, CharClass, binapy_checker
+from binapy.charclass import BASE64, HEX, is_ascii_compatible
+
+
+def test_charclass() -> None:
+    digits = CharClass(string.digits)
+    assert digits.match(b"0123456789")
+    assert digits.match(bytearray(b"42"))
+    assert digits.match(memoryview(b"42"))
+    assert digits.match(b"")
+    assert not digits.match(b"12a")
+    assert ord("1") in digits
+    assert ord("a") not in digits
+    assert len(digits) == 10
+    assert len(digits.table) == 256
+    assert digits | CharClass("abcdef") == CharClass(string.digits + "abcdef")
+    assert CharClass(b"ba") == CharClass([97, 98])
+    assert repr(CharClass("ba")) == "CharClass(b'ab')"
+    assert HEX.match(b"c0ffeeC0FFEE")
+    assert not HEX.match(b"coffee")
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    (
+        (b"", True),
+        (b"YWJj", True),
+        (b"YWI=", True),
+        (b"YQ==", True),
+        (b"YQ=", False),
+        (b"Y===", False),
+        (b"Y=Q=", False),
+        (b"YW J", False),
+        (b"YW-_", False),
+    ),
+)
+def test_is_b64(data: bytes, expected: bool) -> None:
+    assert BinaPy(data).check("b64") is expected
+
+
+def test_checkers() -> None:
+    assert BinaPy(b"YW-_").check("b64u")
+    assert BinaPy(b"YQ").check("b64u")
+    assert not BinaPy(b"Y=Q").check("b64u")
+    assert BinaPy(b"MFRGG===").check("b32")
+    assert not BinaPy(b"MFRGG==").check("b32")
+    assert not BinaPy(b"mfrgg===").check("b32")
+    # only 0, 1, 3, 4 or 6 padding chars are valid in Base32
+    assert not BinaPy(b"MFRGGZ==").check("b32")
+    assert not BinaPy(b"MFR=====").check("b32")
+    assert BinaPy(b"MFRGGZA=").check("b32")
+    assert BinaPy(b"MFRGG===").check("b32")
+    assert BinaPy(b"c0ffeeC0FFEE").check("hex")
+    assert not BinaPy(b"c0ffe").check("hex")
+    assert not BinaPy(b"").check("hex")
+
+
+def test_alphabets() -> None:
+    BinaPy.load_extensions()
+    assert BinaPy.alphabets["b64"] == BASE64
+    assert BinaPy.alphabets["hex"] == HEX
+
+    @binapy_checker("digits", alphabet=string.digits)
+    def is_digits(bp: bytes) -> bool:
+        return bp.isdigit()
+
+    assert BinaPy.alphabets["digits"] == CharClass(string.digits)
+    assert BinaPy("1234").check("digits")
+
+
+def test_text_helpers() -> None:
+    assert BinaPy("Hello, World!").text() == "Hello, World!"
+    assert BinaPy("Hello, World!").text("utf-8") == "Hello, World!"
+    assert BinaPy("Hello, World!", "utf-16").text("utf-16") == "Hello, World!"
+    with pytest.raises(ValueError):
+        BinaPy("Hello\n").text()
+    with pytest.raises(ValueError):
+        BinaPy("Hello\n", "utf-16").text("utf-16")
+    assert BinaPy("url-safe_chars.~").urlsafe() == "url-safe_chars.~"
+    assert BinaPy("abc123").alphanumeric() == "abc123"
+    assert not is_ascii_compatible("utf-16")
+    assert not is_ascii_compatible("cp500")
+    assert is_ascii_compatible("utf-8")
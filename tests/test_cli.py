@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import tracemalloc
+import zlib
+from pathlib import Path
+
+import pytest
+
+from binapy import BinaPy
+from binapy.cli import check_formats, main, make_codec, parse_size, transform
+
+
+def run(monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes], data: bytes, *argv: str) -> bytes:
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert main(argv) == 0
+    return capsysbinary.readouterr().out
+
+
+def test_cli(monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    data = BinaPy.random(100_000)
+    encoded = run(monkeypatch, capsysbinary, data, "zlib", "b64", "--chunk-size", "1K")
+    assert encoded == BinaPy(data).to("zlib").to("b64")
+    assert run(monkeypatch, capsysbinary, encoded, "decode:b64", "decode:zlib", "sha256") == data.to("sha256")
+    assert run(monkeypatch, capsysbinary, encoded, "-d", "b64", "zlib") == data
+    assert run(monkeypatch, capsysbinary, b"hello", "shake256(8)", "hex") == BinaPy("hello").to("shake256", 8).to("hex")
+    assert run(monkeypatch, capsysbinary, b"", "b64") == b""
+
+
+def test_cli_files(tmp_path: Path) -> None:
+    data = BinaPy.random(10_000)
+    source = tmp_path / "data"
+    source.write_bytes(data)
+    target = tmp_path / "data.hex"
+    assert main(["-i", str(source), "-o", str(target), "hex"]) == 0
+    assert target.read_bytes() == data.to("hex")
+
+
+def test_cli_check_and_list(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes], tmp_path: Path
+) -> None:
+    assert run(monkeypatch, capsysbinary, b"abcdef1234567890", "--check") == b"hex\nb64\nb64u\n"
+    source = tmp_path / "data"
+    source.write_bytes(b"abcdef1234567890")
+    assert main(["--check", "-i", str(source)]) == 0
+    assert capsysbinary.readouterr().out == b"hex\nb64\nb64u\n"
+    # large files are memory-mapped
+    encoded = BinaPy.random(200_000).to("b64")
+    source.write_bytes(encoded)
+    assert check_formats(str(source)) == encoded.check_all()
+    assert check_formats(str(source), decode=True) == encoded.check_all(decode=True)
+
+    listing = run(monkeypatch, capsysbinary, b"", "--list").decode().splitlines()
+    assert any(line.split()[0] == "b64" and "decode_stream" in line.split() for line in listing)
+
+
+def test_cli_check_memory(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes], tmp_path: Path
+) -> None:
+    size = 16 * 1024 * 1024
+    source = tmp_path / "large"
+    source.write_bytes(BinaPy.random(size))
+    # ignore the extensions registered by other tests, whose checkers need the data itself
+    BinaPy.load_extensions()
+    builtins = {
+        name: methods
+        for name, methods in BinaPy.extensions.items()
+        if not any(method.__module__.startswith("tests.") for method in methods.values())
+    }
+    monkeypatch.setattr(BinaPy, "extensions", builtins)
+
+    tracemalloc.start()
+    try:
+        assert main(["--check", "-i", str(source)]) == 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert capsysbinary.readouterr().out == b""
+    assert peak < size // 4
+
+
+def test_cli_errors(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    for argv in ([], ["not_an_extension"], ["b64("], ["parse:json"], ["--check", "b64"], ["shake256(1, 2, 3)"]):
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2  # noqa: PLR2004
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"not base64!")))
+    assert main(["decode:b64"]) == 1
+    assert "error" in capsys.readouterr().err
+
+
+def test_parse_size() -> None:
+    assert parse_size("16") == 16
+    assert parse_size("64K") == 64 * 1024
+    assert parse_size("1mb") == 1024 * 1024
+
+
+def test_cli_imports() -> None:
+    script = "import sys, binapy.cli; assert 'binapy.bench' not in sys.modules and 'tracemalloc' not in sys.modules"
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_transform() -> None:
+    # url has no streaming codec, so its whole input is buffered
+    codecs = [make_codec("b64"), make_codec("decode:b64"), make_codec("url"), make_codec("deflate"), make_codec("hex")]
+    chunks = list(transform(codecs, [b"foo ", b"bar/"] * 10))
+    assert b"".join(chunks) == BinaPy(b"foo bar/" * 10).to("url").to("deflate").to("hex")
+    assert zlib.decompress(bytes.fromhex(b"".join(chunks).decode()), -zlib.MAX_WBITS) == BinaPy(b"foo bar/" * 10).to("url")
+
+
+def test_main_module() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "binapy", "hex"], input=b"\x01\x02", capture_output=True, check=True
+    )
+    assert result.stdout == b"0102"
@@ -1,4 +1,10 @@
+import io
+import zlib
+
+import pytest
+
 from binapy import BinaPy
+from binapy.compression.zlib import ZlibDecompressor, adler32_combine
 
 
 def test_deflate() -> None:
@@ -27,3 +33,47 @@ def test_zlib() -> None:
     assert (
         BinaPy("78da2bc9c82c5600a2448592d4e2120026330516").decode_from("hex").decode_from("zlib") == b"this is a test"
     )
+
+
+@pytest.mark.parametrize("alg", ["zlib", "deflate"])
+def test_stream_compression(alg: str) -> None:
+    data = BinaPy("this is a test. " * 10000)
+    chunks = list(BinaPy.encode_stream(alg, io.BytesIO(data), chunk_size=1000))
+    assert all(isinstance(chunk, BinaPy) for chunk in chunks)
+    compressed = BinaPy(b"".join(chunks))
+    assert compressed.decode_from(alg) == data
+    assert b"".join(BinaPy.decode_stream(alg, compressed, chunk_size=10)) == data
+
+    with pytest.raises(zlib.error):
+        b"".join(BinaPy.decode_stream(alg, compressed[:-10]))
+
+
+def test_bounded_decompression() -> None:
+    data = b"\x00" * 1_000_000
+    decompressor = ZlibDecompressor()
+    pieces = list(decompressor.iter_update(zlib.compress(data), 4096))
+    assert all(len(piece) <= 4096 for piece in pieces)
+    assert b"".join(pieces) + decompressor.finalize() == data
+
+
+def test_adler32_combine() -> None:
+    data = BinaPy.random(1000)
+    for cut in (0, 1, 500, 1000):
+        combined = adler32_combine(zlib.adler32(data[:cut]), zlib.adler32(data[cut:]), len(data) - cut)
+        assert combined == zlib.adler32(data)
+
+
+@pytest.mark.parametrize("level", [-1, 0, 1, 5, 6, 9])
+@pytest.mark.parametrize("prime", [True, False])
+def test_parallel_compression(level: int, prime: bool) -> None:
+    data = BinaPy(b"".join(BinaPy.random(100) * 50 for _ in range(200)))
+    compressed = data.to("zlib", level, workers=4, block_size=20000, prime=prime)
+    assert compressed[:2] == data.to("zlib", level)[:2]
+    assert compressed.decode_from("zlib") == data
+    assert b"".join(BinaPy.decode_stream("zlib", compressed)) == data
+
+    compressed = data.to("deflate", level, workers=0, block_size=20000, prime=prime)
+    assert compressed.decode_from("deflate") == data
+
+    assert BinaPy().to("zlib", level, workers=4, block_size=10).decode_from("zlib") == b""
+    assert BinaPy(b"a").to("deflate", level, workers=4, block_size=1).decode_from("deflate") == b"a"
@@ -0,0 +1,107 @@
+import time
+
+from binapy import BinaPy, Candidate, binapy_checker, binapy_decoder
+from binapy.charclass import BASE64, HEX, CharClass
+from binapy.detection import ByteProfile, detect
+
+
+def test_byte_profile() -> None:
+    digits = CharClass("0123456789")
+    profile = ByteProfile(b"c0ffee", [HEX, BASE64, digits])
+    assert profile.length == 6
+    assert profile.allows(HEX)
+    assert profile.allows(BASE64)
+    assert not profile.allows(digits)
+    assert ByteProfile(b"", [HEX]).allows(HEX)
+    assert not ByteProfile(b"-", [HEX, BASE64]).allows(BASE64)
+
+
+def test_detect() -> None:
+    candidates = BinaPy("c0ffee12").detect()
+    assert all(isinstance(candidate, Candidate) for candidate in candidates)
+    assert [candidate.name for candidate in candidates] == ["hex", "b64", "b64u"]
+    assert candidates[0].confidence > candidates[1].confidence
+    assert candidates[0].method == "check"
+
+    assert BinaPy.random(32).detect()[0].name == "sha256"
+    assert BinaPy("c0ffee12").check_all() == ["hex", "b64", "b64u"]
+
+
+def test_detect_with_decode() -> None:
+    bp = BinaPy("Hello World").to("zlib")
+    candidates = bp.detect(decode=True)
+    assert Candidate("zlib", 0.5, "decode") in candidates
+    assert "zlib" in bp.check_all(decode=True)
+    assert "zlib" not in bp.check_all()
+    assert "zlib" not in [candidate.name for candidate in bp.detect(decode=True, max_decode_size=10)]
+
+
+def test_alphabet_pruning() -> None:
+    calls = []
+
+    @binapy_checker("only_digits", alphabet="0123456789")
+    def is_only_digits(bp: bytes) -> bool:
+        calls.append(bp)
+        return True
+
+    assert "only_digits" in BinaPy("1234").check_all()
+    assert "only_digits" not in BinaPy("12a4").check_all()
+    assert calls == [b"1234"]
+
+
+def test_detect_budget() -> None:
+    @binapy_decoder("slow")
+    def decode_slow(bp: bytes) -> bytes:
+        time.sleep(0.05)
+        return bp
+
+    assert "slow" in BinaPy("foo").check_all(decode=True)
+    assert "slow" not in [candidate.name for candidate in BinaPy("foo").detect(decode=True, budget=0)]
+
+
+def test_peel() -> None:
+    payload = {"foo": "bar" * 20, "x": [1, 2, 3]}
+    bp = BinaPy.serialize_to("json", payload).to("deflate").to("b64").to("url")
+    assert bp.peel() == (payload, ["url", "b64", "deflate", "json"])
+
+    assert BinaPy("hello world").to("zlib").to("hex").peel() == (b"hello world", ["hex", "zlib"])
+    # text that is not worth decoding is returned as-is
+    assert BinaPy("hello").peel() == (b"hello", [])
+    assert BinaPy("1234").peel() == (b"1234", [])
+
+    binary = BinaPy(b"\x00\x01\xff").to("b64")
+    assert binary.peel() == (binary, [])
+    assert binary.peel(binary=True) == (b"\x00\x01\xff", ["b64"])
+
+
+def test_peel_limits() -> None:
+    bp = BinaPy("hello world").to("zlib").to("hex")
+    assert bp.peel(max_depth=1) == (bp, [])
+    assert bp.peel(max_size=5) == (bp, [])
+    bomb = BinaPy(bytes(10_000_000)).to("zlib").to("b64")
+    assert bomb.peel(max_size=100_000, binary=True) == (bomb.decode_from("b64"), ["b64"])
+
+
+def test_peel_same_layer_at_different_depths() -> None:
+    payload = {"foo": "bar"}
+    inner = BinaPy.serialize_to("json", payload).to("zlib").to("zlib")
+
+    # "peel_long" reaches the inner layer through one more intermediate layer than "peel_short"
+    @binapy_decoder("peel_long")
+    def decode_long(bp: bytes) -> bytes:
+        if bp == b"outer":
+            return b"\x00middle"
+        if bp == b"\x00middle":
+            return inner
+        raise ValueError
+
+    @binapy_decoder("peel_short")
+    def decode_short(bp: bytes) -> bytes:
+        if bp == b"outer":
+            return inner
+        raise ValueError
+
+    extensions = ("peel_long", "peel_short", "zlib")
+    assert detect(BinaPy(b"outer"), decode=True, names=extensions)[0].name == "peel_long"
+    # the inner layer can't be peeled when reached through "peel_long", but it can be through "peel_short"
+    assert BinaPy(b"outer").peel(max_depth=3, extensions=extensions) == (payload, ["peel_short", "zlib", "zlib", "json"])
@@ -3,6 +3,7 @@ import string
 import pytest
 
 from binapy import BinaPy
+from binapy.encoding.xor import find_xor_keys
 
 
 @pytest.mark.parametrize("random", [BinaPy.random(length) for length in (40, 41, 42, 43)])
@@ -50,3 +51,69 @@ def test_caesar() -> None:
         assert BinaPy(data).to("caesar", 4).decode_from("caesar", 4) == data
 
     assert BinaPy(b"\x00\xff").to("caesar", 1) == b"\x01\x00"
+
+
+def test_caesar_alphabet_detection() -> None:
+    assert BinaPy(b"ABC").to("caesar", 1) == b"BCD"
+    assert BinaPy(b"xyz").to("caesar", 1) == b"yza"
+    assert BinaPy(b"xyZ").to("caesar", 1) == b"yza"
+    assert BinaPy(b"xyZ!").to("caesar", 1) == b"yz[\""
+    assert BinaPy(b"").to("caesar", 1) == b""
+    data = BinaPy.random(1000)
+    for shift in range(-300, 300, 7):
+        assert data.to("caesar", shift).decode_from("caesar", shift) == data
+
+
+def test_rot13_rot47_atbash() -> None:
+    assert BinaPy("Hello, World!").to("rot13") == b"Uryyb, Jbeyq!"
+    assert BinaPy("Uryyb, Jbeyq!").decode_from("rot13") == b"Hello, World!"
+    assert BinaPy("Hello, World!").to("rot47") == b"w6==@[ (@C=5P"
+    assert BinaPy("w6==@[ (@C=5P").decode_from("rot47") == b"Hello, World!"
+    assert BinaPy("Hello, World!").to("atbash") == b"Svool, Dliow!"
+    assert BinaPy("Svool, Dliow!").decode_from("atbash") == b"Hello, World!"
+
+
+def test_vigenere() -> None:
+    assert BinaPy("ATTACKATDAWN").to("vigenere", "LEMON") == b"LXFOPVEFRNHR"
+    assert BinaPy("LXFOPVEFRNHR").decode_from("vigenere", "lemon") == b"ATTACKATDAWN"
+    assert BinaPy("attack at dawn").to("vigenere", [1, 2]) == b"bvucdm cu ecxp"
+    data = BinaPy.random(1001)
+    assert data.to("vigenere", "Key").decode_from("vigenere", "Key") == data
+    with pytest.raises(ValueError):
+        BinaPy("foo").to("vigenere", "k3y")
+    with pytest.raises(ValueError):
+        BinaPy("foo").to("vigenere", [])
+
+
+def test_xor() -> None:
+    assert BinaPy(b"\x00\x01\xff").to("xor", 0xFF) == b"\xff\xfe\x00"
+    assert BinaPy(b"abcde").to("xor", b"\x01\x02") == b"``bfd"
+    assert BinaPy(b"").to("xor", "key") == b""
+    data = BinaPy.random(1001)
+    assert data.to("xor", "secret").decode_from("xor", "secret") == data
+    with pytest.raises(ValueError):
+        data.to("xor", b"")
+
+
+def test_find_xor_keys() -> None:
+    plaintext = BinaPy("Attack at dawn! The quick brown fox jumps over the lazy dog.")
+    for key in (0x00, 0x20, 0x42, 0xFF):
+        encrypted = plaintext.to("xor", key)
+        candidates = find_xor_keys(encrypted, top=3)
+        assert len(candidates) == 3
+        assert candidates[0][0] == key
+        assert encrypted.decode_from("xor", candidates[0][0]) == plaintext
+    assert len(find_xor_keys(b"")) == 256
+
+
+def test_xor_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    from binapy.encoding import xor
+
+    data = BinaPy("Attack at dawn! " * 20)
+    encrypted = data.to("xor", "secret")
+    candidates = find_xor_keys(encrypted[:100], top=5)
+    with monkeypatch.context() as m:
+        m.setattr(xor, "np", None)
+        assert data.to("xor", "secret") == encrypted
+        assert [key for key, _ in find_xor_keys(encrypted[:100], top=5)] == [key for key, _ in candidates]
@@ -1,4 +1,5 @@
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 import pytest
 
@@ -139,3 +140,59 @@ def test_invalid_shake_length() -> None:
 
     with pytest.raises(ValueError):
         BinaPy("foo").to("sshake128", 257, salt=b"salt")
+
+
+@pytest.mark.parametrize(
+    "alg, args, kwargs",
+    (
+        ("sha1", (), {}),
+        ("sha256", (), {}),
+        ("sha512", (), {}),
+        ("ssha256", (), {"salt": b"my_salt"}),
+        ("ssha384", (), {"salt": b"my_salt", "append": False}),
+        ("shake128", (256,), {}),
+        ("sshake256", (512,), {"salt": b"my_salt"}),
+        ("sshake256", (512,), {"salt": b"my_salt", "append": False}),
+    ),
+)
+def test_hash_stream(tmp_path: Path, alg: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+    data = BinaPy.random(10000)
+    expected = data.encode_to(alg, *args, **kwargs)
+    assert BinaPy.hash_stream(alg, data, *args, chunk_size=333, **kwargs) == expected
+    assert BinaPy.hash_stream(alg, [data[:5000], data[5000:]], *args, **kwargs) == expected
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert BinaPy.hash_stream(alg, path, *args, **kwargs) == expected
+    with path.open("rb") as f:
+        assert BinaPy.hash_stream(alg, f, *args, **kwargs) == expected
+
+
+def test_multi_hash(tmp_path: Path) -> None:
+    data = BinaPy.random(200000)
+    names = ["sha1", "sha256", "sha512", "shake256(512)", "ssha256(salt=b'my_salt')"]
+    expected = {
+        "sha1": data.to("sha1"),
+        "sha256": data.to("sha256"),
+        "sha512": data.to("sha512"),
+        "shake256(512)": data.to("shake256", 512),
+        "ssha256(salt=b'my_salt')": data.to("ssha256", salt=b"my_salt"),
+    }
+    assert BinaPy.multi_hash(names, data) == expected
+    assert BinaPy.multi_hash(names, iter([data[:1000], data[1000:]])) == expected
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert BinaPy.multi_hash(names, path, chunk_size=4096) == expected
+    with path.open("rb") as f:
+        assert BinaPy.multi_hash(names, f) == expected
+
+    # non-hash encoders produce output on each update
+    assert BinaPy.multi_hash(["b64", "hex", "sha256"], data[:10], chunk_size=4) == {
+        "b64": data[:10].to("b64"),
+        "hex": data[:10].to("hex"),
+        "sha256": data[:10].to("sha256"),
+    }
+
+    with pytest.raises(NotImplementedError):
+        BinaPy.multi_hash(["sha256", "url"], data)
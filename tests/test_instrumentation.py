@@ -0,0 +1,106 @@
+import math
+import time
+
+import pytest
+
+from binapy import BinaPy, ExtensionCall, Metrics, binapy_encoder
+
+
+def test_metrics() -> None:
+    metrics = Metrics()
+    with metrics:
+        bp = BinaPy("foobar").to("b64u")
+        bp.decode_from("b64u")
+        bp.check("b64u")
+        BinaPy.serialize_to("json", {"foo": "bar"}).parse_from("json")
+        with pytest.raises(ValueError):
+            BinaPy("!").decode_from("hex")
+    BinaPy("foo").to("b64u")  # not recorded anymore
+
+    snapshot = metrics.snapshot()
+    assert set(snapshot) == {
+        ("b64u", "encode"),
+        ("b64u", "decode"),
+        ("b64u", "check"),
+        ("json", "serialize"),
+        ("json", "parse"),
+        ("hex", "decode"),
+    }
+    encode = snapshot["b64u", "encode"]
+    assert encode.calls == 1
+    assert encode.errors == 0
+    assert encode.bytes_in == 6
+    assert encode.bytes_out == 8
+    assert encode.total_time > 0
+    assert sum(encode.histogram.values()) == 1
+    assert math.inf in encode.histogram
+
+    assert snapshot["b64u", "check"].bytes_out == 0
+    assert snapshot["json", "serialize"].bytes_in == 0
+    assert snapshot["json", "serialize"].bytes_out == 13
+    assert snapshot["hex", "decode"].errors == 1
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_slow_calls() -> None:
+    @binapy_encoder("slow_encoder")
+    def encode_slow(bp: bytes, delay: float) -> bytes:
+        time.sleep(delay)
+        return bp
+
+    slow_calls: list[ExtensionCall] = []
+    metrics = Metrics(buckets=(0.01, math.inf), slow_threshold=0.01, on_slow_call=slow_calls.append)
+    with metrics:
+        BinaPy("foo").to("slow_encoder", 0)
+        BinaPy("foo").to("slow_encoder", 0.02)
+
+    assert len(slow_calls) == 1
+    assert slow_calls[0].name == "slow_encoder"
+    assert slow_calls[0].feature == "encode"
+    assert slow_calls[0].duration >= 0.02
+    assert metrics.snapshot()["slow_encoder", "encode"].histogram == {0.01: 1, math.inf: 1}
+
+
+def test_observers() -> None:
+    calls: list[ExtensionCall] = []
+
+    class Recorder:
+        def observe(self, call: ExtensionCall) -> None:
+            calls.append(call)
+
+    recorder = Recorder()
+    BinaPy.add_observer(recorder)
+    BinaPy.add_observer(recorder)
+    try:
+        BinaPy("foo").to("hex")
+    finally:
+        BinaPy.remove_observer(recorder)
+    BinaPy("foo").to("hex")
+    assert len(calls) == 1
+    assert calls[0][:2] == ("hex", "encode")
+    assert calls[0].size_in == 3
+    assert calls[0].size_out == 6
+    assert calls[0].error is None
+
+
+def test_buckets() -> None:
+    metrics = Metrics(buckets=(0.01, 1.0))
+    assert metrics.buckets == (0.01, 1.0, math.inf)
+    with metrics:
+        BinaPy("foo").to("hex")
+    assert math.inf in metrics.snapshot()["hex", "encode"].histogram
+    with pytest.raises(ValueError):
+        Metrics(buckets=(1.0, 0.01))
+
+
+def test_failing_observers(caplog: pytest.LogCaptureFixture) -> None:
+    def fail(call: ExtensionCall) -> None:
+        raise RuntimeError(call.name)
+
+    with Metrics(slow_threshold=0, on_slow_call=fail):
+        assert BinaPy("foo").to("hex") == b"666f6f"
+        with pytest.raises(ValueError):
+            BinaPy("!").decode_from("hex")
+    assert len([record for record in caplog.records if record.name == "binapy.binapy"]) == 2
@@ -1,9 +1,16 @@
+import dataclasses
+import json
 import uuid
 from collections import UserDict
 from datetime import datetime, timedelta, timezone
-from typing import Iterable
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, List
+
+import pytest
 
 from binapy import BinaPy
+from binapy.parsing.json import get_json_backend, register_json_type, set_json_backend
 
 
 def test_json() -> None:
@@ -58,3 +65,105 @@ def test_compact() -> None:
 
     bp = BinaPy.serialize_to("json", {"a": "b", "c": "d"}, sort_keys=True, compact=False, indent=4)
     assert bp == b'{\n    "a": "b", \n    "c": "d"\n}'
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    pytest.importorskip(request.param)
+    previous = get_json_backend()
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous.name)
+
+
+def test_json_backends(json_backend: str) -> None:
+    assert get_json_backend().name == json_backend
+    data = {
+        "text": "\x01\n\t\x7f\"\\/é😀",
+        1: 2,
+        "float": 0.1,
+        "big": 2**70,
+        "iterable": (i for i in range(3)),
+        "iat": datetime(2020, 9, 13, 12, 26, 40, tzinfo=timezone.utc),
+    }
+    bp = BinaPy.serialize_to("json", data)
+    assert bp == (
+        b'{"text":"\\u0001\\n\\t\\u007f\\"\\\\/\\u00e9\\ud83d\\ude00","1":2,"float":0.1,"big":1180591620717411303424,'
+        b'"iterable":[0,1,2],"iat":1600000000}'
+    )
+    assert BinaPy.serialize_to("json", {"b": "é", "a": 1}, ensure_ascii=False, sort_keys=True) == '{"a":1,"b":"é"}'.encode()
+    assert BinaPy.serialize_to("json", {"a": 1}, compact=False) == b'{\n  "a": 1\n}'
+    floats = [1e16, 1e-7, 1.5e300, float("nan"), float("inf"), -float("inf"), None]
+    assert BinaPy.serialize_to("json", floats) == b"[1e+16,1e-07,1.5e+300,NaN,Infinity,-Infinity,null]"
+    # floats may also come from values converted by the default encoder
+    assert BinaPy.serialize_to("json", {"gen": (x for x in (0.5, 1e16)), "null": None}) == b'{"gen":[0.5,1e+16],"null":null}'
+    assert BinaPy.serialize_to("json", {1: 2, None: 3, 1.5: 4}) == b'{"1":2,"null":3,"1.5":4}'
+    with pytest.raises(TypeError):
+        BinaPy.serialize_to("json", {uuid.UUID("71509952-ec4f-4854-84e7-fa452994b51d"): 1})
+
+    assert bp.parse_from("json")["text"] == "\x01\n\t\x7f\"\\/é😀"
+    assert bp.parse_from("json")["big"] == 2**70
+    assert BinaPy('{"a": "é"}'.encode("utf-16")).parse_from("json") == {"a": "é"}
+    with pytest.raises(ValueError):
+        BinaPy("{").parse_from("json")
+
+
+def test_unknown_json_backend() -> None:
+    with pytest.raises(ImportError):
+        set_json_backend("not_a_json_library")
+
+
+def test_orjson_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    previous = get_json_backend()
+    set_json_backend("orjson")
+    try:
+        bp = BinaPy.serialize_to("json", {"foo": ["bar", 1]})
+        # make sure that the stdlib is not used as fallback
+        monkeypatch.setattr(json, "loads", None)
+        monkeypatch.setattr(json, "dumps", None)
+        assert bp.parse_from("json") == {"foo": ["bar", 1]}
+        assert BinaPy.serialize_to("json", {"foo": ["bar", 1]}) == bp
+        # null values, and strings that look like exponents, don't need the stdlib
+        data = {"null": None, "text": "annulled", "digest": "1e5a", "float": 0.5, "tuple": (1.5,)}
+        assert BinaPy.serialize_to("json", data) == b'{"null":null,"text":"annulled","digest":"1e5a","float":0.5,"tuple":[1.5]}'
+    finally:
+        set_json_backend(previous.name)
+
+
+def test_default_encoder_types(json_backend: str) -> None:
+    class Color(Enum):
+        RED = "red"
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int
+        color: Color
+        items: List[Any] = dataclasses.field(default_factory=list)
+
+    bp = BinaPy.serialize_to(
+        "json",
+        {
+            "point": Point(1, 2, Color.RED, [Decimal("1.10")]),
+            "bytes": b"\xfb\xff",
+            "binapy": BinaPy(b"\xfb\xff"),
+            "uuid": uuid.UUID("71509952-ec4f-4854-84e7-fa452994b51d"),
+        },
+    )
+    assert bp == (
+        b'{"point":{"x":1,"y":2,"color":"red","items":["1.10"]},"bytes":"-_8","binapy":"-_8",'
+        b'"uuid":"71509952-ec4f-4854-84e7-fa452994b51d"}'
+    )
+
+
+def test_register_json_type() -> None:
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    assert BinaPy.serialize_to("json", [Child()]).startswith(b'["<')
+    register_json_type(Base, lambda value: type(value).__name__)
+    assert BinaPy.serialize_to("json", [Child(), Base()]) == b'["Child","Base"]'
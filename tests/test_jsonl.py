@@ -0,0 +1,49 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from binapy import BinaPy
+from binapy.parsing.jsonl import iter_jsonl, to_jsonl, write_jsonl
+
+RECORDS = [{"id": i, "name": f"item{i}", "tags": ["a", "é"]} for i in range(100)]
+
+
+def test_jsonl() -> None:
+    bp = BinaPy.serialize_to("jsonl", RECORDS)
+    assert bp.count(b"\n") == 100
+    assert bp.startswith(b'{"id":0,"name":"item0","tags":["a","\\u00e9"]}\n')
+    assert list(bp.parse_from("jsonl")) == RECORDS
+    assert list(bp.parse_from("jsonl", chunk_size=7)) == RECORDS
+
+    assert list(BinaPy(b'\n{"a": 1}\r\n\n  \n[2]').parse_from("jsonl")) == [{"a": 1}, [2]]
+    assert list(BinaPy().parse_from("jsonl")) == []
+
+
+def test_jsonl_streams(tmp_path: Path) -> None:
+    chunks = list(iter_jsonl(RECORDS, chunk_size=256))
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert b"".join(chunks) == BinaPy.serialize_to("jsonl", RECORDS)
+    assert list(to_jsonl(chunks)) == RECORDS
+    # chunks that split records
+    assert list(to_jsonl(b"".join(chunks)[i : i + 5] for i in range(0, sum(map(len, chunks)), 5))) == RECORDS
+
+    path = tmp_path / "records.jsonl"
+    with path.open("wb") as f:
+        written = write_jsonl(iter(RECORDS), f)
+    assert path.read_bytes() == b"".join(chunks)
+    assert written == path.stat().st_size
+    with path.open("rb") as f:
+        assert list(to_jsonl(f, chunk_size=10)) == RECORDS
+    assert list(to_jsonl(path)) == RECORDS
+
+    out = io.BytesIO()
+    write_jsonl([{"b": 1, "a": 2}], out, sort_keys=True)
+    assert out.getvalue() == b'{"a":2,"b":1}\n'
+
+
+def test_jsonl_compact() -> None:
+    assert BinaPy.serialize_to("jsonl", [{"a": 1}], compact=True) == b'{"a":1}\n'
+    with pytest.raises(ValueError):
+        BinaPy.serialize_to("jsonl", [{"a": 1}], compact=False)
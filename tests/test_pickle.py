@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import io
+import pickle
 import secrets
 
+import pytest
+
 from binapy import BinaPy
+from binapy.parsing.pickle import write_pickle
 
 
 class PickleTester:
@@ -18,3 +23,53 @@ o = PickleTester()
 
 def test_pickle() -> None:
     assert BinaPy.serialize_to("pickle", o).parse_from("pickle") == o
+
+
+class Array:
+    """A minimal object that supports out-of-band pickling, like numpy arrays do."""
+
+    def __init__(self, data: bytes | memoryview) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: int) -> tuple[object, ...]:  # type: ignore[override]
+        if protocol >= 5:  # noqa: PLR2004
+            return Array, (pickle.PickleBuffer(self.data),)
+        return Array, (bytes(self.data),)
+
+
+def test_pickle_out_of_band() -> None:
+    data = secrets.token_bytes(1024)
+    value = {"arrays": [Array(data), Array(b"")], "tester": o}
+
+    bp = BinaPy.serialize_to("pickle", value, out_of_band=True)
+    assert bp.count(data) == 1
+
+    result = bp.parse_from("pickle", out_of_band=True)
+    assert result["tester"] == o
+    first, second = result["arrays"]
+    assert isinstance(first.data, memoryview)
+    assert first.data.obj is bp  # no copy
+    assert first.data == data
+    assert second.data == b""
+
+    file = io.BytesIO()
+    assert write_pickle(value, file) == len(bp)
+    assert file.getvalue() == bp
+
+    # without out-of-band buffers, this is a regular pickle stream in a frame
+    assert BinaPy.serialize_to("pickle", [1, 2], out_of_band=True).parse_from("pickle", out_of_band=True) == [1, 2]
+
+
+def test_pickle_out_of_band_errors() -> None:
+    with pytest.raises(ValueError):
+        BinaPy.serialize_to("pickle", o, out_of_band=True, protocol=4)
+    with pytest.raises(ValueError):
+        BinaPy.serialize_to("pickle", o, out_of_band=True, buffer_callback=print)
+
+    bp = BinaPy.serialize_to("pickle", Array(b"foo"), out_of_band=True)
+    with pytest.raises(ValueError):
+        bp[:-1].parse_from("pickle", out_of_band=True)
+    with pytest.raises(ValueError):
+        bp[:4].parse_from("pickle", out_of_band=True)
+    with pytest.raises(ValueError):
+        bp.parse_from("pickle", out_of_band=True, buffers=[])
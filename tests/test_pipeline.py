@@ -0,0 +1,98 @@
+from typing import Any, List
+
+import pytest
+
+from binapy import BinaPy, InvalidExtensionMethodError, Metrics, Pipeline, binapy_encoder
+
+TOKEN = b"q1bKSM3JyVeyUirPL8pJUaoFAA"
+
+
+def test_decode_pipeline() -> None:
+    pipeline = BinaPy.pipeline("b64u|deflate|json")
+    assert isinstance(pipeline, Pipeline)
+    assert repr(pipeline) == "Pipeline('decode:b64u|decode:deflate|parse:json')"
+    assert pipeline(TOKEN) == {"hello": "world"}
+    assert pipeline(BinaPy(TOKEN)) == {"hello": "world"}
+
+    binary = BinaPy.pipeline(["b64u", "deflate"])(TOKEN)
+    assert isinstance(binary, BinaPy)
+    assert binary == b'{"hello":"world"}'
+
+
+def test_encode_pipeline() -> None:
+    pipeline = BinaPy.pipeline("json|deflate(level=9)|b64u", feature="encode")
+    assert pipeline({"hello": "world"}) == TOKEN
+    pipeline = BinaPy.pipeline(["serialize:json", ("encode:deflate", {"level": 9}), "encode:b64u"])
+    assert pipeline({"hello": "world"}) == TOKEN
+
+    data = BinaPy(b"my_data")
+    pipeline = BinaPy.pipeline("url|sshake256(256, salt=b'my_salt')|hex", feature="encode")
+    result = pipeline(data)
+    assert isinstance(result, BinaPy)
+    assert result == data.to("url").to("sshake256", 256, salt=b"my_salt").to("hex")
+
+    pipeline = BinaPy.pipeline("sshake256(8, salt=b'a|b')|xor(b'|')", feature="encode")
+    assert pipeline(data) == data.to("sshake256", 8, salt=b"a|b").to("xor", b"|")
+
+
+def test_pipeline_is_observed() -> None:
+    with Metrics() as metrics:
+        BinaPy.pipeline("b64u|deflate|json")(TOKEN)
+        BinaPy.pipeline("json|b64u", feature="encode")({"hello": "world"})
+    assert {key: value.calls for key, value in metrics.snapshot().items()} == {
+        ("b64u", "decode"): 1,
+        ("deflate", "decode"): 1,
+        ("json", "parse"): 1,
+        ("json", "serialize"): 1,
+        ("b64u", "encode"): 1,
+    }
+
+
+def test_pipeline_does_not_copy() -> None:
+    produced = bytes(range(256)) * 16
+    received: List[Any] = []
+
+    @binapy_encoder("pipeline_produce")
+    def encode_produce(bp: bytes) -> bytes:
+        return produced
+
+    @binapy_encoder("pipeline_text")
+    def encode_text(bp: bytes) -> str:
+        received.append(bp)
+        return "text"
+
+    @binapy_encoder("pipeline_receive")
+    def encode_receive(bp: bytes) -> bytes:
+        received.append(bp)
+        return bp
+
+    result = BinaPy.pipeline("pipeline_produce|pipeline_text|pipeline_receive", feature="encode")(b"")
+    assert received == [produced, b"text"]
+    # intermediate results are not wrapped into a BinaPy, which would copy them
+    assert received[0] is produced
+    assert type(result) is BinaPy
+    assert result == b"text"
+
+
+def test_invalid_pipeline() -> None:
+    with pytest.raises(NotImplementedError):
+        BinaPy.pipeline("b64u|unknown")
+    with pytest.raises(NotImplementedError, match="does not have a decode method"):
+        BinaPy.pipeline("sha256|b64u")
+    with pytest.raises(ValueError, match="Invalid pipeline step"):
+        BinaPy.pipeline("b64u|deflate(level=")
+    with pytest.raises(ValueError, match="Invalid pipeline step"):
+        BinaPy.pipeline("b64u|deflate(level=x)")
+    with pytest.raises(ValueError, match="Invalid pipeline step"):
+        BinaPy.pipeline("b64u|deflate(**{'level': 9})")
+    with pytest.raises(ValueError, match="Invalid pipeline"):
+        BinaPy.pipeline("xor(b'|)")
+    with pytest.raises(ValueError):
+        BinaPy.pipeline([])
+
+    @binapy_encoder("not_binary")
+    def encode_not_binary(bp: bytes) -> bytes:
+        return 1  # type: ignore[return-value]
+
+    with pytest.raises(InvalidExtensionMethodError):
+        BinaPy.pipeline("not_binary|b64u", feature="encode")(b"foo")
@@ -0,0 +1,62 @@
+import io
+
+import pytest
+
+from binapy import BinaPy, BlockCodec, binapy_stream_encoder
+
+
+@pytest.mark.parametrize("encoding", ["b64", "b64u", "b32", "hex"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7, 1024])
+def test_stream_codecs(encoding: str, chunk_size: int) -> None:
+    data = BinaPy.random(301)
+    encoded = b"".join(BinaPy.encode_stream(encoding, data, chunk_size=chunk_size))
+    assert encoded == data.encode_to(encoding)
+    decoded = b"".join(BinaPy.decode_stream(encoding, encoded, chunk_size=chunk_size))
+    assert decoded == data
+
+
+def test_stream_sources(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data = BinaPy.random(1000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    expected = data.encode_to("b64")
+    assert b"".join(BinaPy.encode_stream("b64", path, chunk_size=100)) == expected
+    assert b"".join(BinaPy.encode_stream("b64", str(path), chunk_size=100)) == expected
+    assert b"".join(BinaPy.encode_stream("b64", io.BytesIO(data), chunk_size=100)) == expected
+    assert b"".join(BinaPy.encode_stream("b64", [data[:10], data[10:]])) == expected
+
+
+def test_stream_codec_objects() -> None:
+    encoder = BinaPy.stream_encoder("b64u")
+    assert encoder.update(b"\xff\xff") == b""
+    assert encoder.update(b"\xff\xff") == b"____"
+    assert encoder.finalize() == b"_w"
+
+    decoder = BinaPy.stream_decoder("b64", strict=False)
+    assert decoder.update(b"YW\nJj\nZA") == b"abc"
+    assert decoder.update(b"==\n") == b"d"
+    assert decoder.finalize() == b""
+
+
+def test_stream_invalid() -> None:
+    with pytest.raises(ValueError):
+        b"".join(BinaPy.decode_stream("b64", b"a$5!"))
+    # padding is only allowed at the very end, even across chunks
+    for encoding, data in (("b64", b"YQ==YQ=="), ("b64u", b"YQ==YQ=="), ("b32", b"ME======ME======")):
+        with pytest.raises(ValueError):
+            BinaPy(data).decode_from(encoding)
+        for chunk_size in (4, 8, 1024):
+            with pytest.raises(ValueError):
+                b"".join(BinaPy.decode_stream(encoding, data, chunk_size=chunk_size))
+    with pytest.raises(ValueError):
+        b"".join(BinaPy.decode_stream("hex", b"abc"))
+    with pytest.raises(NotImplementedError, match="does not have a streaming encoder"):
+        BinaPy.stream_encoder("url")
+
+
+def test_custom_stream_encoder() -> None:
+    @binapy_stream_encoder("upper")
+    def upper_stream() -> BlockCodec:
+        return BlockCodec(lambda data: bytes(data).upper(), 1)
+
+    assert b"".join(BinaPy.encode_stream("upper", [b"ab", b"c"])) == b"ABC"
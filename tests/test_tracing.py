@@ -0,0 +1,45 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from binapy import BinaPy, Tracer
+
+
+def test_tracer(tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+    with Tracer(path) as tracer:
+        with tracer.span("request", user="alice"):
+            BinaPy.serialize_to("json", {"foo": "bar"}).to("b64u").decode_from("b64u").parse_from("json")
+        thread = threading.Thread(target=lambda: BinaPy("foo").to("hex"), name="worker")
+        thread.start()
+        thread.join()
+        with pytest.raises(ValueError):
+            BinaPy("!").decode_from("hex")
+    BinaPy("foo").to("hex")  # not traced anymore
+
+    trace = json.loads(path.read_text())
+    assert trace == tracer.to_json()
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [span["name"] for span in spans] == [
+        "serialize:json",
+        "encode:b64u",
+        "decode:b64u",
+        "parse:json",
+        "request",
+        "encode:hex",
+        "decode:hex",
+    ]
+    request = spans[4]
+    assert request["args"] == {"user": "alice"}
+    for span in spans[:4]:
+        assert span["tid"] == request["tid"]
+        assert request["ts"] <= span["ts"]
+        assert span["ts"] + span["dur"] <= request["ts"] + request["dur"]
+    assert spans[1]["args"] == {"size_in": 13, "size_out": 18}
+    assert spans[5]["tid"] != request["tid"]
+    assert "error" in spans[6]["args"]
+
+    thread_names = {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+    assert "worker" in thread_names